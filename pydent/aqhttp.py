@@ -14,10 +14,16 @@ class.
 Users should only access these methods indirectly through a ``Session`` or
 ``SessionInterface`` instance.
 """
+import asyncio
 import json
+import threading
+from typing import Any
+from typing import Callable
 from typing import Dict
+from urllib.parse import urlencode
 
 import requests
+from requests.adapters import HTTPAdapter
 from retry import retry
 
 from pydent.exceptions import ForbiddenRequestError
@@ -28,13 +34,158 @@ from pydent.exceptions import TridentTimeoutError
 from pydent.utils import logger
 from pydent.utils import pprint_data
 from pydent.utils import url_build
-
+from pydent.utils.async_http import AsyncConnectionPool
 
 LOGIN_RETRY_DELAY = 1
 LOGIN_RETRY_BACKOFF = 1
 LOGIN_RETRY_MAX_DELAY = 2
 
 
+class AqTransport:
+    """Pooled, keep-alive HTTP transport.
+
+    Owns a single :class:`requests.Session` whose mounted
+    :class:`HTTPAdapter <requests.adapters.HTTPAdapter>` keeps a pool of open
+    connections, so consecutive requests to the same host reuse the same TCP
+    connection (and TLS session) instead of opening a new one each time.
+    Responses are requested gzip-compressed.
+
+    .. versionadded:: 1.0.7
+    """
+
+    POOL_CONNECTIONS = 10  #: default number of host pools to cache
+    POOL_MAXSIZE = 10  #: default number of connections kept open per host
+    DEFAULT_HEADERS = {"Accept-Encoding": "gzip, deflate", "Connection": "keep-alive"}
+
+    def __init__(
+        self,
+        pool_connections: int = None,
+        pool_maxsize: int = None,
+        max_retries: int = 0,
+        headers: Dict = None,
+    ):
+        """Initializes a new transport.
+
+        :param pool_connections: number of host connection pools to cache
+        :param pool_maxsize: maximum number of connections kept open per host
+        :param max_retries: number of retries for failed connections
+        :param headers: additional headers to send with every request
+        """
+        if pool_connections is None:
+            pool_connections = self.POOL_CONNECTIONS
+        if pool_maxsize is None:
+            pool_maxsize = self.POOL_MAXSIZE
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.max_retries = max_retries
+        self.headers = dict(self.DEFAULT_HEADERS)
+        if headers:
+            self.headers.update(headers)
+        self.session = self._new_session()
+
+    def _new_session(self) -> requests.Session:
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            max_retries=self.max_retries,
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        session.headers.update(self.headers)
+        return session
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Performs a http request using the pooled session."""
+        return self.session.request(method, url, **kwargs)
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        """Performs a http get request using the pooled session."""
+        return self.request("get", url, **kwargs)
+
+    def close(self):
+        """Closes all pooled connections."""
+        self.session.close()
+
+    def __repr__(self):
+        return "<{}(pool_connections={}, pool_maxsize={})>".format(
+            self.__class__.__name__, self.pool_connections, self.pool_maxsize
+        )
+
+
+class _Call:
+    """A call in flight of a :class:`SingleFlight`."""
+
+    __slots__ = ["done", "result", "error"]
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """Coalesces concurrent identical calls. While a call with a given key is
+    in flight, other threads making a call with the same key wait for it and
+    share its result (or its exception) instead of making the call again.
+
+    Calls only share calls made in the same generation. :meth:`invalidate`
+    starts a new generation, so that calls made afterwards (e.g. reads after
+    a write) never share a call that started before.
+
+    .. versionadded:: 1.0.7
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+        self.generation = 0  #: the generation of new calls
+        self.num_coalesced = 0  #: number of calls that shared another call
+
+    def invalidate(self):
+        """Starts a new generation of calls. Calls in flight are not shared
+        with calls made afterwards."""
+        with self._lock:
+            self.generation += 1
+
+    def do(self, key: str, fxn: Callable[[], Any]) -> Any:
+        """Calls `fxn` unless a call with the same key is in flight in the
+        current generation, in which case the result of that call is
+        returned.
+
+        :param key: key of the call
+        :param fxn: the call
+        :return: result of the call
+        """
+        with self._lock:
+            key = (self.generation, key)
+            call = self._calls.get(key, None)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+            else:
+                self.num_coalesced += 1
+        if leader:
+            try:
+                call.result = fxn()
+            except BaseException as e:
+                call.error = e
+                raise
+            finally:
+                with self._lock:
+                    del self._calls[key]
+                call.done.set()
+            return call.result
+        call.done.wait()
+        if call.error is not None:
+            raise call.error
+        return call.result
+
+    def __reduce__(self):
+        # calls in flight and locks are not copied
+        return self.__class__, ()
+
+
 class AqHTTP:
     """Defines a Python to Aquarium server connection. Makes HTTP requests to
     Aquarium and returns JSON.
@@ -47,23 +198,51 @@ class AqHTTP:
     """
 
     TIMEOUT = 10
+    POOL_SIZE = AqTransport.POOL_MAXSIZE
+    COALESCE_READS = True  #: whether identical concurrent reads share a request
 
-    def __init__(self, login: str, password: str, aquarium_url: str):
+    def __init__(
+        self, login: str, password: str, aquarium_url: str, pool_size: int = None
+    ):
         """Initializes an aquarium session with login, password, and server.
 
+        .. versionchanged:: 1.0.7
+            Requests are made through a pooled, keep-alive
+            :class:`AqTransport`. Added the `pool_size` argument.
+
         :param login: Aquarium login
         :type login: str
         :param aquarium_url: aquarium url to the server
         :type aquarium_url: str
+        :param pool_size: maximum number of connections to keep open
+            (default: AqHTTP.POOL_SIZE)
+        :type pool_size: int
         """
         self.login = login  #: the user login name
         self.aquarium_url = aquarium_url  #: the aquarium url
-        self._requests_session = None  #: the requests session
+        if pool_size is None:
+            pool_size = self.__class__.POOL_SIZE
+        self.transport = AqTransport(pool_maxsize=pool_size)  #: the http transport
         self.timeout = self.__class__.TIMEOUT  #: the timeout (s) for requests
         self._login(login, password)
         self.log = logger(name="AqHTTP@{}".format(aquarium_url))  #: the logger
         self._using_requests = True  #: if False, any HTTP requests will throw and error
         self.num_requests = 0  #: number of requests counter
+        #: if True, identical read requests in flight at the same time (from
+        #: different threads) share a single http request
+        self.coalesce_reads = self.__class__.COALESCE_READS
+        self.single_flight = SingleFlight()  #: the read requests in flight
+        self._async_http = None
+
+    @property
+    def async_http(self) -> "AsyncAqHTTP":
+        """The asyncio counterpart of this AqHTTP.
+
+        .. versionadded:: 1.0.7
+        """
+        if self._async_http is None or self._async_http.aqhttp is not self:
+            self._async_http = AsyncAqHTTP(self)
+        return self._async_http
 
     def on(self):
         """Turn on requests. When requests are off, this causes.
@@ -195,6 +374,11 @@ class AqHTTP:
 
     @staticmethod
     def _serialize_request(url: str, method: str, body: dict) -> str:
+        """Returns the normalized key of a request.
+
+        .. versionchanged:: 1.0.7
+            Used as the key of coalesced read requests.
+        """
         return json.dumps({"url": url, "method": method, "body": body}, sort_keys=True)
 
     @classmethod
@@ -219,10 +403,14 @@ class AqHTTP:
         path: str,
         timeout: int = None,
         allow_none: bool = True,
+        coalesce: bool = False,
         **kwargs,
     ) -> dict:
         """Performs a http request.
 
+        .. versionchanged:: 1.0.7
+            Added the `coalesce` argument.
+
         :param method: request method (e.g. 'put', 'post', 'get', etc.)
         :type method: str
         :param path: url to perform the request
@@ -233,6 +421,13 @@ class AqHTTP:
         :param allow_none: if False will raise error when json_data
                 contains a None or null value (default: True)
         :type allow_none: boolean
+        :param coalesce: if True, the request is a read that may share the
+                response of an identical request in flight (see
+                `coalesce_reads`). Requests that change data on the server
+                must never be coalesced. A request that is not coalesced
+                prevents reads made during or after it from sharing the
+                response of a read sent before it.
+        :type coalesce: boolean
         :param kwargs: additional arguments to post to request
         :type kwargs: dict
         :return: json
@@ -251,12 +446,32 @@ class AqHTTP:
         if not allow_none and "json" in kwargs:
             self._disallow_null_in_json(kwargs["json"])
 
-        self.num_requests += 1
-        response = requests.request(
-            method, url, timeout=timeout, cookies=self.cookies, **kwargs
-        )
-
-        self.log.info(self._format_response_info(response))
+        def send():
+            self.num_requests += 1
+            response = self.transport.request(
+                method, url, timeout=timeout, cookies=self.cookies, **kwargs
+            )
+            self.log.info(self._format_response_info(response))
+            return response
+
+        key = None
+        if coalesce and self.coalesce_reads:
+            try:
+                key = self._serialize_request(url, method, kwargs)
+            except TypeError:
+                pass
+        if key is None:
+            # reads made during or after this request must not share the
+            # response of a read sent before it
+            self.single_flight.invalidate()
+            try:
+                response = send()
+            finally:
+                self.single_flight.invalidate()
+        else:
+            response = self.single_flight.do(key, send)
+
+        # each caller decodes its own json, which models take ownership of
         self._dispatch_response(response)
         return self._response_to_json(response)
 
@@ -308,10 +523,14 @@ class AqHTTP:
         json_data: dict = None,
         timeout: int = None,
         allow_none: bool = True,
+        coalesce: bool = False,
         **kwargs,
     ) -> dict:
         """Make a post request to the session.
 
+        .. versionchanged:: 1.0.7
+            Added the `coalesce` argument (see :meth:`request`).
+
         :param path: url
         :type path: str
         :param json_data: json_data to post
@@ -322,6 +541,9 @@ class AqHTTP:
         :param allow_none: if False throw error if json_data contains a null
                 or None value (default True)
         :type allow_none: boolean
+        :param coalesce: if True, the request is a read that may share the
+                response of an identical request in flight
+        :type coalesce: boolean
         :param kwargs: additional arguments to post to request
         :type kwargs: dict
         :return: json
@@ -333,6 +555,7 @@ class AqHTTP:
             json=json_data,
             timeout=timeout,
             allow_none=allow_none,
+            coalesce=coalesce,
             **kwargs,
         )
 
@@ -402,3 +625,207 @@ class AqHTTP:
 
     def __str__(self):
         return self.__repr__()
+
+
+class AsyncAqHTTP:
+    """Asyncio counterpart of :class:`AqHTTP`. Makes non-blocking HTTP
+    requests to Aquarium and returns JSON.
+
+    Requests share the login cookies, timeout and on/off state of the
+    wrapped :class:`AqHTTP`, and the cookie jar, proxies and ssl settings of
+    its transport's :class:`requests.Session`. At most `max_in_flight` requests are sent at
+    once; additional requests wait on a semaphore, so hundreds of queries may
+    be awaited at once using a single thread and a bounded number of
+    connections.
+
+    .. code-block:: python
+
+        async def get_samples(session, ids):
+            return await asyncio.gather(*[session.Sample.find_async(i) for i in ids])
+
+    .. versionadded:: 1.0.7
+    """
+
+    MAX_IN_FLIGHT = 20  #: default maximum number of concurrent requests
+
+    def __init__(self, aqhttp: AqHTTP, max_in_flight: int = None):
+        """Initializes a new asyncio http connection.
+
+        :param aqhttp: the logged in AqHTTP instance
+        :type aqhttp: AqHTTP
+        :param max_in_flight: maximum number of concurrent requests
+        :type max_in_flight: int
+        """
+        if max_in_flight is None:
+            max_in_flight = self.__class__.MAX_IN_FLIGHT
+        self.aqhttp = aqhttp
+        self.max_in_flight = max_in_flight
+        self._loop = None
+        self._semaphore = None
+        self._pool = None
+
+    @property
+    def log(self):
+        return self.aqhttp.log
+
+    def _loop_state(self):
+        """Returns the semaphore and connection pool for the running event
+        loop.
+
+        Both are bound to an event loop, so they are recreated if the
+        event loop changes.
+        """
+        loop = asyncio.get_event_loop()
+        if loop is not self._loop:
+            self._loop = loop
+            self._semaphore = asyncio.Semaphore(self.max_in_flight)
+            self._pool = AsyncConnectionPool(
+                maxsize=self.max_in_flight,
+                headers=AqTransport.DEFAULT_HEADERS,
+                session=self.aqhttp.transport.session,
+            )
+        return self._semaphore, self._pool
+
+    def close(self):
+        """Closes all idle connections."""
+        if self._pool is not None:
+            self._pool.close()
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        timeout: int = None,
+        allow_none: bool = True,
+        idempotent: bool = None,
+        **kwargs,
+    ) -> dict:
+        """Performs a http request.
+
+        :param method: request method (e.g. 'put', 'post', 'get', etc.)
+        :type method: str
+        :param path: url to perform the request
+        :type path: str
+        :param timeout: time in seconds to process request before raising
+                exception
+        :type timeout: int
+        :param allow_none: if False will raise error when json_data
+                contains a None or null value (default: True)
+        :type allow_none: boolean
+        :param idempotent: whether the request may be resent if a kept-alive
+                connection was closed by the server. Defaults to whether the
+                method is idempotent, so posts are not resent unless they are
+                reads.
+        :type idempotent: boolean
+        :param kwargs: 'json' data and url 'params' of the request
+        :type kwargs: dict
+        :return: json
+        :rtype: dict
+        """
+        aqhttp = self.aqhttp
+        json_data = kwargs.pop("json", None)
+        params = kwargs.pop("params", None)
+        if kwargs:
+            raise TypeError(
+                "{} does not support the request arguments {}".format(
+                    self.__class__.__name__, ", ".join(kwargs)
+                )
+            )
+        url = url_build(aqhttp.aquarium_url, path)
+        if not aqhttp._using_requests:
+            raise ForbiddenRequestError(
+                "Attempted a request ({} {}) when requests have been turned OFF."
+                "\nDATA: {}".format(method.upper(), url, json_data)
+            )
+        if timeout is None:
+            timeout = aqhttp.timeout
+        if not allow_none and json_data is not None:
+            aqhttp._disallow_null_in_json(json_data)
+        if params:
+            url += "?" + urlencode(params)
+
+        headers = {}
+        body = None
+        if json_data is not None:
+            body = json.dumps(json_data).encode("utf-8")
+            headers["Content-Type"] = "application/json"
+
+        semaphore, pool = self._loop_state()
+        async with semaphore:
+            aqhttp.num_requests += 1
+            try:
+                response = await pool.request(
+                    method,
+                    url,
+                    headers=headers,
+                    body=body,
+                    timeout=timeout,
+                    idempotent=idempotent,
+                    cookies=aqhttp.cookies,
+                )
+            except asyncio.TimeoutError:
+                raise TridentTimeoutError(
+                    "Aquarium took longer than {}s to respond to {} {}. Use "
+                    "Session.set_timeout to increase the request timeout.".format(
+                        timeout, method.upper(), url
+                    )
+                )
+
+        self.log.info(aqhttp._format_response_info(response))
+        aqhttp._dispatch_response(response)
+        return aqhttp._response_to_json(response)
+
+    async def post(
+        self,
+        path: str,
+        json_data: dict = None,
+        timeout: int = None,
+        allow_none: bool = True,
+        **kwargs,
+    ) -> dict:
+        """Make a post request to the session. See :meth:`AqHTTP.post`"""
+        return await self.request(
+            "post",
+            path,
+            json=json_data,
+            timeout=timeout,
+            allow_none=allow_none,
+            **kwargs,
+        )
+
+    async def put(
+        self,
+        path: str,
+        json_data: dict = None,
+        timeout: int = None,
+        allow_none: bool = True,
+        **kwargs,
+    ) -> dict:
+        """Make a put request to the session. See :meth:`AqHTTP.put`"""
+        return await self.request(
+            "put",
+            path,
+            json=json_data,
+            timeout=timeout,
+            allow_none=allow_none,
+            **kwargs,
+        )
+
+    async def get(
+        self, path: str, timeout: int = None, allow_none: bool = True, **kwargs
+    ) -> dict:
+        """Make a get request to the session. See :meth:`AqHTTP.get`"""
+        return await self.request(
+            "get", path, timeout=timeout, allow_none=allow_none, **kwargs
+        )
+
+    async def delete(self, path: str, timeout: int = None, **kwargs) -> dict:
+        return await self.request("delete", path, timeout=timeout, **kwargs)
+
+    def __repr__(self):
+        return "<{}(user='{}', url='{}', max_in_flight={})>".format(
+            self.__class__.__name__,
+            self.aqhttp.login,
+            self.aqhttp.aquarium_url,
+            self.max_in_flight,
+        )
@@ -64,6 +64,7 @@ users.
 
     SessionABC
     AqHTTP
+    ModelInterfaceDescriptor
 
 Interfaces
 ^^^^^^^^^^
@@ -84,6 +85,7 @@ Aquarium models from the server.
     UtilityInterface
 
 """
+
 import inspect
 import timeit
 import webbrowser
@@ -102,6 +104,8 @@ from pydent.aql import aql_schema
 from pydent.base import ModelBase
 from pydent.base import ModelRegistry
 from pydent.browser import Browser
+from pydent.browser import PersistentCache
+from pydent.find_batch import FindBatch
 from pydent.interfaces import BrowserInterface
 from pydent.interfaces import QueryInterface
 from pydent.interfaces import QueryInterfaceABC
@@ -112,6 +116,26 @@ from pydent.models import __all__ as allmodels
 from pydent.sessionabc import SessionABC
 
 
+class ModelInterfaceDescriptor:
+    """Creates the model interface of a session (e.g. `session.Sample`) on
+    first access and caches it on the session.
+
+    .. versionadded:: 1.0.7
+    """
+
+    def __init__(self, model_name: str):
+        self.model_name = model_name
+
+    def __get__(self, session, owner):
+        if session is None:
+            return self
+        interface = session.interface_class(self.model_name, session._aqhttp, session)
+        # cached in the instance dictionary, which takes precedence over this
+        # non-data descriptor
+        session.__dict__[self.model_name] = interface
+        return interface
+
+
 class AqSession(SessionABC):
     """Holds an AqHTTP with login information. Creates SessionInterfaces for
     models.
@@ -130,9 +154,22 @@ class AqSession(SessionABC):
         aquarium_url: str,
         name: str = None,
         aqhttp: str = None,
+        persistent_cache: PersistentCache = None,
     ):
         """Initializes a new trident Session.
 
+        .. versionchanged:: 1.0.7
+            Added 'persistent_cache' argument. The browser of the session
+            (and of the sessions derived from it, such as
+            :meth:`with_cache`) uses it as the on-disk tier of its model
+            cache.
+
+        .. code-block:: python
+
+            cache = PersistentCache("~/.pydent/cache.sqlite", aquarium_url)
+            session = AqSession(login, password, aquarium_url,
+                                persistent_cache=cache)
+
         :param login: the Aquarium login for the user
         :type login: str
         :param password: the password for the Aquarium login. This will not be
@@ -144,6 +181,9 @@ class AqSession(SessionABC):
         :type aquarium_url: str
         :param name: (optional) name for this session
         :type name: str or None
+        :param persistent_cache: (optional) on-disk tier of the session's
+            model cache
+        :type persistent_cache: PersistentCache or None
         """
         self.name = name
         self._aqhttp = None  #: requests interface
@@ -161,6 +201,10 @@ class AqSession(SessionABC):
         self._initialize_interfaces()
         self._browser = None  #: the sessions browser
         self._using_cache = False
+        self._find_batch = None  #: the open find batch
+        self._uncached_browser = None  #: browser that does not cache models
+        #: the on-disk tier of the session's model cache
+        self.persistent_cache = persistent_cache
         self.init_cache()
         self.parent_session = (
             None  #: the parent session, if derived from another session
@@ -183,10 +227,16 @@ class AqSession(SessionABC):
         self._interface_class = c
 
     def _initialize_interfaces(self):
-        """Initializes the session's interfaces."""
-        # initialize model interfaces
+        """Initializes the session's interfaces.
+
+        .. versionchanged:: 1.0.7
+            Interfaces are created on first access (see
+            :class:`ModelInterfaceDescriptor`). This only drops the interfaces
+            already created, so that they are created again with the current
+            interface class.
+        """
         for model_name in allmodels:
-            self._register_interface(model_name)
+            self.__dict__.pop(model_name, None)
 
     def open(self):
         """Open Aquarium in a web browser window."""
@@ -303,8 +353,36 @@ class AqSession(SessionABC):
     def browser(self):
         return self._browser
 
-    def init_cache(self):
-        self._browser = Browser(self)
+    def init_cache(
+        self, parent: Browser = None, persistent_cache: PersistentCache = None
+    ):
+        """Initializes the session's browser.
+
+        .. versionchanged:: 1.0.7
+            Added 'parent' argument. If provided, the model cache of the
+            browser is layered over the model cache of the parent browser.
+            Added 'persistent_cache' argument. If provided, it replaces the
+            session's :attr:`persistent_cache`, the on-disk tier of the
+            browser's model cache.
+        """
+        if persistent_cache is not None:
+            self.persistent_cache = persistent_cache
+        if parent is None:
+            self._browser = Browser(self, persistent_cache=self.persistent_cache)
+        else:
+            self._browser = parent.derive(self)
+
+    def _get_uncached_browser(self) -> Browser:
+        """Returns a browser of the session that does not cache the models it
+        retrieves, for sessions that are not using their cache.
+
+        .. versionadded:: 1.0.7
+        """
+        if self._uncached_browser is None:
+            browser = Browser(self)
+            browser.use_cache = False
+            self._uncached_browser = browser
+        return self._uncached_browser
 
     def clear_cache(self):
         self.browser.clear()
@@ -339,7 +417,12 @@ class AqSession(SessionABC):
 
     def copy(self):
         instance = self.__class__(
-            None, None, None, self.name, aqhttp=copy(self._aqhttp)
+            None,
+            None,
+            None,
+            self.name,
+            aqhttp=copy(self._aqhttp),
+            persistent_cache=self.persistent_cache,
         )
         instance.using_requests = self.using_requests
         instance.using_cache = self.using_cache
@@ -351,15 +434,24 @@ class AqSession(SessionABC):
         using_models: bool = False,
         timeout: int = None,
         verbose=None,
+        commit: bool = True,
     ) -> "AqSession":
         """
 
+        .. versionchanged:: 1.0.7
+            The derived session reads the models of the current session's
+            model_cache through a layered cache rather than copying them.
+            Added 'commit' argument.
+
         :param using_requests: if False, ForbiddenRequest will be raised if \
             requests are made using the session.
         :param using_models: if True (default: False), derived session will \
             inherit the current sessions model_cache
         :param timeout: the requests timeout in seconds
         :param verbose: if True, verbose mode will be activated for the derived session
+        :param commit: if False, models cached by the derived session are \
+            discarded when the derived session exits, rather than merged into \
+            the current session's model_cache
         :return:
         """
         return self(
@@ -368,6 +460,7 @@ class AqSession(SessionABC):
             using_requests=using_requests,
             timeout=timeout,
             using_verbose=verbose,
+            commit=commit,
         )
 
     def with_requests_off(
@@ -385,15 +478,43 @@ class AqSession(SessionABC):
             using_verbose=verbose,
         )
 
+    def batch(self) -> FindBatch:
+        """Returns a find batch. Inside the batch's `with` block, finds made
+        with the `find_later` method of the session's interfaces are
+        collected and retrieved together, with one query per model, when the
+        block exits.
+
+        .. versionadded:: 1.0.7
+
+        .. code-block:: python
+
+            with session.batch():
+                futures = [session.Sample.find_later(i) for i in sample_ids]
+            samples = [f.result() for f in futures]
+
+        :return: the find batch
+        """
+        return FindBatch(self)
+
     @staticmethod
     def _swap_sessions(from_session, to_session):
-        """Moves models from one session to another."""
+        """Moves models from one session to another.
+
+        .. versionchanged:: 1.0.7
+            All of the models of the session are moved in constant time by
+            re-pointing their shared session handle, rather than setting the
+            session of each cached model. Cached models are not merged into
+            the cache of the other session if the browser's `commit_on_exit`
+            is False, and a layered browser is committed into its parent.
+        """
         if to_session:
-            models = from_session.browser.models
-            if to_session.browser:
-                to_session.browser.update_cache(models)
-            for m in models:
-                m._session = to_session
+            browser = from_session.browser
+            if browser is not None and browser.commit_on_exit:
+                if browser.parent is not None and browser.parent is to_session.browser:
+                    browser.commit()
+                elif to_session.browser:
+                    to_session.browser.update_cache(browser.models)
+            from_session._move_models(to_session)
 
     @classmethod
     def query_schema(cls) -> Dict:
@@ -476,18 +597,26 @@ class AqSession(SessionABC):
         using_models: bool = None,
         using_verbose: bool = None,
         session_swap: bool = False,
+        commit: bool = True,
     ) -> "AqSession":
         """Factory call for producing a new Session instance.
 
         .. versionchanges:: 0.1.5a7
             'session_swap` parameter added.
 
+        .. versionchanged:: 1.0.7
+            With 'using_models', the new session's browser is layered over
+            this session's browser rather than copying its models. Added
+            'commit' parameter.
+
         :param using_cache:
         :param using_requests:
         :param timeout:
         :param using_models:
         :param using_verbose:
         :param session_swap:
+        :param commit: if False, models cached by the new session are discarded
+            when it exits, rather than merged into this session's cache
         :return:
         """
         new_session = self.copy()
@@ -501,7 +630,8 @@ class AqSession(SessionABC):
         if session_swap:
             self._swap_sessions(self, new_session)
         elif using_models and self.browser:
-            new_session.browser.update_cache(self.browser.models)
+            new_session.init_cache(parent=self.browser)
+        new_session.browser.commit_on_exit = commit
         if using_verbose is not None:
             new_session.set_verbose(using_verbose)
         return new_session
@@ -517,3 +647,7 @@ class AqSession(SessionABC):
         return "<{}(name={}, AqHTTP={}), parent={})>".format(
             self.__class__.__name__, self.name, self._aqhttp, id(self.parent_session)
         )
+
+
+for _model_name in allmodels:
+    setattr(AqSession, _model_name, ModelInterfaceDescriptor(_model_name))
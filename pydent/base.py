@@ -49,6 +49,8 @@ from typing import Dict
 from typing import List
 from typing import Tuple
 from typing import Union
+from weakref import WeakKeyDictionary
+from weakref import WeakSet
 
 from inflection import tableize
 
@@ -57,12 +59,21 @@ from pydent.exceptions import NoSessionError
 from pydent.exceptions import SessionAlreadySet
 from pydent.interfaces import BrowserInterface
 from pydent.interfaces import QueryInterface
-from pydent.marshaller import fields
 from pydent.marshaller import ModelRegistry
 from pydent.marshaller import SchemaModel
 from pydent.sessionabc import SessionABC
+from pydent.sessionabc import SessionHandle
 from pydent.utils import url_build
 
+# models loaded together from the same query, keyed by model. Used to batch
+# the lazy loading of relationships (see :meth:`ModelBase.get_siblings`)
+_sibling_groups = WeakKeyDictionary()
+
+# the state left by `__init__()` of each model class, on which the rows of
+# `load_from` are loaded (see :meth:`ModelBase._get_load_template`)
+_load_templates = WeakKeyDictionary()
+_IMMUTABLE_TYPES = (type(None), bool, int, float, str)
+
 
 class ModelBase(SchemaModel):
     """Base class for Aquarium models. Subclass of.
@@ -113,6 +124,97 @@ class ModelBase(SchemaModel):
         ModelBase.__init__(instance, **data)
         return instance
 
+    @classmethod
+    def _get_load_template(cls, session: "SessionABC") -> Union[dict, None]:
+        """Returns the instance state left by `cls.__init__()`, which is the
+        same for every row loaded by :meth:`_set_data`. Returns None if the
+        model cannot be loaded from a template, for example if the state holds
+        mutable values that must not be shared between models.
+
+        .. versionadded:: 1.0.7
+        """
+        if cls in _load_templates:
+            return _load_templates[cls]
+        template = None
+        schema = cls.model_schema
+        if (
+            schema is not None
+            and schema.model_class is cls
+            and not any(hasattr(cls, k) for k in ["_session", "_rid", "raw"])
+        ):
+            instance = object.__new__(cls)
+            instance._session = cls._session_handle(session)
+            instance._rid = None
+            instance.raw = {}
+            try:
+                cls.__init__(instance)
+            except Exception:
+                instance = None
+            if instance is not None:
+                template = dict(instance.__dict__)
+                template["_session"] = None
+                values = [
+                    template.get(cls._data_key, {}),
+                    template.get(cls._deserialized_key, {}),
+                ]
+                values = list(itertools.chain(*[d.values() for d in values]))
+                values += [
+                    v
+                    for k, v in template.items()
+                    if k not in ["raw", cls._data_key, cls._deserialized_key]
+                ]
+                if not all(type(v) in _IMMUTABLE_TYPES for v in values):
+                    template = None
+        _load_templates[cls] = template
+        return template
+
+    @classmethod
+    def _set_data_many(cls, rows: List[dict], owner: "ModelBase") -> List["ModelBase"]:
+        """Same as calling :meth:`_set_data` for each row.
+
+        Rather than running `__init__` twice per row, each model is created
+        from a copy of the state left by `cls.__init__()` (see
+        :meth:`_get_load_template`) and the row is set in a single pass,
+        writing plain data keys directly to the serialized data. Models that
+        cannot be loaded from a template are loaded with :meth:`_set_data`.
+
+        .. versionadded:: 1.0.7
+        """
+        if not rows:
+            return []
+        session = owner.session
+        cls._check_session(session)
+        handle = cls._session_handle(session)
+        template = cls._get_load_template(session)
+        if template is None:
+            return [cls._set_data(data, owner) for data in rows]
+        data_key = cls._data_key
+        deserialized_key = cls._deserialized_key
+        # the serialized and deserialized data are set by `__init__()` unless
+        # it does not call `super().__init__()`
+        template_data = template.get(data_key, {})
+        template_deserialized = template.get(deserialized_key, {})
+        schema = cls.model_schema
+        load = schema.data_loader()
+        id_ignored = cls.PRIMARY_KEY in schema.ignore
+        counter = ModelBase.counter
+        models = []
+        for data in rows:
+            rid = next(counter)
+            state = dict(template)
+            state["_session"] = handle
+            state["_rid"] = rid
+            state["raw"] = data
+            state[data_key] = serialized = dict(template_data)
+            state[deserialized_key] = dict(template_deserialized)
+            instance = object.__new__(cls)
+            instance.__dict__ = state
+            load(instance, serialized, data)
+            model_id = None if id_ignored else data.get("id", None)
+            load(instance, serialized, {"rid": rid, "id": model_id})
+            models.append(instance)
+        return models
+
     @classmethod
     def get_server_model_name(cls):
         if cls.SERVER_MODEL_NAME is None:
@@ -191,18 +293,44 @@ class ModelBase(SchemaModel):
     ) -> Union[List["ModelBase"], "ModelBase"]:
         """Create a new model instance from loaded attributes.
 
+        .. versionchanged:: 1.0.7
+            Lists of rows are loaded with :meth:`_set_data_many`.
+
         'obj' should have a o
         """
         if isinstance(data, list):
-            models = []
-            for d in data:
-                model = cls._set_data(d, owner)
-                models.append(model)
+            models = cls._set_data_many(data, owner)
+            cls._set_siblings(models)
             return models
         else:
             model = cls._set_data(data, owner)
         return model
 
+    @staticmethod
+    def _set_siblings(models: List["ModelBase"]):
+        """Records the models as siblings, that is, models loaded from the
+        same query."""
+        if len(models) > 1:
+            siblings = WeakSet(models)
+            for model in models:
+                _sibling_groups[model] = siblings
+
+    def get_siblings(self) -> List["ModelBase"]:
+        """Returns the models that were loaded with this model from the same
+        query, including this model.
+
+        When an unloaded relationship of a model is accessed, the relationship
+        is loaded for all of its siblings using a single query.
+
+        .. versionadded:: 1.0.7
+
+        :return: list of sibling models
+        """
+        siblings = _sibling_groups.get(self)
+        if siblings is None:
+            return [self]
+        return list(siblings)
+
     # TODO: rename reload to something else, implement 'refresh' method and
     #       associated tests
     def reload(self, data: dict) -> "ModelBase":
@@ -233,19 +361,27 @@ class ModelBase(SchemaModel):
 
     @classmethod
     def get_relationships(cls):
-        grouped = cls._model_schema.grouped_fields
-        relationships = grouped[fields.Relationship.__name__]
-        alias = grouped[fields.Alias.__name__]
-        for aname, alias_field in alias.items():
-            aliased = relationships.get(alias_field.alias, None)
-            if aliased:
-                relationships[aname] = aliased
-        return relationships
+        """Returns the relationship fields of the model, keyed by name.
+
+        .. versionchanged:: 1.0.7
+            The relationships are memoized by the model schema. The returned
+            dictionary must not be modified.
+        """
+        return cls._model_schema.relationships
 
     @property
     def session(self):
-        """The connected session instance."""
-        return self._session
+        """The connected session instance.
+
+        .. versionchanged:: 1.0.7
+            The model refers to its session through the session's
+            :class:`SessionHandle <pydent.sessionabc.SessionHandle>`, so
+            that the models of a session can be moved in constant time.
+        """
+        handle = self._session
+        if handle is None:
+            return None
+        return handle.session
 
     @session.setter
     def session(self, new_session: "SessionABC"):
@@ -260,16 +396,26 @@ class ModelBase(SchemaModel):
         :raises SessionAlreadySet: if session is already set
         :raises NoSessionError: if session is not a SessionABC type
         """
+        self._check_session(new_session)
+        if self.session is not None:
+            raise SessionAlreadySet(
+                "Cannot set session. Model {} already has a session.".format(self)
+            )
+        self._session = self._session_handle(new_session)
+
+    @staticmethod
+    def _session_handle(session: "SessionABC") -> Union[SessionHandle, None]:
+        if session is None:
+            return None
+        return session._get_handle()
+
+    @staticmethod
+    def _check_session(new_session: "SessionABC"):
         if new_session is not None and not issubclass(type(new_session), SessionABC):
             raise NoSessionError(
                 "Cannot instantiate new model because its data parent "
                 "session is a type '{}', not a Session object".format(type(new_session))
             )
-        if self.session is not None:
-            raise SessionAlreadySet(
-                "Cannot set session. Model {} already has a session.".format(self)
-            )
-        self._session = new_session
 
     def connect_to_session(self, session: "SessionABC"):
         """Connect model to a session.
@@ -522,12 +668,14 @@ class ModelBase(SchemaModel):
         ignore: Union[str, List[str], Tuple[str], Dict[str, Any]] = None,
         include_model_type: bool = False,
         include_uri: bool = False,
+        memo: dict = None,
     ) -> dict:
         data = super()._dump(
             obj,
             only=only,
             include=include,
             ignore=ignore,
+            memo=memo,
             include_model_type=include_model_type,
             include_uri=include_uri,
         )
@@ -566,6 +714,40 @@ class ModelBase(SchemaModel):
             include_uri=include_uri,
         )
 
+    @classmethod
+    def dump_many(
+        cls,
+        models: List["ModelBase"],
+        only: Union[str, List[str], Tuple[str], Dict[str, Any]] = None,
+        include: Union[str, List[str], Tuple[str], Dict[str, Any]] = None,
+        ignore: Union[str, List[str], Tuple[str], Dict[str, Any]] = None,
+        include_model_type: bool = False,
+        include_uri: bool = False,
+    ) -> List[dict]:
+        """Dump (serialize) a list of Aquarium model instances to JSON. Same as
+        calling :meth:`dump` on each model, except that a model reached several
+        times with the same arguments is dumped only once, and its dump is
+        shared in the output.
+
+        .. versionadded:: 1.0.7
+
+        :param models: list of models
+        :param only: dump only the provided keys
+        :param include: include the provided nested dump keys
+        :param ignore: ignore the provided keys
+        :param include_model_type: if True, include the model class type for each entry using the `__model__` key
+        :param include_uri: if True, include a URI for each entry using the `__uri__` key
+        :return: list of serialized model instances
+        """
+        return super().dump_many(
+            models,
+            only=only,
+            include=include,
+            ignore=ignore,
+            include_model_type=include_model_type,
+            include_uri=include_uri,
+        )
+
     def _rid_dict(self):
         """Dictionary of all models attached to this model keyed by their
         rid."""
@@ -9,21 +9,35 @@ Browser (:mod:`pydent.browser`)
 
 Browser class for searching and cacheing results.
 """
+import asyncio
+import json
+import os
 import re
+import sqlite3
+import time
+from collections import ChainMap
 from collections import OrderedDict
+from collections.abc import MutableMapping
 from difflib import get_close_matches
 from pprint import pformat
 from typing import Callable
 from typing import Dict
 from typing import List
+from typing import Tuple
 from typing import Union
+from weakref import WeakValueDictionary
 
 import networkx as nx
 
 from pydent import models as pydent_models
 from pydent.base import ModelBase
+from pydent.cache_policies import CachePolicy
 from pydent.exceptions import ForbiddenRequestError
 from pydent.exceptions import TridentBaseException
+from pydent.exceptions import TridentRequestError
+from pydent.include_planner import IncludePlanner
+from pydent.include_planner import PlanNode
+from pydent.include_planner import RetrievePlan
 from pydent.interfaces import QueryInterface
 from pydent.interfaces import QueryInterfaceABC
 from pydent.marshaller import ModelRegistry
@@ -43,6 +57,302 @@ class BrowserException(TridentBaseException):
     """Generic browser exception."""
 
 
+class CacheIndex:
+    """Hash indexes of the cached models of a single model class.
+
+    Each index maps the value of an attribute to the models with that
+    value. Indexes are built the first time an attribute is queried and
+    are kept up to date as models are added to the cache. Attributes
+    with unhashable values (e.g. lists or dicts) are not indexed.
+
+    .. versionadded:: 1.0.7
+    """
+
+    def __init__(self):
+        self._indexes = {}  # attribute -> value -> id(model) -> model
+        self._unindexable = set()
+
+    @staticmethod
+    def _value(model, attr):
+        return model._get_data().get(attr, None)
+
+    def _index_model(self, index, attr, model):
+        index.setdefault(self._value(model, attr), {})[id(model)] = model
+
+    def build(self, attr: str, models: List[ModelBase]) -> Union[Dict, None]:
+        """Builds (or returns the existing) index for the attribute.
+
+        :return: the index or None if the attribute cannot be indexed
+        """
+        if attr in self._indexes:
+            return self._indexes[attr]
+        if attr in self._unindexable:
+            return None
+        index = {}
+        try:
+            for model in models:
+                self._index_model(index, attr, model)
+        except TypeError:
+            self._unindexable.add(attr)
+            return None
+        self._indexes[attr] = index
+        return index
+
+    def add(self, model: ModelBase):
+        """Adds the model to all existing indexes."""
+        for attr in list(self._indexes):
+            try:
+                self._index_model(self._indexes[attr], attr, model)
+            except TypeError:
+                self._unindexable.add(attr)
+                del self._indexes[attr]
+
+    def remove(self, model: ModelBase):
+        """Removes the model from all existing indexes."""
+        for attr, index in self._indexes.items():
+            try:
+                bucket = index.get(self._value(model, attr), {})
+            except TypeError:
+                continue
+            bucket.pop(id(model), None)
+
+    def candidates(
+        self, query: dict, models: List[ModelBase]
+    ) -> Union[List[ModelBase], None]:
+        """Returns the models whose indexed attributes match the equality and
+        `IN` (list) criteria in the query, by intersecting the index hits.
+
+        Candidates still need to be matched against the full query.
+
+        :param query: the query
+        :param models: all of the cached models, used to build new indexes
+        :return: list of candidate models or None if no attribute of the query
+            could be looked up in an index
+        """
+        found = None
+        for attr, query_val in query.items():
+            index = self.build(attr, models)
+            if index is None:
+                continue
+            if not isinstance(query_val, list):
+                query_val = [query_val]
+            hits = {}
+            try:
+                for val in query_val:
+                    hits.update(index.get(val, {}))
+            except TypeError:
+                continue
+            if found is None:
+                found = hits
+            else:
+                found = {k: v for k, v in found.items() if k in hits}
+            if not found:
+                break
+        if found is None:
+            return None
+        return list(found.values())
+
+
+class LayeredModelCache(MutableMapping):
+    """The model cache of a child :class:`Browser`, layered over the model
+    cache of its parent browser.
+
+    The models of each model class are returned as a
+    :class:`collections.ChainMap` of the child's own models over the
+    parent's models, so that reads go through to the parent and writes only
+    go to the child's own layer (copy-on-write). Creating a layered cache
+    does not copy the parent's models.
+
+    .. versionadded:: 1.0.7
+    """
+
+    def __init__(self, parent: "Browser"):
+        self.parent = parent  #: the parent browser
+        self.own = {}  #: the child's own models, by model class name and key
+
+    def __getitem__(self, modelname: str) -> ChainMap:
+        own = self.own.get(modelname, None)
+        parent = self.parent.model_cache.get(modelname, None)
+        if own is None and parent is None:
+            raise KeyError(modelname)
+        if own is None:
+            own = self.own[modelname] = {}
+        return ChainMap(own, {} if parent is None else parent)
+
+    def __setitem__(self, modelname: str, models: dict):
+        self.own[modelname] = models
+
+    def __delitem__(self, modelname: str):
+        del self.own[modelname]
+
+    def __iter__(self):
+        modelnames = dict.fromkeys(self.own)
+        modelnames.update(dict.fromkeys(self.parent.model_cache))
+        return iter(modelnames)
+
+    def __len__(self):
+        return len(list(iter(self)))
+
+
+class PersistentCache:
+    """An on-disk tier of the browser cache, shared across processes.
+
+    Raw model rows are stored in a SQLite database (in WAL mode, so that
+    many processes can read the database while another writes to it),
+    keyed by the Aquarium url, the model class name and the model id.
+    Rows older than `max_age` seconds are stale, and are revalidated
+    against the server's `updated_at` by the browser.
+
+    .. code-block:: python
+
+        cache = PersistentCache("~/.pydent/cache.sqlite", session.url)
+        browser = Browser(session, persistent_cache=cache)
+
+    .. versionadded:: 1.0.7
+    """
+
+    DEFAULT_MODELS = (
+        "AllowableFieldType",
+        "FieldType",
+        "ObjectType",
+        "OperationType",
+        "SampleType",
+    )
+    DEFAULT_MAX_AGE = 3600.0
+    TIMEOUT = 30.0
+
+    def __init__(
+        self,
+        path: str,
+        url: str,
+        models: List[str] = DEFAULT_MODELS,
+        max_age: float = DEFAULT_MAX_AGE,
+        timer: Callable[[], float] = time.time,
+    ):
+        """Initializes the cache.
+
+        :param path: path to the SQLite database
+        :param url: the Aquarium url the rows belong to
+        :param models: names of the model classes to store
+        :param max_age: seconds after which rows need to be revalidated
+        :param timer: function returning the current time in seconds
+        """
+        self.path = os.path.expanduser(path)
+        self.url = url
+        self.models = set(models)
+        self.max_age = max_age
+        self.timer = timer
+        self._connection = None
+        self._pid = None
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """The connection to the database (one per process)."""
+        if self._connection is None or self._pid != os.getpid():
+            connection = sqlite3.connect(self.path, timeout=self.TIMEOUT)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS models ("
+                "url TEXT, model TEXT, id INTEGER, updated_at TEXT, "
+                "cached_at REAL, data TEXT, PRIMARY KEY (url, model, id))"
+            )
+            connection.commit()
+            self._connection = connection
+            self._pid = os.getpid()
+        return self._connection
+
+    def stores(self, model: str) -> bool:
+        return model in self.models
+
+    def get(self, model: str, ids: List[int]) -> Tuple[Dict, Dict]:
+        """Returns the rows with the given ids.
+
+        :return: tuple of fresh rows and stale rows, each keyed by id
+        """
+        fresh, stale = {}, {}
+        expired = self.timer() - self.max_age
+        ids = list(ids)
+        for i in range(0, len(ids), 500):
+            chunk = ids[i : i + 500]
+            cursor = self.connection.execute(
+                "SELECT id, cached_at, data FROM models WHERE url = ? AND model = ? "
+                "AND id IN ({})".format(",".join("?" * len(chunk))),
+                [self.url, model] + chunk,
+            )
+            for mid, cached_at, data in cursor:
+                if cached_at > expired:
+                    fresh[mid] = json.loads(data)
+                else:
+                    stale[mid] = json.loads(data)
+        return fresh, stale
+
+    def rows(self, model: str) -> List[dict]:
+        """Returns all of the rows of a model class."""
+        cursor = self.connection.execute(
+            "SELECT data FROM models WHERE url = ? AND model = ?", [self.url, model]
+        )
+        return [json.loads(data) for data, in cursor]
+
+    def put(self, model: str, rows: List[dict]):
+        """Inserts or replaces rows."""
+        if not self.stores(model):
+            return
+        now = self.timer()
+        with self.connection as connection:
+            connection.executemany(
+                "INSERT OR REPLACE INTO models VALUES (?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        self.url,
+                        model,
+                        row["id"],
+                        row.get("updated_at", None),
+                        now,
+                        json.dumps(row),
+                    )
+                    for row in rows
+                    if row.get("id", None) is not None
+                ],
+            )
+
+    def put_models(self, model: str, models: List[ModelBase]):
+        """Inserts or replaces the rows of the models."""
+        if self.stores(model):
+            self.put(model, [m.dump(ignore="rid") for m in models])
+
+    def touch(self, model: str, ids: List[int]):
+        """Marks the rows with the given ids as fresh."""
+        with self.connection as connection:
+            connection.executemany(
+                "UPDATE models SET cached_at = ? WHERE url = ? AND model = ? "
+                "AND id = ?",
+                [(self.timer(), self.url, model, mid) for mid in ids],
+            )
+
+    def delete(self, model: str, ids: List[int]):
+        """Deletes the rows with the given ids."""
+        with self.connection as connection:
+            connection.executemany(
+                "DELETE FROM models WHERE url = ? AND model = ? AND id = ?",
+                [(self.url, model, mid) for mid in ids],
+            )
+
+    def clear(self):
+        """Deletes all of the rows of this cache's Aquarium url."""
+        with self.connection as connection:
+            connection.execute("DELETE FROM models WHERE url = ?", [self.url])
+
+    def close(self):
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def __repr__(self):
+        return "<{}(path={}, url={})>".format(
+            self.__class__.__name__, self.path, self.url
+        )
+
+
 class Browser(QueryInterfaceABC):
     """A class for browsing models and Aquarium inventory."""
 
@@ -56,28 +366,120 @@ class Browser(QueryInterfaceABC):
         "HasManyGeneric",
     ]
 
-    def __init__(self, session: SessionABC, inherit_models: bool = False):
+    def __init__(
+        self,
+        session: SessionABC,
+        inherit_models: bool = False,
+        cache_policies: List[CachePolicy] = None,
+        persistent_cache: PersistentCache = None,
+        include_planner: IncludePlanner = None,
+        parent: "Browser" = None,
+    ):
         """Instantiates a new browser from a AqSession instance.
 
         .. versionchanged:: 0.1.5a7
             'inherit_models' argument will inherit the sessions model_cache
             (default: False)
 
+        .. versionchanged:: 1.0.7
+            'cache_policies' argument bounds the size of the model_cache,
+            'persistent_cache' argument adds an on-disk cache tier and
+            'include_planner' argument pushes relation trees of `get` into
+            server side includes and 'parent' argument layers the model
+            cache over the model cache of a parent browser (see :meth:`derive`)
+
         :param session: a session instance
         :param inherit_models: if True, the browser will inherit the cache in the
             provided session's browser model_cache
+        :param cache_policies: optional list of eviction policies for the
+            model cache (see :mod:`pydent.cache_policies`)
+        :param persistent_cache: optional on-disk tier of the model cache
+        :param include_planner: optional planner of the relation trees of
+            `get` (see :mod:`pydent.include_planner`)
+        :param parent: optional parent browser whose models are read through
+            the model cache of this browser
         :type session: SessionABC
         """
         self.session = session
+        self.parent = parent  #: the parent browser of a layered model cache
+        #: whether the cached models are merged into the cache of the parent
+        #: session when a derived session exits
+        self.commit_on_exit = True
         self._list_models_fxn = self.sample_list
         self.use_cache = True
         self.model = Sample
         self.model_list_cache = {}
-        self.model_cache = {}
+        self.model_cache = self._new_model_cache()
+        self.model_index = {}
+        self._completed_queries = {}
+        self.cache_policies = list(cache_policies or [])
+        self._evicted_models = {}
+        self.persistent_cache = persistent_cache
+        self.include_planner = include_planner
+        self.last_plan = None  #: the plan of the last planned `get`
         self.log = logger(name="Browser@{}".format(session.url))
         if session.browser and inherit_models:
             self.update_cache(session.browser.models)
 
+    def _new_model_cache(self) -> Union[dict, LayeredModelCache]:
+        if self.parent is None:
+            return {}
+        return LayeredModelCache(self.parent)
+
+    def _own_model_cache(self) -> dict:
+        """The models cached by this browser, excluding the models read
+        through from the parent browser."""
+        if self.parent is None:
+            return self.model_cache
+        return self.model_cache.own
+
+    def derive(self, session: SessionABC = None) -> "Browser":
+        """Returns a child browser whose model cache is layered over the model
+        cache of this browser. The child reads models through to this
+        browser's cache and caches new models in its own layer, which can be
+        merged into this browser (:meth:`commit`) or dropped
+        (:meth:`discard`). Deriving a browser does not copy any models.
+
+        .. versionadded:: 1.0.7
+
+        :param session: session of the child browser (default: the session of
+            this browser)
+        :return: the child browser
+        """
+        return self.__class__(
+            session or self.session,
+            persistent_cache=self.persistent_cache,
+            include_planner=self.include_planner,
+            parent=self,
+        )
+
+    def commit(self):
+        """Merges the models cached by this child browser into the parent
+        browser and clears the child's own layer.
+
+        .. versionadded:: 1.0.7
+
+        :raises BrowserException: if the browser has no parent
+        """
+        if self.parent is None:
+            raise BrowserException("Cannot commit a browser without a parent.")
+        for modelname, queries in self._completed_queries.items():
+            self.parent._completed_queries.setdefault(modelname, set()).update(queries)
+        for modelname, models in self._own_model_cache().items():
+            if models:
+                self.parent._update_model_cache_helper(
+                    modelname, dict(models), persist=False
+                )
+        self.clear()
+
+    def discard(self):
+        """Drops the models cached by this child browser. The parent browser
+        is not changed.
+
+        .. versionadded:: 1.0.7
+        """
+        self.clear()
+
     @property
     def model_name(self):
         return self.model.__name__
@@ -130,7 +532,71 @@ class Browser(QueryInterfaceABC):
     def clear(self):
         """Clears the model cache."""
         self.model_list_cache = {}
-        self.model_cache = {}
+        self.model_cache = self._new_model_cache()
+        self.model_index = {}
+        self._completed_queries = {}
+        self._evicted_models = {}
+        for policy in self.cache_policies:
+            policy.clear()
+
+    def set_cache_policies(self, policies: List[CachePolicy]):
+        """Sets the eviction policies of the model cache and evicts models
+        from the cache as necessary.
+
+        .. versionadded:: 1.0.7
+
+        :param policies: list of eviction policies
+        """
+        self.cache_policies = list(policies)
+        for modelname, model_cache_dict in self._own_model_cache().items():
+            for mid, model in model_cache_dict.items():
+                for policy in self.cache_policies:
+                    policy.add((modelname, mid), model)
+        self._evict()
+
+    def _evict(self) -> int:
+        """Evicts models from the model cache according to the cache
+        policies.
+
+        Models evicted to bound the size of the cache are held by weak
+        reference, so models still referenced elsewhere are returned to the
+        cache (rather than duplicated) if they are found again. Expiring
+        policies keep tracking these models, and expired models are dropped
+        rather than held.
+
+        .. versionchanged:: 1.0.7
+            Expired models are no longer held by weak reference.
+
+        :return: number of evicted models
+        """
+        evicted = set()
+        expired = set()
+        for policy in self.cache_policies:
+            keys = policy.evict()
+            evicted.update(keys)
+            if policy.expires:
+                expired.update(keys)
+        if not evicted:
+            return 0
+        for key in evicted:
+            modelname, mid = key
+            is_expired = key in expired
+            for policy in self.cache_policies:
+                if is_expired or not policy.expires:
+                    policy.remove(key)
+            model = self._own_model_cache().get(modelname, {}).pop(mid, None)
+            if model is not None:
+                self.model_index[modelname].remove(model)
+            if is_expired:
+                self._evicted_models.get(modelname, {}).pop(mid, None)
+            elif model is not None:
+                self._evicted_models.setdefault(modelname, WeakValueDictionary())[
+                    mid
+                ] = model
+            # queries answered by the cache may now be incomplete
+            self._completed_queries.pop(modelname, None)
+        self.log.info("CACHE evicted {} models".format(len(evicted)))
+        return len(evicted)
 
     def list_models(self, *args, **kwargs):
         def get_models():
@@ -193,6 +659,36 @@ class Browser(QueryInterfaceABC):
                 page_size=page_size,
             )
 
+    async def where_async(
+        self,
+        query,
+        model_class=None,
+        primary_key="id",
+        methods=None,
+        opts: Dict = None,
+        page_size: int = None,
+        include: Dict = None,
+    ):
+        """Perform a 'where' query. Asyncio version of :meth:`where`.
+
+        .. versionadded:: 1.0.7
+        """
+        if model_class is None:
+            model_class = self.model_name
+        if self.use_cache and not methods and page_size is None:
+            return await self.cached_where_async(
+                query,
+                model_class,
+                primary_key=primary_key,
+                include=include,
+                methods=methods,
+                opts=opts,
+            )
+        else:
+            return await self.interface(model_class).where_async(
+                query, opts=opts, methods=methods, include=include, page_size=page_size
+            )
+
     def __query_helper(
         self,
         fname,
@@ -316,6 +812,17 @@ class Browser(QueryInterfaceABC):
             return self.cached_find(model_class, model_id)
         return self.interface(model_class).find(model_id)
 
+    async def find_async(self, model_id, model_class=None):
+        """Finds a model by id. Asyncio version of :meth:`find`.
+
+        .. versionadded:: 1.0.7
+        """
+        if model_class is None:
+            model_class = self.model_name
+        if self.use_cache:
+            return await self.cached_find_async(model_class, model_id)
+        return await self.interface(model_class).find_async(model_id)
+
     def find_by_name(self, name, model_class=None, primary_key="id"):
         """Find model by name. Will return cached model if possible.
 
@@ -342,6 +849,29 @@ class Browser(QueryInterfaceABC):
         """
         return self.__query_helper("all", query={}, model_class=model_class, opts=opts)
 
+    async def one_async(self, model_class=None, query=None, opts=None):
+        """Finds one instance of a model (or returns None). Asyncio version of
+        :meth:`one`.
+
+        .. versionadded:: 1.0.7
+        """
+        if model_class is None:
+            model_class = self.model_name
+        model = await self.interface(model_class).one_async(query=query, opts=opts)
+        if model is None:
+            return None
+        return self.update_cache([model])[model_class][0]
+
+    async def all_async(self, model_class=None, opts=None):
+        """Return all models of a model_class. Asyncio version of :meth:`all`.
+
+        .. versionadded:: 1.0.7
+        """
+        if model_class is None:
+            model_class = self.model_name
+        models = await self.interface(model_class).all_async(opts=opts)
+        return self.update_cache(models).get(model_class, [])
+
     @staticmethod
     def _match_query(query, model_dict):
         """Matches a query against a model dictionary.
@@ -366,7 +896,23 @@ class Browser(QueryInterfaceABC):
         return {k: model_dict[k] for k in query}
 
     @classmethod
-    def _find_matches(cls, query, models):
+    def _find_matches(cls, query, models, index: CacheIndex = None):
+        """Finds the models that match the query.
+
+        .. versionchanged:: 1.0.7
+            Added the 'index' argument. If provided, only models found using
+            the index are matched against the query.
+
+        :param query: query dictionary
+        :param models: list of models
+        :param index: optional index of the models
+        :return: tuple of the list of matching models and the list of the
+            matched values
+        """
+        if index is not None:
+            candidates = index.candidates(query, models)
+            if candidates is not None:
+                models = candidates
         found = []
         found_queries = []
         for m in models:
@@ -404,30 +950,72 @@ class Browser(QueryInterfaceABC):
             ModelBase._flatten_deserialized_data(models, memo)
             models = list(memo.values())
         if update_session:
+            handle = ModelBase._session_handle(self.session)
             for m in models:
-                m._session = self.session
+                m._session = handle
         return self._group_models_and_update_cache(models)
 
     # TODO: do we really want to simply overwrite the dictionary or update the models?
     def _update_model_cache_helper(
-        self, modelname: str, modeldict: Dict
+        self, modelname: str, modeldict: Dict, persist: bool = True
     ) -> List[ModelBase]:
         """Updates the browser's model cache with models from the provided
-        model dict."""
+        model dict.
+
+        .. versionchanged:: 1.0.7
+            New and updated models are written to the persistent cache
+            unless 'persist' is False.
+        """
         self.log.info(
             "CACHE updated cached with {} {} models".format(len(modeldict), modelname)
         )
         self.model_cache.setdefault(modelname, {})
+        index = self.model_index.setdefault(modelname, CacheIndex())
 
         model_cache_dict = self.model_cache[modelname]
+        own_cache_dict = self._own_model_cache()[modelname]
+        evicted_models = self._evicted_models.get(modelname, {})
+        updated = []
         for mid in modeldict:
             model = modeldict[mid]
+            restored = False
+            if mid not in model_cache_dict and mid in evicted_models:
+                # restore an evicted model that is still referenced
+                evicted_model = evicted_models.pop(mid)
+                restored = evicted_model is model
+                if not restored:
+                    vars(evicted_model).update(vars(model))
+                model = evicted_model
             if mid in model_cache_dict:
                 cached_model = model_cache_dict[mid]
-                vars(cached_model).update(vars(model))
+                if cached_model is model:
+                    # the model was found in the cache
+                    for policy in self.cache_policies:
+                        policy.access((modelname, mid))
+                    continue
+                if mid in own_cache_dict:
+                    index.remove(cached_model)
+                    vars(cached_model).update(vars(model))
+                    index.add(cached_model)
+                else:
+                    # copy-on-write: shadow the model of the parent browser
+                    # rather than changing it
+                    cached_model = own_cache_dict[mid] = model
+                    index.add(model)
             else:
-                model_cache_dict[mid] = model
-        return [model_cache_dict[mid] for mid in modeldict]
+                cached_model = own_cache_dict[mid] = model
+                index.add(model)
+            for policy in self.cache_policies:
+                # a model restored without new data keeps its expiry time
+                if not (restored and policy.expires):
+                    policy.add((modelname, mid), cached_model)
+            updated.append(cached_model)
+        if persist and updated and self._persists(modelname):
+            self.persistent_cache.put_models(modelname, updated)
+        returned = [model_cache_dict[mid] for mid in modeldict]
+        if self.cache_policies:
+            self._evict()
+        return returned
 
     def _group_models_and_update_cache(self, models):
         grouped_by_type = {}
@@ -448,14 +1036,40 @@ class Browser(QueryInterfaceABC):
     def cached_find(self, model_class, id):
         if isinstance(id, list):
             return self.cached_where({"id": id}, model_class)
+        found_model = self._cached_find_lookup(model_class, id)
+        if found_model is None and self._persists(model_class):
+            found = self.cached_where({"id": [id]}, model_class)
+            return found[0] if found else None
+        if found_model is None:
+            found_model = self.interface(model_class).find(id)
+        return self._cached_find_update(model_class, found_model)
+
+    async def cached_find_async(self, model_class, id):
+        """Asyncio version of :meth:`cached_find`."""
+        if isinstance(id, list):
+            return await self.cached_where_async({"id": id}, model_class)
+        found_model = self._cached_find_lookup(model_class, id)
+        if found_model is None and self._persists(model_class):
+            found = await self.cached_where_async({"id": [id]}, model_class)
+            return found[0] if found else None
+        if found_model is None:
+            found_model = await self.interface(model_class).find_async(id)
+        return self._cached_find_update(model_class, found_model)
+
+    def _cached_find_lookup(self, model_class, id):
+        if self.cache_policies:
+            self._evict()
         cached_models = self.model_cache.get(model_class, {})
         found_model = cached_models.get(id, None)
         if found_model is None:
-            found_model = self.interface(model_class).find(id)
-        else:
+            found_model = self._evicted_models.get(model_class, {}).get(id, None)
+        if found_model is not None:
             self.log.info(
                 "CACHE found {} model with id={} in cache".format(model_class, id)
             )
+        return found_model
+
+    def _cached_find_update(self, model_class, found_model):
         if found_model is None:
             return None
         return self._update_model_cache_helper(
@@ -489,33 +1103,256 @@ class Browser(QueryInterfaceABC):
         elif [] in query.values():
             return []
         else:
-            cached_models = self.model_cache.get(model, {})
-            found, found_queries = self._find_matches(
-                query, list(cached_models.values())
+            found_dict, remaining_query = self._cached_where_lookup(
+                query, model, primary_key
             )
-            found_dict = {f.id: f for f in found}
-
-            # TODO: this code is broken, remaining query
-            remaining_query = dict(query)
-            if primary_key in query:
-                found_ids = [q[primary_key] for q in found_queries]
-                query_id_list = query[primary_key]
-                if isinstance(query_id_list, str) or isinstance(query_id_list, int):
-                    query_id_list = [query_id_list]
-                remaining_ids = list(set(query_id_list).difference(set(found_ids)))
-                remaining_query[primary_key] = remaining_ids
-            self.log.info(
-                "CACHE found {num} {model} models in cache using query {query}".format(
-                    num=len(found_dict), model=model, query=self.log.pprint_data(query)
-                )
+            if remaining_query is None:
+                return list(found_dict.values())
+            fresh, stale, remaining_query = self._persistent_lookup(
+                model, remaining_query, primary_key
             )
+            if fresh or stale:
+                revalidated = []
+                if stale:
+                    revalidated = self.interface(model).where({"id": list(stale)})
+                found_dict.update(
+                    self._load_persisted(model, fresh, stale, revalidated)
+                )
+            if remaining_query is None:
+                return self._cached_where_update(model, [], found_dict, opts)
+            server_models = self.interface(model).where(remaining_query, opts=opts)
+            self._record_completed_query(remaining_query, model, primary_key, opts)
+        return self._cached_where_update(model, server_models, found_dict, opts)
 
-            # TODO: this code may be sketchy... here {'id': []}, really means we found
-            #       all of the models..
-            if primary_key in remaining_query and not remaining_query[primary_key]:
+    async def cached_where_async(
+        self,
+        query,
+        model,
+        primary_key="id",
+        methods: Dict = None,
+        include: Dict = None,
+        opts: Dict = None,
+    ):
+        """Asyncio version of :meth:`cached_where`."""
+        if isinstance(query, str):
+            server_models = await self.interface(model).where_async(
+                query, opts=opts, methods=methods, include=include
+            )
+            found_dict = {}
+        elif [] in query.values():
+            return []
+        else:
+            found_dict, remaining_query = self._cached_where_lookup(
+                query, model, primary_key
+            )
+            if remaining_query is None:
                 return list(found_dict.values())
-            server_models = self.interface(model).where(remaining_query, opts=opts)
+            fresh, stale, remaining_query = self._persistent_lookup(
+                model, remaining_query, primary_key
+            )
+            if fresh or stale:
+                revalidated = []
+                if stale:
+                    revalidated = await self.interface(model).where_async(
+                        {"id": list(stale)}
+                    )
+                found_dict.update(
+                    self._load_persisted(model, fresh, stale, revalidated)
+                )
+            if remaining_query is None:
+                return self._cached_where_update(model, [], found_dict, opts)
+            server_models = await self.interface(model).where_async(
+                remaining_query, opts=opts
+            )
+            self._record_completed_query(remaining_query, model, primary_key, opts)
+        return self._cached_where_update(model, server_models, found_dict, opts)
+
+    def _persists(self, model: str) -> bool:
+        return self.persistent_cache is not None and self.persistent_cache.stores(model)
+
+    def _persistent_lookup(self, model, query, primary_key):
+        """Finds rows for an id query in the persistent cache.
+
+        :return: tuple of fresh rows, stale rows and the query for the
+            remaining models (or None if all rows were found)
+        """
+        if (
+            primary_key != "id"
+            or list(query) != ["id"]
+            or not self._persists(model)
+            or not isinstance(query["id"], list)
+        ):
+            return {}, {}, query
+        fresh, stale = self.persistent_cache.get(model, query["id"])
+        remaining = [
+            mid for mid in query["id"] if mid not in fresh and mid not in stale
+        ]
+        self.log.info(
+            "CACHE found {num} {model} rows in persistent cache ({stale} stale)".format(
+                num=len(fresh) + len(stale), model=model, stale=len(stale)
+            )
+        )
+        if not remaining:
+            return fresh, stale, None
+        return fresh, stale, {"id": remaining}
+
+    def _load_persisted(self, model, fresh, stale, revalidated):
+        """Loads rows from the persistent cache into the model cache.
+
+        Stale rows are revalidated against the `updated_at` of the models
+        returned by the server: rows that are unchanged are marked as fresh,
+        changed rows are replaced and rows of models missing from the
+        server are deleted.
+
+        :return: the loaded models keyed by id
+        """
+        rows = list(fresh.values())
+        unchanged, changed = [], []
+        for server_model in revalidated:
+            row = stale.pop(server_model.id, None)
+            if row is None:
+                continue
+            if row.get("updated_at", None) == server_model._get_data().get(
+                "updated_at", None
+            ):
+                unchanged.append(server_model.id)
+                rows.append(row)
+            else:
+                changed.append(server_model)
+        cache = self.persistent_cache
+        if unchanged:
+            cache.touch(model, unchanged)
+        if stale:
+            cache.delete(model, list(stale))
+        models = self.interface(model).load(rows) if rows else []
+        loaded = self._update_model_cache_helper(
+            model, {m.id: m for m in models}, persist=False
+        )
+        loaded += self._update_model_cache_helper(model, {m.id: m for m in changed})
+        return {m.id: m for m in loaded}
+
+    def _cached_where_lookup(self, query, model, primary_key):
+        """Finds models matching the query in the cache.
+
+        .. versionchanged:: 1.0.7
+            Cached models are found using the browser's hash indexes and
+            the remaining query only requests the values that have not
+            already been served by the cache (see :meth:`_remaining_query`).
+
+        :return: the found models by id and the query for the remaining
+            models. If all of the models were found, the remaining query is
+            None.
+        """
+        if self.cache_policies:
+            self._evict()
+        found, found_queries = self._cached_matches(query, model)
+
+        found_dict = {f.id: f for f in found}
+        self.log.info(
+            "CACHE found {num} {model} models in cache using query {query}".format(
+                num=len(found_dict), model=model, query=self.log.pprint_data(query)
+            )
+        )
+        return (
+            found_dict,
+            self._remaining_query(query, model, primary_key, found_queries),
+        )
+
+    def _cached_matches(self, query, model):
+        """Finds the cached models that match the query, using the indexes of
+        this browser and of its parent browsers.
+
+        .. versionadded:: 1.0.7
+
+        :return: tuple of the list of matching models and the list of the
+            matched values
+        """
+        own_models = self._own_model_cache().get(model, {})
+        found, found_queries = self._find_matches(
+            query, own_models.values(), index=self.model_index.get(model, None)
+        )
+        if self.parent is not None:
+            parent_found, parent_queries = self.parent._cached_matches(query, model)
+            for m, match in zip(parent_found, parent_queries):
+                if m._primary_key not in own_models:
+                    found.append(m)
+                    found_queries.append(match)
+        return found, found_queries
+
+    def _get_completed_queries(self, model: str) -> set:
+        completed = self._completed_queries.get(model, set())
+        if self.parent is not None:
+            completed = completed | self.parent._get_completed_queries(model)
+        return completed
+
+    @staticmethod
+    def _split_key(query, primary_key):
+        """Returns the key along which a query is split into single value
+        queries, i.e. the primary key or else the first `IN` (list)
+        criteria."""
+        if primary_key in query:
+            return primary_key
+        for k, v in query.items():
+            if isinstance(v, list):
+                return k
+        return None
+
+    @staticmethod
+    def _query_points(query, split_key):
+        """Splits a query into single value queries, keyed by the value of the
+        split key.
+
+        :return: dictionary of value to hashable query or None if the query
+            cannot be hashed
+        """
+        base = [(k, v) for k, v in query.items() if k != split_key]
+        try:
+            if split_key is None:
+                return {None: frozenset(base)}
+            values = query[split_key]
+            if not isinstance(values, list):
+                values = [values]
+            return {v: frozenset(base + [(split_key, v)]) for v in values}
+        except TypeError:
+            return None
+
+    def _remaining_query(self, query, model, primary_key, found_queries):
+        """Returns the part of the query that cannot be served from the cache,
+        or None if the entire query can be served from the cache.
 
+        A value of the query is served from the cache if a model with that
+        primary key was found in the cache or if the same query was
+        previously sent to the server (see :meth:`_record_completed_query`).
+        """
+        split_key = self._split_key(query, primary_key)
+        points = self._query_points(query, split_key)
+        if points is None:
+            return dict(query)
+        completed = self._get_completed_queries(model)
+        done = {v for v, point in points.items() if point in completed}
+        if split_key is not None and split_key == primary_key:
+            done.update(q[primary_key] for q in found_queries)
+        remaining = [v for v in points if v not in done]
+        if not remaining:
+            return None
+        remaining_query = dict(query)
+        if split_key is not None:
+            remaining_query[split_key] = remaining
+        return remaining_query
+
+    def _record_completed_query(self, query, model, primary_key, opts):
+        """Records that all models matching the query are now cached.
+
+        Queries limited by options (e.g. 'limit' or 'offset') are not
+        recorded.
+        """
+        if opts and any(opts.get(k, -1) not in [None, -1] for k in ["limit", "offset"]):
+            return
+        points = self._query_points(query, self._split_key(query, primary_key))
+        if points:
+            self._completed_queries.setdefault(model, set()).update(points.values())
+
+    def _cached_where_update(self, model, server_models, found_dict, opts):
         models_dict = OrderedDict({s.id: s for s in server_models})
         models_dict.update(found_dict)
 
@@ -679,16 +1516,55 @@ class Browser(QueryInterfaceABC):
         if relation is None:
             relation = models[0].get_relationships()[relationship_name]
 
-        ref = relation.ref  # sample_id
-        attr = relation.attr  # id
-        model_class2 = relation.nested
-
         # todo: collect existing fullfilled relationship
         # todo: partition, then collect callback
         # todo: how to handle when model_attr is absent?, or just raise error?
 
         retrieve_query = relation.build_query(models)
-        retrieved_models = self.where(retrieve_query, model_class2)
+        retrieved_models = self.where(retrieve_query, relation.nested)
+        return self._assign_has_many_or_has_one(
+            models,
+            relationship_name,
+            relation,
+            retrieve_query,
+            retrieved_models,
+            strict,
+        )
+
+    async def _retrieve_has_many_or_has_one_async(
+        self, models, relationship_name, relation=None, strict=True
+    ):
+        """Asyncio version of :meth:`_retrieve_has_many_or_has_one`."""
+        if not models:
+            return []
+        models = models[:]
+        if relation is None:
+            relation = models[0].get_relationships()[relationship_name]
+        retrieve_query = relation.build_query(models)
+        retrieved_models = await self.where_async(retrieve_query, relation.nested)
+        return self._assign_has_many_or_has_one(
+            models,
+            relationship_name,
+            relation,
+            retrieve_query,
+            retrieved_models,
+            strict,
+        )
+
+    def _assign_has_many_or_has_one(
+        self,
+        models,
+        relationship_name,
+        relation,
+        retrieve_query,
+        retrieved_models,
+        strict,
+    ):
+        """Sets the relationship on each model from the retrieved models."""
+        ref = relation.ref  # sample_id
+        attr = relation.attr  # id
+        model_class2 = relation.nested
+
         self.log.info(
             "RETRIEVE retrieved {num} {cls} models using query {query}".format(
                 num=len(retrieved_models),
@@ -772,12 +1648,42 @@ class Browser(QueryInterfaceABC):
     ):
         """Performs exactly 2 queries to establish a HasManyThrough
         relationship."""
+        relation, other_ref = self._has_many_through_relations(
+            models, relationship_name
+        )
+        associations = self._retrieve_has_many_or_has_one(
+            models, relation.through_model_attr, strict=strict
+        )
+        self._retrieve_has_many_or_has_one(associations, other_ref, strict=strict)
+        return self._assign_has_many_through(
+            models, relationship_name, associations, other_ref
+        )
+
+    async def _retrieve_has_many_through_async(
+        self, models: List[ModelBase], relationship_name: str, strict: bool = True
+    ):
+        """Asyncio version of :meth:`_retrieve_has_many_through`."""
+        relation, other_ref = self._has_many_through_relations(
+            models, relationship_name
+        )
+        associations = await self._retrieve_has_many_or_has_one_async(
+            models, relation.through_model_attr, strict=strict
+        )
+        await self._retrieve_has_many_or_has_one_async(
+            associations, other_ref, strict=strict
+        )
+        return self._assign_has_many_through(
+            models, relationship_name, associations, other_ref
+        )
+
+    @staticmethod
+    def _has_many_through_relations(models, relationship_name):
+        """Returns the HasManyThrough relation and the name of the
+        association's relationship to the other model."""
         relation = models[0].get_relationships()[relationship_name]
         association_relation = models[0].get_relationships()[
             relation.through_model_attr
         ]
-        attr = relation.attr
-        ref = association_relation.ref
 
         # find other key
         association_class = ModelRegistry.get_model(association_relation.nested)
@@ -787,11 +1693,18 @@ class Browser(QueryInterfaceABC):
             ar = association_relationships[r]
             if ar.nested == relation.nested:
                 other_ref = r
+        return relation, other_ref
 
-        associations = self._retrieve_has_many_or_has_one(
-            models, relation.through_model_attr, strict=strict
-        )
-        self._retrieve_has_many_or_has_one(associations, other_ref, strict=strict)
+    @staticmethod
+    def _assign_has_many_through(models, relationship_name, associations, other_ref):
+        """Sets the HasManyThrough relationship on each model from the
+        retrieved associations."""
+        relation = models[0].get_relationships()[relationship_name]
+        association_relation = models[0].get_relationships()[
+            relation.through_model_attr
+        ]
+        attr = relation.attr
+        ref = association_relation.ref
 
         associations_by_mid = {}
         for a in associations:
@@ -866,8 +1779,74 @@ class Browser(QueryInterfaceABC):
         :return: list of models retrieved
         :rtype: list
         """
-        if not models:
+        prepared = self._prepare_retrieve(
+            models, relationship_name, relation, strict, force_refresh
+        )
+        if prepared is None:
             return []
+        relation, needs_refresh, no_refresh = prepared
+
+        if needs_refresh:
+            if hasattr(relation, "through_model_attr"):
+                found_models = self._retrieve_has_many_through(
+                    needs_refresh, relationship_name, strict=strict
+                )
+            else:
+                found_models = self._retrieve_has_many_or_has_one(
+                    needs_refresh, relationship_name, relation, strict=strict
+                )
+        else:
+            found_models = []
+        return self._collect_retrieved(found_models, no_refresh, relationship_name)
+
+    async def retrieve_async(
+        self,
+        models: List[ModelBase],
+        relationship_name: str,
+        relation: BaseRelationship = None,
+        strict: bool = True,
+        force_refresh: bool = False,
+    ) -> List[ModelBase]:
+        """Retrieves a model relationship for the list of models. Asyncio
+        version of :meth:`retrieve`.
+
+        .. code-block:: python
+
+            items = await browser.retrieve_async(samples, 'items')
+
+        .. versionadded:: 1.0.7
+        """
+        prepared = self._prepare_retrieve(
+            models, relationship_name, relation, strict, force_refresh
+        )
+        if prepared is None:
+            return []
+        relation, needs_refresh, no_refresh = prepared
+
+        if needs_refresh:
+            if hasattr(relation, "through_model_attr"):
+                found_models = await self._retrieve_has_many_through_async(
+                    needs_refresh, relationship_name, strict=strict
+                )
+            else:
+                found_models = await self._retrieve_has_many_or_has_one_async(
+                    needs_refresh, relationship_name, relation, strict=strict
+                )
+        else:
+            found_models = []
+        return self._collect_retrieved(found_models, no_refresh, relationship_name)
+
+    def _prepare_retrieve(
+        self, models, relationship_name, relation, strict, force_refresh
+    ):
+        """Validates the relation to retrieve and partitions the models into
+        those that need to be refreshed and those that do not.
+
+        :return: tuple of relation, models to refresh and models not to
+            refresh, or None if there is nothing to retrieve
+        """
+        if not models:
+            return None
         self.log.info('RETRIEVE retrieving "{}"'.format(relationship_name))
         model_classes = {m.__class__.__name__ for m in models}
         assert (
@@ -880,7 +1859,7 @@ class Browser(QueryInterfaceABC):
                 models[0], relationship_name, strict
             )
             if relation is None:
-                return []
+                return None
         else:
             if relationship_name in models[0].get_relationships():
                 raise BrowserException(
@@ -904,19 +1883,9 @@ class Browser(QueryInterfaceABC):
         else:
             needs_refresh = models
             no_refresh = []
+        return relation, needs_refresh, no_refresh
 
-        if needs_refresh:
-            if hasattr(relation, "through_model_attr"):
-                found_models = self._retrieve_has_many_through(
-                    needs_refresh, relationship_name, strict=strict
-                )
-            else:
-                found_models = self._retrieve_has_many_or_has_one(
-                    needs_refresh, relationship_name, relation, strict=strict
-                )
-        else:
-            found_models = []
-
+    def _collect_retrieved(self, found_models, no_refresh, relationship_name):
         self.log.info(
             'RETRIEVE retrieved {} for "{}"'.format(
                 len(found_models), relationship_name
@@ -1016,6 +1985,62 @@ class Browser(QueryInterfaceABC):
                 )
             )
 
+    async def recursive_retrieve_async(
+        self,
+        models: List[ModelBase],
+        relations: Union[str, List[BaseRelationship], Dict],
+        strict: bool = True,
+        force_refresh: bool = False,
+    ):
+        """Efficiently retrieve a model relationship recursively. Asyncio
+        version of :meth:`recursive_retrieve`. Sibling relations are
+        retrieved concurrently.
+
+        .. versionadded:: 1.0.7
+        """
+        self.log.info("RETRIEVE recursively retrieving {}".format(relations))
+        if isinstance(relations, str):
+            return {
+                relations: await self.retrieve_async(
+                    models, relations, strict=strict, force_refresh=force_refresh
+                )
+            }
+        elif isinstance(relations, (list, set, dict, tuple)):
+
+            async def retrieve_relation(relation_name):
+                new_models = await self.retrieve_async(
+                    models, relation_name, strict=strict, force_refresh=force_refresh
+                )
+                models_by_attr = {relation_name: new_models}
+                if isinstance(relations, dict):
+                    models_by_attr.update(
+                        await self.recursive_retrieve_async(
+                            new_models,
+                            relations[relation_name],
+                            strict=strict,
+                            force_refresh=force_refresh,
+                        )
+                    )
+                return models_by_attr
+
+            results = await asyncio.gather(
+                *[retrieve_relation(relation_name) for relation_name in relations]
+            )
+            models_by_attr = {}
+            for _models_by_attr in results:
+                for attr, _models in _models_by_attr.items():
+                    models_by_attr.setdefault(attr, [])
+                    models_by_attr[attr] += _models
+            return models_by_attr
+        elif not strict:
+            return []
+        else:
+            raise BrowserException(
+                "Type {} for is not recognized for recursive_retrieve".format(
+                    type(relations)
+                )
+            )
+
     @classmethod
     def sample_network(
         cls,
@@ -1215,6 +2240,12 @@ class Browser(QueryInterfaceABC):
                 return self.retrieve(
                     models, relations, strict=strict, force_refresh=force_refresh
                 )
+            elif self.include_planner is not None and models:
+                plan = self.plan_get(models, relations)
+                self.last_plan = plan
+                return self.execute_plan(
+                    models, plan, strict=strict, force_refresh=force_refresh
+                )
             else:
                 return self.recursive_retrieve(
                     models, relations, strict=strict, force_refresh=force_refresh
@@ -1222,6 +2253,179 @@ class Browser(QueryInterfaceABC):
         else:
             return models
 
+    def plan_get(
+        self, models: List[ModelBase], relations: Union[str, List[str], Dict]
+    ) -> RetrievePlan:
+        """Returns the plan that :meth:`get` would use to retrieve the
+        relation tree, using the browser's `include_planner` (or a default
+        :class:`pydent.include_planner.IncludePlanner`).
+
+        .. versionadded:: 1.0.7
+
+        :param models: list of models
+        :param relations: the relation tree
+        :return: the plan
+        """
+        planner = self.include_planner
+        if planner is None:
+            planner = IncludePlanner()
+        return planner.plan(models, relations)
+
+    def execute_plan(
+        self,
+        models: List[ModelBase],
+        plan: RetrievePlan,
+        strict: bool = True,
+        force_refresh: bool = False,
+    ) -> Dict[str, List[ModelBase]]:
+        """Retrieves the relation tree of a plan. Included relationships are
+        retrieved with the query of their parent relationship. If the server
+        fails to include them, they are retrieved level by level.
+
+        .. versionadded:: 1.0.7
+
+        :param models: list of models
+        :param plan: the plan (see :meth:`plan_get`)
+        :param strict: whether to ignore database inconsistencies
+        :param force_refresh: if True, retrieve relationships that are
+            already loaded
+        :return: dictionary of all models retrieved grouped by the attribute
+            name that retrieved them.
+        """
+        models_by_attr = {}
+        for root in plan.roots:
+            self._execute_plan_node(models, root, strict, force_refresh, models_by_attr)
+        return models_by_attr
+
+    def _execute_plan_node(
+        self,
+        models: List[ModelBase],
+        node: PlanNode,
+        strict: bool,
+        force_refresh: bool,
+        models_by_attr: Dict[str, List[ModelBase]],
+    ):
+        if node.is_included:
+            found = self._collect_included(models, node, strict)
+        else:
+            found = self._retrieve_with_include(models, node, strict, force_refresh)
+        models_by_attr.setdefault(node.name, [])
+        models_by_attr[node.name] += found
+        for child in node.children:
+            self._execute_plan_node(found, child, strict, force_refresh, models_by_attr)
+
+    def _retrieve_with_include(self, models, node, strict, force_refresh):
+        """Retrieves the relationship of a query node with a single query
+        that includes its included child relationships."""
+        include = node.include_tree()
+        if not include or not models:
+            return self.retrieve(
+                models, node.name, strict=strict, force_refresh=force_refresh
+            )
+        if force_refresh:
+            needs_refresh, no_refresh = models, []
+        else:
+            needs_refresh = [m for m in models if not m.is_deserialized(node.name)]
+            no_refresh = [m for m in models if m.is_deserialized(node.name)]
+        found = []
+        if needs_refresh:
+            relation = node.relation
+            retrieve_query = relation.build_query(needs_refresh)
+            try:
+                retrieved_models = self.server_where(
+                    retrieve_query,
+                    relation.nested,
+                    opts=None,
+                    include=include,
+                    methods=None,
+                    page_size=None,
+                )
+            except TridentRequestError as e:
+                self.log.error(
+                    "RETRIEVE could not include {} for '{}'. Retrieving level by "
+                    "level.\n{}".format(include, node.name, e)
+                )
+                node.fallback = True
+                return self.retrieve(
+                    models, node.name, strict=strict, force_refresh=force_refresh
+                )
+            if self.use_cache:
+                retrieved_models = self._update_model_cache_helper(
+                    relation.nested,
+                    {m._primary_key: m for m in retrieved_models},
+                )
+                self.update_cache(retrieved_models)
+            found = self._assign_has_many_or_has_one(
+                needs_refresh,
+                node.name,
+                relation,
+                retrieve_query,
+                retrieved_models,
+                strict,
+            )
+        return self._collect_retrieved(found, no_refresh, node.name)
+
+    def _collect_included(self, models, node, strict):
+        """Collects the models of an included relationship, retrieving the
+        relationship of any model that was not included."""
+        relation = node.relation
+        missing = [
+            m
+            for m in models
+            if not m.is_deserialized(node.name)
+            and relation._get_query_key(m) is not None
+        ]
+        if missing:
+            self.retrieve(missing, node.name, strict=strict)
+        found = {}
+        for model in models:
+            val = model._get_deserialized_data().get(node.name, None)
+            if val is None or val is relation.ACCESSOR.HOLDER:
+                continue
+            if isinstance(val, list):
+                for m in val:
+                    found.setdefault(m._primary_key, m)
+            else:
+                # an included HasOne model is embedded once per model
+                canonical = found.setdefault(val._primary_key, val)
+                if canonical is not val:
+                    setattr(model, node.name, canonical)
+        return list(found.values())
+
+    async def get_async(
+        self,
+        models: List[ModelBase],
+        relations: List[BaseRelationship] = None,
+        query: dict = None,
+        strict: bool = True,
+        force_refresh: bool = False,
+    ) -> Union[Dict[str, List[ModelBase]], List[ModelBase]]:
+        """Asyncio version of :meth:`get`.
+
+        .. code-block:: python
+
+            results = await browser.get_async(samples, {"items": "object_type"})
+
+        .. versionadded:: 1.0.7
+        """
+        if isinstance(models, ModelBase):
+            models = [models]
+        elif isinstance(models, str):
+            models = list(self.model_cache.get(models, {}).values())
+            if query:
+                models, _ = self._find_matches(query, models)
+        if relations:
+            if isinstance(relations, str):
+                return await self.retrieve_async(
+                    models, relations, strict=strict, force_refresh=force_refresh
+                )
+            else:
+                return await self.recursive_retrieve_async(
+                    models, relations, strict=strict, force_refresh=force_refresh
+                )
+        else:
+            return models
+
     def export_samples_to_csv(self, samples, out):
         """Exports the samples to a csv (for Aquarium import)
 
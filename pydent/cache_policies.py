@@ -0,0 +1,223 @@
+"""
+Cache Policies (:mod:`pydent.cache_policies`)
+=============================================
+
+.. versionadded:: 1.0.7
+    Cache policies added
+
+.. currentmodule:: pydent.cache_policies
+
+Eviction policies that bound the size of the :class:`pydent.browser.Browser`
+model cache for long-running sessions.
+
+.. code-block:: python
+
+    from pydent.cache_policies import LRUPolicy, ByteBudgetPolicy, TTLPolicy
+
+    browser = Browser(
+        session,
+        cache_policies=[
+            LRUPolicy(100000),
+            ByteBudgetPolicy(500 * 1024 ** 2),
+            TTLPolicy(3600),
+        ],
+    )
+
+Models are keyed by a `(model class name, primary key)` tuple. Models evicted
+to bound the size of the cache that are still referenced by user code are
+held by weak reference by the browser, so they are not reloaded as duplicate
+instances. Models expired by a :class:`TTLPolicy` are never served from the
+cache, and weakly held models expire as well.
+
+.. autosummary::
+    :toctree: generated/
+
+    CachePolicy
+    LRUPolicy
+    ByteBudgetPolicy
+    TTLPolicy
+    estimate_model_size
+"""
+
+import sys
+import time
+from abc import ABC
+from abc import abstractmethod
+from collections import OrderedDict
+from typing import Callable
+from typing import Hashable
+from typing import List
+
+from pydent.base import ModelBase
+
+
+def estimate_model_size(model: ModelBase) -> int:
+    """Estimates the number of bytes of a model's payload from the shallow
+    size of its data dictionary and values."""
+    data = model._get_data()
+    return sys.getsizeof(data) + sum(sys.getsizeof(v) for v in data.values())
+
+
+class CachePolicy(ABC):
+    """Base class for an eviction policy of the browser model cache."""
+
+    #: whether the policy evicts models because their data is out of date
+    #: (rather than to bound the size of the cache). Expired models are not
+    #: served from the cache even if they are still referenced elsewhere.
+    expires = False
+
+    @abstractmethod
+    def add(self, key: Hashable, model: ModelBase):
+        """Called when a model is added to (or updated in) the cache."""
+
+    def access(self, key: Hashable):
+        """Called when a cached model is returned from the cache."""
+
+    @abstractmethod
+    def remove(self, key: Hashable):
+        """Called when a model is removed from the cache."""
+
+    @abstractmethod
+    def evict(self) -> List[Hashable]:
+        """Returns the keys of the models to evict from the cache."""
+
+    @abstractmethod
+    def clear(self):
+        """Called when the cache is cleared."""
+
+    def __len__(self):
+        return 0
+
+
+class LRUPolicy(CachePolicy):
+    """Evicts the least recently used models when the number of cached
+    models exceeds `max_entries`."""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._keys = OrderedDict()
+
+    def add(self, key, model):
+        self._keys[key] = None
+        self._keys.move_to_end(key)
+
+    def access(self, key):
+        if key in self._keys:
+            self._keys.move_to_end(key)
+
+    def remove(self, key):
+        self._keys.pop(key, None)
+
+    def evict(self):
+        evicted = []
+        while len(self._keys) > self.max_entries:
+            evicted.append(self._keys.popitem(last=False)[0])
+        return evicted
+
+    def clear(self):
+        self._keys.clear()
+
+    def __len__(self):
+        return len(self._keys)
+
+    def __repr__(self):
+        return "<{}(max_entries={})>".format(self.__class__.__name__, self.max_entries)
+
+
+class ByteBudgetPolicy(CachePolicy):
+    """Evicts the least recently used models when the estimated size of the
+    cached models exceeds `max_bytes`."""
+
+    def __init__(
+        self,
+        max_bytes: int,
+        size_estimator: Callable[[ModelBase], int] = estimate_model_size,
+    ):
+        """Initializes the policy.
+
+        :param max_bytes: the byte budget of the cache
+        :param size_estimator: function that estimates the size of a model
+        """
+        self.max_bytes = max_bytes
+        self.size_estimator = size_estimator
+        self.size = 0  #: estimated size of the cached models in bytes
+        self._sizes = OrderedDict()
+
+    def add(self, key, model):
+        self.remove(key)
+        size = self.size_estimator(model)
+        self._sizes[key] = size
+        self.size += size
+
+    def access(self, key):
+        if key in self._sizes:
+            self._sizes.move_to_end(key)
+
+    def remove(self, key):
+        size = self._sizes.pop(key, None)
+        if size is not None:
+            self.size -= size
+
+    def evict(self):
+        evicted = []
+        while self.size > self.max_bytes and self._sizes:
+            key, size = self._sizes.popitem(last=False)
+            self.size -= size
+            evicted.append(key)
+        return evicted
+
+    def clear(self):
+        self._sizes.clear()
+        self.size = 0
+
+    def __len__(self):
+        return len(self._sizes)
+
+    def __repr__(self):
+        return "<{}(max_bytes={}, size={})>".format(
+            self.__class__.__name__, self.max_bytes, self.size
+        )
+
+
+class TTLPolicy(CachePolicy):
+    """Evicts models that were added to the cache more than `ttl` seconds
+    ago."""
+
+    expires = True
+
+    def __init__(self, ttl: float, timer: Callable[[], float] = time.monotonic):
+        """Initializes the policy.
+
+        :param ttl: time to live in seconds
+        :param timer: function returning the current time in seconds
+        """
+        self.ttl = ttl
+        self.timer = timer
+        self._inserted = OrderedDict()
+
+    def add(self, key, model):
+        self._inserted.pop(key, None)
+        self._inserted[key] = self.timer()
+
+    def remove(self, key):
+        self._inserted.pop(key, None)
+
+    def evict(self):
+        evicted = []
+        expired = self.timer() - self.ttl
+        while self._inserted:
+            key, inserted = next(iter(self._inserted.items()))
+            if inserted > expired:
+                break
+            del self._inserted[key]
+            evicted.append(key)
+        return evicted
+
+    def clear(self):
+        self._inserted.clear()
+
+    def __len__(self):
+        return len(self._inserted)
+
+    def __repr__(self):
+        return "<{}(ttl={})>".format(self.__class__.__name__, self.ttl)
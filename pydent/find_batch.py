@@ -0,0 +1,184 @@
+"""
+Find Batch (:mod:`pydent.find_batch`)
+=====================================
+
+.. versionadded:: 1.0.7
+    Find batches added
+
+.. currentmodule:: pydent.find_batch
+
+Microbatching of finds by id. Code that finds models one id at a time
+makes one request per id. Inside a find batch, finds made with
+:meth:`find_later <pydent.interfaces.QueryInterface.find_later>` are
+collected and retrieved with a single `where({"id": [...]})` query per
+model when the batch exits, or as soon as one of their results is needed.
+
+.. code-block:: python
+
+    with session.batch():
+        futures = [session.Sample.find_later(i) for i in sample_ids]
+    samples = [f.result() for f in futures]
+
+A model found more than once in a batch is retrieved once. If the session
+is using its cache, models already in the browser are served from the
+cache without being queried.
+
+.. autosummary::
+    :toctree: generated/
+
+    FindBatch
+    FindFuture
+"""
+
+import threading
+from typing import Dict
+from typing import List
+
+
+class FindFuture:
+    """The model of a find made in a :class:`FindBatch`."""
+
+    __slots__ = ["batch", "model_name", "model_id", "_done", "_model", "_error"]
+
+    def __init__(self, batch: "FindBatch", model_name: str, model_id: int):
+        self.batch = batch
+        self.model_name = model_name
+        self.model_id = model_id
+        self._done = False
+        self._model = None
+        self._error = None
+
+    @classmethod
+    def resolved(cls, model_name: str, model_id: int, model: "ModelBase"):
+        """Returns a future that is already resolved with `model`."""
+        future = cls(None, model_name, model_id)
+        future._set_result(model)
+        return future
+
+    def _set_result(self, model: "ModelBase"):
+        self._model = model
+        self._done = True
+
+    def _set_error(self, error: Exception):
+        self._error = error
+        self._done = True
+
+    def done(self) -> bool:
+        """Whether the find has been retrieved."""
+        return self._done
+
+    def result(self) -> "ModelBase":
+        """Returns the found model (None if not found). If the find has not
+        been retrieved yet, the pending finds of its batch are retrieved
+        first.
+
+        :return: the model
+        """
+        if not self._done:
+            self.batch.dispatch()
+        if self._error is not None:
+            raise self._error
+        return self._model
+
+    def __repr__(self):
+        return "<{}(model_name={}, model_id={}, done={})>".format(
+            self.__class__.__name__, self.model_name, self.model_id, self._done
+        )
+
+
+class FindBatch:
+    """Collects finds by id and retrieves them with one query per model.
+
+    Use :meth:`AqSession.batch <pydent.aqsession.AqSession.batch>` to
+    create a batch. While the batch is open, the
+    :meth:`find_later <pydent.interfaces.QueryInterface.find_later>` methods
+    of the session's interfaces add their finds to it.
+    """
+
+    def __init__(self, session):
+        self.session = session
+        self.num_queries = 0  #: number of queries made by the batch
+        self._futures = {}  # futures by model name and id
+        self._pending = {}  # futures to retrieve by model name
+        self._lock = threading.RLock()
+        self._outer = None
+        self._entered = False
+
+    def find(self, model_name: str, model_id: int) -> FindFuture:
+        """Adds a find by id to the batch.
+
+        :param model_name: name of the model class (e.g. "Sample")
+        :param model_id: id of the model
+        :return: the future of the find
+        """
+        if model_id is None:
+            raise ValueError("model_id in 'find' cannot be None")
+        if model_id == 0:
+            return FindFuture.resolved(model_name, model_id, None)
+        with self._lock:
+            futures = self._futures.setdefault(model_name, {})
+            future = futures.get(model_id, None)
+            if future is not None:
+                return future
+            model = self._cached(model_name, model_id)
+            if model is not None:
+                future = FindFuture.resolved(model_name, model_id, model)
+            else:
+                future = FindFuture(self, model_name, model_id)
+                self._pending.setdefault(model_name, []).append(future)
+            futures[model_id] = future
+            return future
+
+    def _cached(self, model_name: str, model_id: int):
+        if not self.session.using_cache:
+            return None
+        return self.session.browser._cached_find_lookup(model_name, model_id)
+
+    def _retrieve(self, model_name: str, futures: List[FindFuture]):
+        interface = self.session.model_interface(model_name)
+        try:
+            models = interface.where({"id": [f.model_id for f in futures]})
+        except Exception as e:
+            for future in futures:
+                future._set_error(e)
+            return
+        finally:
+            self.num_queries += 1
+        models_by_id = {m.id: m for m in models}
+        for future in futures:
+            future._set_result(models_by_id.get(future.model_id, None))
+
+    def dispatch(self):
+        """Retrieves all of the pending finds of the batch."""
+        with self._lock:
+            pending = self._pending
+            self._pending = {}
+            for model_name, futures in pending.items():
+                self._retrieve(model_name, futures)
+
+    @property
+    def pending(self) -> Dict[str, List[int]]:
+        """The ids of the pending finds, by model name."""
+        with self._lock:
+            return {
+                model_name: [f.model_id for f in futures]
+                for model_name, futures in self._pending.items()
+            }
+
+    def __enter__(self) -> "FindBatch":
+        if self._entered:
+            raise RuntimeError("{} is already open".format(self))
+        self._entered = True
+        self._outer = self.session._find_batch
+        self.session._find_batch = self
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.session._find_batch = self._outer
+        self._outer = None
+        self._entered = False
+        if exc_type is None:
+            self.dispatch()
+
+    def __repr__(self):
+        return "<{}(num_queries={})>".format(self.__class__.__name__, self.num_queries)
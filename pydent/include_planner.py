@@ -0,0 +1,346 @@
+"""
+Include Planner (:mod:`pydent.include_planner`)
+===============================================
+
+.. versionadded:: 1.0.7
+    Include planner added
+
+.. currentmodule:: pydent.include_planner
+
+Cost-based planning of :meth:`pydent.browser.Browser.get` relation trees.
+Without a plan, each relationship at each level of the tree is retrieved
+with a separate query. The planner instead pushes eligible subtrees into
+the server side `include` of the query of their parent relationship.
+
+.. code-block:: python
+
+    browser = Browser(session, include_planner=IncludePlanner())
+
+    relations = {"operations": {"field_values": {"wires_as_source": {}}}}
+    print(browser.plan_get(plans, relations))
+    browser.get(plans, relations)
+    print(browser.last_plan)
+
+A relationship is included only if the server can include it (a plain
+`HasOne` or `HasMany` foreign key relationship) and the estimated number of
+duplicated rows in the payload costs less than a request.
+A `HasOne` model shared by many models is embedded once per
+referring model, so including it can duplicate a large payload.
+
+.. autosummary::
+    :toctree: generated/
+
+    IncludePlanner
+    RetrievePlan
+    PlanNode
+"""
+
+from typing import Dict
+from typing import List
+from typing import Set
+from typing import Tuple
+from typing import Union
+
+from pydent.base import ModelBase
+from pydent.marshaller import ModelRegistry
+from pydent.relationships import BaseRelationship
+from pydent.relationships import HasMany
+from pydent.relationships import HasOne
+
+
+def normalize_relations(relations) -> Dict[str, dict]:
+    """Converts a relation tree (a name, a list of names or a nested
+    dictionary) into a nested dictionary of names."""
+    if relations is None:
+        return {}
+    if isinstance(relations, str):
+        return {relations: {}}
+    if isinstance(relations, dict):
+        return {name: normalize_relations(v) for name, v in relations.items()}
+    return {name: {} for name in relations}
+
+
+class PlanNode:
+    """A relationship of a :class:`RetrievePlan`.
+
+    A node is either retrieved with its own query (`QUERY`) or is
+    included in the query of its parent (`INCLUDE`).
+    """
+
+    QUERY = "query"
+    INCLUDE = "include"
+
+    def __init__(
+        self,
+        name: str,
+        model_class: str,
+        relation: Union[BaseRelationship, None],
+        mode: str,
+        rows: float,
+        distinct: float,
+        reason: str,
+    ):
+        """Initializes the node.
+
+        :param name: name of the relationship
+        :param model_class: name of the model class owning the relationship
+        :param relation: the relationship, or None if not found
+        :param mode: either `PlanNode.QUERY` or `PlanNode.INCLUDE`
+        :param rows: estimated number of rows of this node in the payload
+        :param distinct: estimated number of distinct rows of this node
+        :param reason: why the mode was chosen
+        """
+        self.name = name
+        self.model_class = model_class
+        self.relation = relation
+        self.mode = mode
+        self.rows = rows
+        self.distinct = distinct
+        self.reason = reason
+        self.children = []  #: child nodes
+        self.fallback = False  #: whether the include query failed during execution
+
+    @property
+    def is_included(self) -> bool:
+        return self.mode == self.INCLUDE
+
+    def include_tree(self) -> dict:
+        """Returns the `include` argument of the query of this node."""
+        include = {}
+        for child in self.children:
+            if child.is_included:
+                include[child.name] = {"include": child.include_tree()}
+        return include
+
+    def walk(self):
+        """Iterates over this node and its descendants."""
+        yield self
+        for child in self.children:
+            yield from child.walk()
+
+    def _lines(self, depth: int) -> List[str]:
+        lines = [
+            "{indent}{name} [{mode}] rows~{rows:.0f} distinct~{distinct:.0f} "
+            "({reason})".format(
+                indent="  " * depth,
+                name=self.name,
+                mode=self.mode + (", fallback" if self.fallback else ""),
+                rows=self.rows,
+                distinct=self.distinct,
+                reason=self.reason,
+            )
+        ]
+        for child in self.children:
+            lines += child._lines(depth + 1)
+        return lines
+
+    def __repr__(self):
+        return "<{}(name={}, mode={})>".format(
+            self.__class__.__name__, self.name, self.mode
+        )
+
+
+class RetrievePlan:
+    """The plan chosen by an :class:`IncludePlanner` for a relation tree."""
+
+    def __init__(self, model_class: str, roots: List[PlanNode]):
+        self.model_class = model_class
+        self.roots = roots
+
+    def nodes(self) -> List[PlanNode]:
+        """Returns all of the nodes of the plan."""
+        return [node for root in self.roots for node in root.walk()]
+
+    @property
+    def num_queries(self) -> int:
+        """The number of queries of the plan (not counting the queries
+        of the fallbacks)."""
+        return sum(1 for node in self.nodes() if not node.is_included)
+
+    @property
+    def includes(self) -> Dict[str, dict]:
+        """The `include` argument of each query, keyed by the path of its
+        relationship."""
+        includes = {}
+
+        def collect(node, path):
+            path = path + (node.name,)
+            if not node.is_included:
+                include = node.include_tree()
+                if include:
+                    includes[".".join(path)] = include
+            for child in node.children:
+                collect(child, path)
+
+        for root in self.roots:
+            collect(root, ())
+        return includes
+
+    def __str__(self):
+        lines = [
+            "{} ({} queries)".format(self.model_class, self.num_queries),
+        ]
+        for root in self.roots:
+            lines += root._lines(1)
+        return "\n".join(lines)
+
+    def __repr__(self):
+        return "<{}(model_class={}, num_queries={})>".format(
+            self.__class__.__name__, self.model_class, self.num_queries
+        )
+
+
+class IncludePlanner:
+    """Chooses which relationships of a relation tree are included in the
+    query of their parent relationship.
+
+    Rows are estimated from the number of models and two statistics:
+    `fanout`, the number of models per model of a `HasMany` relationship,
+    and `sharing`, the number of models that refer to the same model
+    through a `HasOne` relationship. A relationship is included if the
+    duplicated rows it adds to the payload cost no more than a request.
+    """
+
+    REQUEST_COST = 100  #: cost of a request, in rows
+    FANOUT = 4.0  #: default number of models per model of a HasMany
+    SHARING = 4.0  #: default number of models referring to the same HasOne model
+
+    def __init__(
+        self,
+        request_cost: float = REQUEST_COST,
+        fanout: float = FANOUT,
+        sharing: float = SHARING,
+        excluded: Set[Tuple[str, str]] = None,
+    ):
+        """Initializes the planner.
+
+        :param request_cost: cost of a request, in rows
+        :param fanout: estimated number of models per model of a HasMany
+        :param sharing: estimated number of models that refer to the same
+            model through a HasOne
+        :param excluded: (model class name, relationship name) tuples that the
+            server cannot include
+        """
+        self.request_cost = request_cost
+        self.fanout = fanout
+        self.sharing = sharing
+        self.excluded = set(excluded or ())
+
+    def can_include(self, model_class: str, relation: BaseRelationship) -> bool:
+        """Whether the server can include the relationship in a query."""
+        if (model_class, relation.data_key) in self.excluded:
+            return False
+        return (
+            type(relation) in (HasOne, HasMany)
+            and relation.BATCHED
+            and relation.attr == "id"
+            and relation.callback
+            in (ModelBase.find_callback.__name__, ModelBase.where_callback.__name__)
+        )
+
+    @staticmethod
+    def can_query_with_include(relation: BaseRelationship) -> bool:
+        """Whether the relationship is retrieved with a single query that
+        can include other relationships."""
+        return not hasattr(relation, "through_model_attr")
+
+    def _estimate(self, relation, parent_rows, parent_distinct):
+        if relation is not None and not relation.many:
+            distinct = max(1.0, parent_distinct / self.sharing)
+            return parent_rows, min(distinct, parent_distinct)
+        return parent_rows * self.fanout, parent_distinct * self.fanout
+
+    @staticmethod
+    def _get_relation(model_class: str, name: str):
+        relationships = ModelRegistry.get_model(model_class).get_relationships()
+        return relationships.get(name, None)
+
+    def _plan_query(self, model_class, name, subtree, rows, distinct, reason):
+        relation = self._get_relation(model_class, name)
+        node = PlanNode(
+            name, model_class, relation, PlanNode.QUERY, distinct, distinct, reason
+        )
+        if relation is None:
+            return node
+        can_include = self.can_query_with_include(relation)
+        for child_name, child_subtree in subtree.items():
+            node.children.append(
+                self._plan_child(
+                    relation.nested,
+                    child_name,
+                    child_subtree,
+                    node.rows,
+                    node.distinct,
+                    can_include,
+                )
+            )
+        return node
+
+    def _plan_child(
+        self, model_class, name, subtree, parent_rows, parent_distinct, can_include
+    ):
+        relation = self._get_relation(model_class, name)
+        rows, distinct = self._estimate(relation, parent_rows, parent_distinct)
+        if relation is None:
+            reason = "unknown relationship"
+        elif not can_include:
+            reason = "parent query cannot include"
+        elif not self.can_include(model_class, relation):
+            reason = "server cannot include"
+        elif rows - distinct > self.request_cost:
+            reason = "{:.0f} duplicated rows cost more than a request".format(
+                rows - distinct
+            )
+        else:
+            node = PlanNode(
+                name,
+                model_class,
+                relation,
+                PlanNode.INCLUDE,
+                rows,
+                distinct,
+                "{:.0f} duplicated rows".format(rows - distinct),
+            )
+            for child_name, child_subtree in subtree.items():
+                node.children.append(
+                    self._plan_child(
+                        relation.nested, child_name, child_subtree, rows, distinct, True
+                    )
+                )
+            return node
+        return self._plan_query(model_class, name, subtree, rows, distinct, reason)
+
+    def plan(
+        self, models: List[ModelBase], relations: Union[str, list, dict]
+    ) -> RetrievePlan:
+        """Plans the retrieval of a relation tree for a list of models.
+
+        :param models: list of models of the same class
+        :param relations: relation tree, as a name, list of names or
+            nested dictionary
+        :return: the plan
+        """
+        relations = normalize_relations(relations)
+        if not models:
+            return RetrievePlan(None, [])
+        model_class = models[0].__class__.__name__
+        roots = []
+        for name, subtree in relations.items():
+            relation = self._get_relation(model_class, name)
+            num_models = float(len(models))
+            if relation is not None and not relation.many:
+                # the query is by id, so the number of distinct refs is known
+                refs = {getattr(m, relation.ref, None) for m in models}
+                refs.discard(None)
+                rows = distinct = float(len(refs))
+            else:
+                rows, distinct = self._estimate(relation, num_models, num_models)
+            roots.append(
+                self._plan_query(model_class, name, subtree, rows, distinct, "root")
+            )
+        return RetrievePlan(model_class, roots)
+
+    def __repr__(self):
+        return "<{}(request_cost={}, fanout={}, sharing={})>".format(
+            self.__class__.__name__, self.request_cost, self.fanout, self.sharing
+        )
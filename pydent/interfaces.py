@@ -31,6 +31,11 @@ Example:
 import json
 from abc import ABC
 from abc import abstractmethod
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from itertools import product
+from typing import AsyncGenerator
 from typing import Generator
 from typing import List
 from typing import Union
@@ -39,6 +44,7 @@ from inflection import pluralize
 from inflection import underscore
 
 from .exceptions import TridentRequestError
+from .find_batch import FindFuture
 from .utils import url_build
 from pydent.marshaller.base import SchemaModel
 from pydent.marshaller.registry import ModelRegistry
@@ -115,31 +121,19 @@ class CRUDInterface(SessionInterface):
             return
         return self._model_controller("delete", table, model_id, None, params)
 
-    def _json_controller(
-        self,
+    @staticmethod
+    def _json_controller_request(
         method,
         model_name,
         model_data,
         record_methods: List[str] = None,
         record_getters: List[str] = None,
     ):
-        """Method for creating, updating, and deleting models using Aquarium's
-        JSON controller.
+        """Builds the url and data of a request to Aquarium's JSON controller.
 
-        :param method: Method name (e.g. "save", "delete")
-        :type method: basestring
-        :param model_name: Model name
-        :type model_name: basestring
-        :param model_data: Additional model and method data
-        :type model_data: dict
-        :param record_methods: Optional 'record_methods' key
-        :type record_methods: dict
-        :param record_getters: Optional 'record_getters' key
-        :type record_getters: dict
-        :return: json formatter response
-        :rtype: basestring
+        :return: tuple of url and json data
+        :rtype: tuple
         """
-
         if record_methods is None:
             record_methods = {}
         if record_getters is None:
@@ -160,16 +154,65 @@ class CRUDInterface(SessionInterface):
             url = "json/" + method
         else:
             url = "json"
+        return url, data
 
-        try:
-            post_response = self.aqhttp.post(url, json_data=data)
-            return post_response
-        except TridentRequestError as err:
-            raise err
+    def _json_controller(
+        self,
+        method,
+        model_name,
+        model_data,
+        record_methods: List[str] = None,
+        record_getters: List[str] = None,
+        coalesce: bool = False,
+    ):
+        """Method for creating, updating, and deleting models using Aquarium's
+        JSON controller.
+
+        .. versionchanged:: 1.0.7
+            Added the `coalesce` argument.
 
-        # TODO: is this code necessary?
-        # result = self.aqhttp.post("json" + method, json_data=data)
-        # return result
+        :param method: Method name (e.g. "save", "delete")
+        :type method: basestring
+        :param model_name: Model name
+        :type model_name: basestring
+        :param model_data: Additional model and method data
+        :type model_data: dict
+        :param record_methods: Optional 'record_methods' key
+        :type record_methods: dict
+        :param record_getters: Optional 'record_getters' key
+        :type record_getters: dict
+        :param coalesce: if True, the request is a read that may share the
+            response of an identical request in flight
+            (see :meth:`AqHTTP.request <pydent.aqhttp.AqHTTP.request>`)
+        :type coalesce: bool
+        :return: json formatter response
+        :rtype: basestring
+        """
+        url, data = self._json_controller_request(
+            method, model_name, model_data, record_methods, record_getters
+        )
+        return self.aqhttp.post(url, json_data=data, coalesce=coalesce)
+
+    async def _json_controller_async(
+        self,
+        method,
+        model_name,
+        model_data,
+        record_methods: List[str] = None,
+        record_getters: List[str] = None,
+        idempotent: bool = None,
+    ):
+        """Asyncio version of :meth:`_json_controller`.
+
+        :param idempotent: if True, the request is a read that may be resent
+            if a kept-alive connection was closed by the server
+        """
+        url, data = self._json_controller_request(
+            method, model_name, model_data, record_methods, record_getters
+        )
+        return await self.aqhttp.async_http.post(
+            url, json_data=data, idempotent=idempotent
+        )
 
     def json_delete(
         self,
@@ -200,8 +243,35 @@ class CRUDInterface(SessionInterface):
         record_methods: List[str] = None,
         record_getters: List[str] = None,
     ):
+        """Queries models using Aquarium's JSON controller. Identical queries
+        made at the same time from different threads share a single request.
+
+        .. versionchanged:: 1.0.7
+            Concurrent identical queries are coalesced.
+        """
         return self._json_controller(
-            None, model_name, model_data, record_methods, record_getters
+            None,
+            model_name,
+            model_data,
+            record_methods,
+            record_getters,
+            coalesce=True,
+        )
+
+    async def json_post_async(
+        self,
+        model_name,
+        model_data,
+        record_methods: List[str] = None,
+        record_getters: List[str] = None,
+    ):
+        return await self._json_controller_async(
+            None,
+            model_name,
+            model_data,
+            record_methods,
+            record_getters,
+            idempotent=True,
         )
 
 
@@ -409,6 +479,22 @@ class QueryInterfaceABC(ABC):
     def find(self, mid):
         pass
 
+    def find_later(self, model_id) -> "FindFuture":
+        """Finds a model by id in the open find batch of the session (see
+        :meth:`AqSession.batch <pydent.aqsession.AqSession.batch>`). The
+        finds of a batch are retrieved together, with one query per model.
+        Outside of a find batch, the model is found immediately.
+
+        .. versionadded:: 1.0.7
+
+        :param model_id: id of the model
+        :return: the future of the find. Use `result()` to get the model.
+        """
+        batch = self.session._find_batch
+        if batch is None:
+            return FindFuture.resolved(self.model_name, model_id, self.find(model_id))
+        return batch.find(self.model_name, model_id)
+
     @abstractmethod
     def find_by_name(self, name):
         pass
@@ -451,6 +537,23 @@ class QueryInterface(SessionInterface, QueryInterfaceABC):
     DEFAULT_OFFSET = -1
     DEFAULT_REVERSE = False
     DEFAULT_LIMIT = -1
+    KEYSET_PAGE_SIZE = 1000
+    #: max number of values of a list in a ``where`` query (see :meth:`where`)
+    IN_CHUNK_SIZE = 1000
+    #: number of chunks of a ``where`` query requested concurrently
+    IN_CHUNK_WORKERS = 4
+    #: if True, ``all`` requests the models of `KEYSET_MODELS` in keyset pages
+    KEYSET_ALL = True
+    #: models of large tables for which ``all`` uses keyset pagination
+    KEYSET_MODELS = [
+        "DataAssociation",
+        "FieldValue",
+        "Item",
+        "Operation",
+        "PartAssociation",
+        "Sample",
+        "Wire",
+    ]
 
     def __init__(self, model_name, aqhttp, session):
         """Instantiates a new model interface. Uses aqhttp to make requests,
@@ -497,24 +600,47 @@ class QueryInterface(SessionInterface, QueryInterfaceABC):
                     )
         return query
 
+    def _post_data(self, data):
+        """Builds the json request data for this interface."""
+        data_dict = {"model": self.model_name}
+        data_dict = self._prepost_query_hook(data_dict)
+        data_dict.update({k: v for k, v in data.items() if v})
+        return data_dict
+
     def _post_json(self, data):
         """Posts a json request to session for this interface.
 
         Attaches raw json and this session instance to the models it
         retrieves.
         """
-        data_dict = {"model": self.model_name}
-        data_dict = self._prepost_query_hook(data_dict)
-        data_dict.update({k: v for k, v in data.items() if v})
+        return self._load_post_response(self._post_json_raw(data))
+
+    def _post_json_raw(self, data):
+        """Posts a json request to session for this interface and returns the
+        decoded json response without loading models (None if the server
+        returns 422)."""
+        try:
+            return self.crud.json_post(self.model_name, self._post_data(data))
+        except TridentRequestError as err:
+            if err.response.status_code == 422:
+                return None
+            else:
+                raise err
 
+    async def _post_json_async(self, data):
+        """Asyncio version of :meth:`_post_json`."""
         try:
-            post_response = self.crud.json_post(self.model_name, data_dict)
+            post_response = await self.crud.json_post_async(
+                self.model_name, self._post_data(data)
+            )
         except TridentRequestError as err:
             if err.response.status_code == 422:
                 return None
             else:
                 raise err
+        return self._load_post_response(post_response)
 
+    def _load_post_response(self, post_response):
         if post_response is not None and self._do_load:
             return self.load(post_response)
         return post_response
@@ -538,13 +664,30 @@ class QueryInterface(SessionInterface, QueryInterfaceABC):
             raise err
         return self.load(response)
 
-    def find(self, model_id, include=None, opts: dict = None):
-        """Finds model by id."""
+    @staticmethod
+    def _find_data(model_id, include=None, opts: dict = None):
         if model_id is None:
             raise ValueError("model_id in 'find' cannot be None")
         if model_id == 0:
             return None
-        return self._post_json({"id": model_id, "include": include, "options": opts})
+        return {"id": model_id, "include": include, "options": opts}
+
+    def find(self, model_id, include=None, opts: dict = None):
+        """Finds model by id."""
+        data = self._find_data(model_id, include=include, opts=opts)
+        if data is None:
+            return None
+        return self._post_json(data)
+
+    async def find_async(self, model_id, include=None, opts: dict = None):
+        """Finds model by id. Asyncio version of :meth:`find`.
+
+        .. versionadded:: 1.0.7
+        """
+        data = self._find_data(model_id, include=include, opts=opts)
+        if data is None:
+            return None
+        return await self._post_json_async(data)
 
     def find_by_name(self, name, include=None, opts: dict = None):
         """Finds model by name."""
@@ -561,8 +704,13 @@ class QueryInterface(SessionInterface, QueryInterfaceABC):
             }
         )
 
-    def array_query(self, method, args, rest=None, include=None, opts: dict = None):
-        """Finds models based on a query."""
+    def _array_query_data(
+        self, method, args, rest=None, include=None, opts: dict = None
+    ):
+        """Builds the json data for an array query.
+
+        Returns None if the query is known to return no models.
+        """
         if opts is None:
             opts = {}
         options = {
@@ -572,7 +720,7 @@ class QueryInterface(SessionInterface, QueryInterfaceABC):
         }
         options.update(opts)
         if options.get("limit", None) == 0:
-            return []
+            return None
         if args is None:
             args = []
         query = {
@@ -584,33 +732,106 @@ class QueryInterface(SessionInterface, QueryInterfaceABC):
         }
         if rest:
             query.update(rest)
+        return query
+
+    def array_query(self, method, args, rest=None, include=None, opts: dict = None):
+        """Finds models based on a query."""
+        query = self._array_query_data(method, args, rest, include, opts)
+        if query is None:
+            return []
         res = self._post_json(query)
         if res is None:
             return []
         return res
 
-    def all(self, methods: List[str] = None, include=None, opts: dict = None):
+    async def array_query_async(
+        self, method, args, rest=None, include=None, opts: dict = None
+    ):
+        """Finds models based on a query. Asyncio version of
+        :meth:`array_query`."""
+        query = self._array_query_data(method, args, rest, include, opts)
+        if query is None:
+            return []
+        res = await self._post_json_async(query)
+        if res is None:
+            return []
+        return res
+
+    def _all_opts(self, opts: dict = None):
+        if opts is None:
+            opts = {}
+        addopts = opts.pop("opts", dict())
+        opts.update(addopts)
+        options = {"offset": self.DEFAULT_OFFSET, "reverse": self.DEFAULT_REVERSE}
+        options.update(opts)
+        return options
+
+    def all(
+        self,
+        methods: List[str] = None,
+        include=None,
+        opts: dict = None,
+        page_size: int = None,
+    ):
         """Finds all models.
 
+        .. versionchanged:: 1.0.7
+            Added 'page_size'. Models of large tables (see `KEYSET_MODELS`)
+            are requested with `where` queries in pages of `KEYSET_PAGE_SIZE`
+            using keyset pagination, unless the 'limit' or 'offset' options
+            are provided or `KEYSET_ALL` is False. Other models are requested
+            with a single `all` query.
+
         :param methods:
         :param include:
         :type include:
         :param opts: additional options ("offset", "limit", "reverse", etc.)
         :type opts: dict
+        :param page_size: if provided, request the models in pages of this size
+            using keyset pagination
         :return:
         :rtype:
         """
-
-        if opts is None:
-            opts = {}
-        addopts = opts.pop("opts", dict())
-        opts.update(addopts)
-        options = {"offset": self.DEFAULT_OFFSET, "reverse": self.DEFAULT_REVERSE}
-        options.update(opts)
+        options = self._all_opts(opts)
+        if page_size is None and self._use_keyset(options):
+            page_size = self.KEYSET_PAGE_SIZE
+        if page_size is not None:
+            models = []
+            for page in self.pagination(
+                {},
+                page_size=page_size,
+                include=include,
+                opts=options,
+                strategy="keyset",
+            ):
+                models += page
+            return models
         return self.array_query(
             method="all", args=None, rest=None, include=include, opts=options
         )
 
+    def _use_keyset(self, options: dict) -> bool:
+        if not self.KEYSET_ALL:
+            return False
+        return self.model_name in self.KEYSET_MODELS and all(
+            options.get(k, -1) in [None, -1] for k in ["limit", "offset"]
+        )
+
+    async def all_async(
+        self, methods: List[str] = None, include=None, opts: dict = None
+    ):
+        """Finds all models. Asyncio version of :meth:`all`.
+
+        .. versionadded:: 1.0.7
+        """
+        return await self.array_query_async(
+            method="all",
+            args=None,
+            rest=None,
+            include=include,
+            opts=self._all_opts(opts),
+        )
+
     def where(
         self,
         criteria: dict,
@@ -618,9 +839,20 @@ class QueryInterface(SessionInterface, QueryInterfaceABC):
         include: List[str] = None,
         page_size: int = None,
         opts: dict = None,
+        prefetch: int = None,
+        chunk_size: int = None,
     ):
         """Performs a query for models.
 
+        .. versionchanged:: 1.0.7
+            Added 'prefetch' to request pages concurrently. Queries with
+            lists of more than `chunk_size` values are split into chunks
+            (see :meth:`_in_chunks`), which are requested concurrently. The
+            models of the chunks are sorted by id (in reverse if the
+            'reverse' option is set), unless an 'order' option other than
+            by id is given, in which case they are kept in the order of the
+            chunks.
+
         :param criteria: query to find models
         :type criteria: dict
         :param methods: server side methods to implement
@@ -628,9 +860,30 @@ class QueryInterface(SessionInterface, QueryInterfaceABC):
         :param opts: additional options ("offset", "limit", "reverse", etc.)
         :type opts: dict
         :param include:
+        :param page_size: if provided, request models in pages of this size
+        :param prefetch: number of pages to keep in flight (see
+            :meth:`pagination`)
+        :param chunk_size: max number of values of a list per request
+            (default: `IN_CHUNK_SIZE`). If 0, the query is not chunked.
         :return: list of models
         :rtype: list
         """
+        chunks = self._in_chunks(criteria, opts, chunk_size)
+        if chunks is not None:
+            return self._where_chunks(
+                chunks,
+                lambda chunk: self.where(
+                    chunk,
+                    methods=methods,
+                    include=include,
+                    page_size=page_size,
+                    opts=None if opts is None else dict(opts),
+                    prefetch=prefetch,
+                    chunk_size=0,
+                ),
+                lambda model: model.id,
+                opts,
+            )
         if page_size is not None:
             results = []
             for page in self.pagination(
@@ -639,6 +892,7 @@ class QueryInterface(SessionInterface, QueryInterfaceABC):
                 methods=methods,
                 include=include,
                 opts=opts,
+                prefetch=prefetch,
             ):
                 results += page
             return results
@@ -651,6 +905,231 @@ class QueryInterface(SessionInterface, QueryInterfaceABC):
             method="where", args=criteria, rest=rest, include=include, opts=opts
         )
 
+    def where_raw(
+        self,
+        criteria: dict,
+        methods: List[str] = None,
+        include: List[str] = None,
+        page_size: int = None,
+        opts: dict = None,
+        prefetch: int = None,
+        chunk_size: int = None,
+    ) -> List[dict]:
+        """Performs a query for the decoded json rows of models. Unlike
+        :meth:`where`, no models are instantiated, which is much cheaper for
+        exports that only need plain dictionaries.
+
+        .. code-block:: python
+
+            rows = session.Item.where_raw({"object_type_id": 1}, page_size=1000)
+
+        .. versionadded:: 1.0.7
+
+        :param criteria: query to find models
+        :type criteria: dict
+        :param methods: server side methods to implement
+        :type methods: list
+        :param include: relationships to include
+        :param page_size: if provided, request rows in pages of this size
+        :param opts: additional options ("offset", "limit", "reverse", etc.)
+        :type opts: dict
+        :param prefetch: number of pages to keep in flight (see
+            :meth:`pagination`)
+        :param chunk_size: max number of values of a list per request
+            (see :meth:`where`)
+        :return: list of rows
+        :rtype: list
+        """
+        chunks = self._in_chunks(criteria, opts, chunk_size)
+        if chunks is not None:
+            return self._where_chunks(
+                chunks,
+                lambda chunk: self.where_raw(
+                    chunk,
+                    methods=methods,
+                    include=include,
+                    page_size=page_size,
+                    opts=None if opts is None else dict(opts),
+                    prefetch=prefetch,
+                    chunk_size=0,
+                ),
+                lambda row: row.get("id", None),
+                opts,
+            )
+        if page_size is not None:
+            rows = []
+            for page in self.pagination(
+                criteria,
+                page_size=page_size,
+                methods=methods,
+                include=include,
+                opts=opts,
+                prefetch=prefetch,
+                raw=True,
+            ):
+                rows += page
+            return rows
+        rest = {}
+        if methods is not None:
+            rest = {"methods": methods}
+        query = self._array_query_data("where", criteria, rest, include, opts)
+        if query is None:
+            return []
+        rows = self._post_json_raw(query)
+        if rows is None:
+            return []
+        return rows
+
+    def _in_chunks(
+        self, criteria: Union[dict, str], opts: dict, chunk_size: int = None
+    ) -> Union[None, List[dict]]:
+        """Splits a query with lists of more than `chunk_size` values into
+        queries (chunks) with at most `chunk_size` values per list. Every
+        list longer than `chunk_size` is split (dropping its duplicated
+        values) and there is a chunk for every combination of the parts of
+        the split lists. The other values of the query are the same in every
+        chunk.
+
+        Queries with an offset or a limit are not chunked, as the chunks
+        cannot preserve them.
+
+        .. versionadded:: 1.0.7
+
+        :param criteria: the query
+        :param opts: the query options
+        :param chunk_size: max number of values per chunk (default:
+            `IN_CHUNK_SIZE`). If 0 or None, the query is not chunked.
+        :return: list of chunks, or None if the query is not chunked
+        """
+        if chunk_size is None:
+            chunk_size = self.IN_CHUNK_SIZE
+        if not chunk_size or not isinstance(criteria, dict):
+            return None
+        if opts and (
+            opts.get("limit", -1) not in (None, -1)
+            or opts.get("offset", -1) not in (None, -1)
+        ):
+            return None
+        parts = {}
+        for key, values in criteria.items():
+            if not isinstance(values, list) or len(values) <= chunk_size:
+                continue
+            try:
+                values = list(dict.fromkeys(values))
+            except TypeError:
+                continue
+            if len(values) > chunk_size:
+                parts[key] = [
+                    values[i : i + chunk_size]
+                    for i in range(0, len(values), chunk_size)
+                ]
+        if not parts:
+            return None
+        chunks = []
+        for combination in product(*parts.values()):
+            chunk = dict(criteria)
+            chunk.update(zip(parts, combination))
+            chunks.append(chunk)
+        return chunks
+
+    def _where_chunks(self, chunks: List[dict], fetch, key, opts: dict = None) -> list:
+        """Requests the chunks of a query (see :meth:`_in_chunks`) using up
+        to `IN_CHUNK_WORKERS` threads. Results are merged keeping the first
+        result of each `key` and sorted by `key` (in reverse if the 'reverse'
+        option is set), which is the order of an unchunked query. If an
+        'order' option other than by id is given, or some results have no
+        key, the results are kept in the order of the chunks."""
+        workers = min(self.IN_CHUNK_WORKERS or 1, len(chunks))
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(fetch, chunks))
+        else:
+            results = [fetch(chunk) for chunk in chunks]
+        merged = []
+        seen = set()
+        for result in results:
+            for r in result:
+                k = key(r)
+                if k is None:
+                    merged.append(r)
+                elif k not in seen:
+                    seen.add(k)
+                    merged.append(r)
+        options = {"reverse": self.DEFAULT_REVERSE}
+        options.update(opts or {})
+        order = str(options.get("order", None) or "id").lower().split() or ["id"]
+        if len(seen) == len(merged) and order[0] == "id":
+            reverse = bool(options["reverse"]) != (order[-1] == "desc")
+            merged.sort(key=key, reverse=reverse)
+        return merged
+
+    def _where_page(
+        self,
+        query: dict,
+        methods: List[str],
+        include: List[str],
+        opts: dict,
+        raw: bool = False,
+    ) -> list:
+        if raw:
+            return self.where_raw(query, methods=methods, include=include, opts=opts)
+        return self.where(query, methods=methods, include=include, opts=opts)
+
+    async def where_async(
+        self,
+        criteria: dict,
+        methods: List[str] = None,
+        include: List[str] = None,
+        page_size: int = None,
+        opts: dict = None,
+    ):
+        """Performs a query for models. Asyncio version of :meth:`where`.
+
+        .. code-block:: python
+
+            samples = await session.Sample.where_async({"sample_type_id": 1})
+
+        .. versionadded:: 1.0.7
+
+        :param criteria: query to find models
+        :type criteria: dict
+        :param methods: server side methods to implement
+        :type methods: list
+        :param opts: additional options ("offset", "limit", "reverse", etc.)
+        :type opts: dict
+        :param include:
+        :return: list of models
+        :rtype: list
+        """
+        if page_size is not None:
+            results = []
+            async for page in self.pagination_async(
+                criteria,
+                page_size=page_size,
+                methods=methods,
+                include=include,
+                opts=opts,
+            ):
+                results += page
+            return results
+        if opts is None:
+            opts = dict()
+        rest = {}
+        if methods is not None:
+            rest = {"methods": methods}
+        return await self.array_query_async(
+            method="where", args=criteria, rest=rest, include=include, opts=opts
+        )
+
+    @staticmethod
+    def _limit_opts(num: int, opts: dict, reverse: bool):
+        if num is None:
+            num = 1
+        if opts is None:
+            opts = dict()
+        opts.update(dict(limit=num, reverse=reverse))
+        return opts
+
     # TODO: Refactor 'last' so query is an argument, not part of kwargs
     def last(
         self, num: int = None, query: dict = None, include=None, opts: dict = None
@@ -668,13 +1147,18 @@ class QueryInterface(SessionInterface, QueryInterfaceABC):
         """
         if query is None:
             query = dict()
-        if num is None:
-            num = 1
-        if opts is None:
-            opts = dict()
-        opts.update(dict(limit=num, reverse=True))
+        opts = self._limit_opts(num, opts, reverse=True)
         return self.where(query, include=include, opts=opts)
 
+    async def last_async(
+        self, num: int = None, query: dict = None, include=None, opts: dict = None
+    ):
+        """Find the last added models. Asyncio version of :meth:`last`."""
+        if query is None:
+            query = dict()
+        opts = self._limit_opts(num, opts, reverse=True)
+        return await self.where_async(query, include=include, opts=opts)
+
     # TODO: Refactor 'first' so query is an argument, not part of kwargs
     def first(
         self, num: int = None, query: dict = None, include=None, opts: dict = None
@@ -693,13 +1177,18 @@ class QueryInterface(SessionInterface, QueryInterfaceABC):
         """
         if query is None:
             query = dict()
-        if num is None:
-            num = 1
-        if opts is None:
-            opts = dict()
-        opts.update(dict(limit=num, reverse=False))
+        opts = self._limit_opts(num, opts, reverse=False)
         return self.where(query, include=include, opts=opts)
 
+    async def first_async(
+        self, num: int = None, query: dict = None, include=None, opts: dict = None
+    ):
+        """Find the first added models. Asyncio version of :meth:`first`."""
+        if query is None:
+            query = dict()
+        opts = self._limit_opts(num, opts, reverse=False)
+        return await self.where_async(query, include=include, opts=opts)
+
     # TODO: Refactor 'one' so query is an argument, not part of kwargs
     def one(
         self, query: dict = None, first: bool = False, include=None, opts: dict = None
@@ -721,6 +1210,22 @@ class QueryInterface(SessionInterface, QueryInterfaceABC):
         else:
             return res[0]
 
+    async def one_async(
+        self, query: dict = None, first: bool = False, include=None, opts: dict = None
+    ):
+        """Return one model. Asyncio version of :meth:`one`.
+
+        .. versionadded:: 1.0.7
+        """
+        if not first:
+            res = await self.last_async(1, query=query, include=include, opts=opts)
+        else:
+            res = await self.first_async(1, query=query, include=include, opts=opts)
+        if not res:
+            return None
+        else:
+            return res[0]
+
     # TODO: implement 'patch' or 'update'? Would this be too dangerous?
     # def patch(self, model_id, json_data):
     #     """
@@ -731,6 +1236,20 @@ class QueryInterface(SessionInterface, QueryInterfaceABC):
     #         model_id=model_id, models=models_name), json_data=json_data)
     #     return result
 
+    @staticmethod
+    def _pages(page_size: int, opts: dict) -> Generator[dict, None, None]:
+        """Generates the options of each page of a paginated query."""
+        limit = opts.get("limit", -1)
+        n = 0
+        while n < limit or limit == -1:
+            _opts = dict(opts)
+            _opts["limit"] = page_size
+            if limit >= 0:
+                _opts["limit"] = min(page_size, limit - n)
+            _opts["offset"] = n
+            n += _opts["limit"]
+            yield _opts
+
     def pagination(
         self,
         query: dict,
@@ -738,34 +1257,336 @@ class QueryInterface(SessionInterface, QueryInterfaceABC):
         methods: List[str] = None,
         include: List[str] = None,
         opts: dict = None,
+        prefetch: int = None,
+        strategy: str = "offset",
+        raw: bool = False,
     ) -> Generator[list, None, None]:
         """Return pagination query (as a generator).
 
+        .. versionchanged:: 1.0.7
+            Stops after the first page with fewer models than requested.
+            Added 'prefetch' to request pages concurrently, 'strategy' to
+            page by id instead of by offset and 'raw' to yield json rows.
+
+        With the "offset" strategy, each page is requested by offset and
+        limit, which requires the database to scan and discard all earlier
+        rows. With the "keyset" strategy, each page is requested by the
+        models with ids after the last id of the previous page (see
+        :meth:`_keyset_query`), so each page is an index range scan. Keyset
+        pages depend on the previous page and cannot be prefetched.
+
         :param interface: SessionInterface
         :param query: query
         :param page_size: number of models to return per page
         :param limit: total number of models to return
         :param opts: additional options
+        :param prefetch: if provided, the number of pages to keep in flight
+            in a thread pool. Pages are still yielded in order.
+        :param strategy: either "offset" or "keyset"
+        :param raw: if True, yield pages of decoded json rows instead of
+            models (see :meth:`where_raw`)
         :return: generator of list of models
         """
         if opts is None:
             opts = {}
-        limit = opts.get("limit", -1)
-        if limit < page_size and limit >= 0:
-            page_size = limit
+        if strategy == "keyset":
+            if prefetch is not None and prefetch > 1:
+                raise ValueError("Keyset pagination cannot prefetch pages.")
+            self._validate_keyset_query(query)
+            yield from self._keyset_pages(
+                query, page_size, methods, include, opts, raw=raw
+            )
+            return
+        elif strategy != "offset":
+            raise ValueError(
+                "Pagination strategy must be 'offset' or 'keyset', not '{}'".format(
+                    strategy
+                )
+            )
+        pages = self._pages(page_size, opts)
+        if prefetch is not None and prefetch > 1:
+            yield from self._prefetch_pages(
+                query, pages, methods, include, prefetch, raw=raw
+            )
+            return
+        for _opts in pages:
+            models = self._where_page(query, methods, include, _opts, raw)
+            if not models:
+                return
+            yield models
+            if len(models) < _opts["limit"]:
+                return
+
+    def _prefetch_pages(
+        self,
+        query: dict,
+        pages: Generator[dict, None, None],
+        methods: List[str],
+        include: List[str],
+        prefetch: int,
+        raw: bool = False,
+    ) -> Generator[list, None, None]:
+        """Yields pages in order while keeping up to `prefetch` page requests
+        in flight."""
+
+        def fetch(_opts):
+            return self._where_page(query, methods, include, _opts, raw)
+
+        executor = ThreadPoolExecutor(max_workers=prefetch)
+        in_flight = deque()
+        try:
+            for _opts in islice(pages, prefetch):
+                in_flight.append((_opts, executor.submit(fetch, _opts)))
+            while in_flight:
+                _opts, future = in_flight.popleft()
+                models = future.result()
+                if not models:
+                    return
+                for _next_opts in islice(pages, 1):
+                    in_flight.append((_next_opts, executor.submit(fetch, _next_opts)))
+                yield models
+                if len(models) < _opts["limit"]:
+                    return
+        finally:
+            for _, future in in_flight:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+    @staticmethod
+    def _validate_keyset_query(query: Union[dict, str]):
+        """Raises a ValueError if the pages after the first page of a keyset
+        pagination of the query could match other models than the query.
+
+        Those pages are requested with a sql query (see
+        :meth:`_keyset_query`) in which every value is quoted, so only
+        numbers and strings (or lists of them) are preserved.
+        """
+        if not isinstance(query, dict):
+            return
+        for k, v in query.items():
+            values = v if isinstance(v, (list, tuple, set)) else [v]
+            for _v in values:
+                if isinstance(_v, bool) or not isinstance(_v, (int, float, str)):
+                    raise ValueError(
+                        "Keyset pagination cannot page the query value {}={}. "
+                        "Use the 'offset' strategy instead.".format(k, repr(v))
+                    )
+
+    @staticmethod
+    def _keyset_query(query: Union[dict, str], last_id: int, reverse: bool):
+        """Returns the sql query for the models of the query with ids after
+        (or before, if reversed) `last_id`."""
+        from pydent.aql import QueryBuilder
+
+        op = QueryBuilder.Lt if reverse else QueryBuilder.Gt
+        keyset = QueryBuilder.sql({"id": op(last_id)})
+        if isinstance(query, str):
+            return "( {} ){}{}".format(query, QueryBuilder.AND, keyset)
+        elif query:
+            return QueryBuilder.AND.join([QueryBuilder.sql(query), keyset])
+        return keyset
+
+    def _keyset_pages(
+        self,
+        query: Union[dict, str],
+        page_size: int,
+        methods: List[str],
+        include: List[str],
+        opts: dict,
+        raw: bool = False,
+    ) -> Generator[list, None, None]:
+        opts = dict(opts)
+        limit = opts.pop("limit", -1)
+        opts.pop("offset", None)
+        reverse = opts.get("reverse", False)
+        page_query = query
         n = 0
-        if opts:
-            _opts = dict(opts)
-        else:
-            _opts = {}
         while n < limit or limit == -1:
+            _opts = dict(opts)
             _opts["limit"] = page_size
-            _opts["offset"] = n
-            models = self.where(query, methods=methods, include=include, opts=_opts)
+            if limit >= 0:
+                _opts["limit"] = min(page_size, limit - n)
+            models = self._where_page(page_query, methods, include, _opts, raw)
             if not models:
                 return
+            yield models
             n += len(models)
+            if len(models) < _opts["limit"]:
+                return
+            if raw:
+                ids = [row["id"] for row in models]
+            else:
+                ids = [m.id for m in models]
+            last_id = min(ids) if reverse else max(ids)
+            page_query = self._keyset_query(query, last_id, reverse)
+
+    def iter_where(
+        self,
+        query: dict,
+        page_size: int,
+        methods: List[str] = None,
+        include: List[str] = None,
+        opts: dict = None,
+        prefetch: int = 4,
+        strategy: str = "offset",
+    ) -> Generator[SchemaModel, None, None]:
+        """Streams the models of a query, requesting pages of `page_size`
+        models with up to `prefetch` pages in flight. Models are yielded in
+        order, so memory is bounded by `prefetch * page_size` models rather
+        than the full result.
+
+        .. code-block:: python
+
+            for sample in session.Sample.iter_where({}, page_size=100):
+                print(sample.name)
+
+        .. versionadded:: 1.0.7
+
+        :param query: query
+        :param page_size: number of models to request per page
+        :param methods: server side methods to implement
+        :param include: relationships to include
+        :param opts: additional options ("limit", "reverse", etc.)
+        :param prefetch: number of pages to keep in flight (ignored for the
+            "keyset" strategy)
+        :param strategy: pagination strategy, "offset" or "keyset" (see
+            :meth:`pagination`)
+        :return: generator of models
+        """
+        if strategy == "keyset":
+            prefetch = None
+        for page in self.pagination(
+            query,
+            page_size=page_size,
+            methods=methods,
+            include=include,
+            opts=opts,
+            prefetch=prefetch,
+            strategy=strategy,
+        ):
+            yield from page
+
+    def iter_raw(
+        self,
+        query: dict,
+        page_size: int,
+        methods: List[str] = None,
+        include: List[str] = None,
+        opts: dict = None,
+        prefetch: int = 4,
+        strategy: str = "offset",
+    ) -> Generator[dict, None, None]:
+        """Streams the decoded json rows of a query. Same as
+        :meth:`iter_where`, but no models are instantiated.
+
+        .. code-block:: python
+
+            for row in session.Item.iter_raw({}, page_size=1000):
+                print(row["id"])
+
+        .. versionadded:: 1.0.7
+
+        :param query: query
+        :param page_size: number of rows to request per page
+        :param methods: server side methods to implement
+        :param include: relationships to include
+        :param opts: additional options ("limit", "reverse", etc.)
+        :param prefetch: number of pages to keep in flight (ignored for the
+            "keyset" strategy)
+        :param strategy: pagination strategy, "offset" or "keyset" (see
+            :meth:`pagination`)
+        :return: generator of rows
+        """
+        if strategy == "keyset":
+            prefetch = None
+        for page in self.pagination(
+            query,
+            page_size=page_size,
+            methods=methods,
+            include=include,
+            opts=opts,
+            prefetch=prefetch,
+            strategy=strategy,
+            raw=True,
+        ):
+            yield from page
+
+    def write_ndjson(
+        self,
+        fp,
+        query: dict,
+        page_size: int,
+        methods: List[str] = None,
+        include: List[str] = None,
+        opts: dict = None,
+        prefetch: int = 4,
+        strategy: str = "offset",
+    ) -> int:
+        """Writes the json rows of a query to a text file, one row per line
+        (newline delimited json). Rows are written page by page as they
+        arrive, so memory is bounded as for :meth:`iter_raw`.
+
+        .. code-block:: python
+
+            with open("items.ndjson", "w") as f:
+                session.Item.write_ndjson(f, {}, page_size=1000)
+
+        .. versionadded:: 1.0.7
+
+        :param fp: text file-like object to write to
+        :param query: query
+        :param page_size: number of rows to request per page
+        :param methods: server side methods to implement
+        :param include: relationships to include
+        :param opts: additional options ("limit", "reverse", etc.)
+        :param prefetch: number of pages to keep in flight (ignored for the
+            "keyset" strategy)
+        :param strategy: pagination strategy, "offset" or "keyset" (see
+            :meth:`pagination`)
+        :return: number of rows written
+        """
+        if strategy == "keyset":
+            prefetch = None
+        num_rows = 0
+        dumps = json.JSONEncoder().encode
+        for page in self.pagination(
+            query,
+            page_size=page_size,
+            methods=methods,
+            include=include,
+            opts=opts,
+            prefetch=prefetch,
+            strategy=strategy,
+            raw=True,
+        ):
+            fp.write("".join([dumps(row) + "\n" for row in page]))
+            num_rows += len(page)
+        return num_rows
+
+    async def pagination_async(
+        self,
+        query: dict,
+        page_size: int,
+        methods: List[str] = None,
+        include: List[str] = None,
+        opts: dict = None,
+    ) -> AsyncGenerator[list, None]:
+        """Return pagination query (as an asynchronous generator). Asyncio
+        version of :meth:`pagination`.
+
+        .. versionadded:: 1.0.7
+        """
+        if opts is None:
+            opts = {}
+        for _opts in self._pages(page_size, opts):
+            models = await self.where_async(
+                query, methods=methods, include=include, opts=_opts
+            )
+            if not models:
+                return
             yield models
+            if len(models) < _opts["limit"]:
+                return
 
     def new(self, *args, **kwargs):
         """Creates a new model instance.
@@ -806,6 +1627,9 @@ class BrowserInterface(SessionInterface, QueryInterfaceABC):
     def find(self, model_id):
         return self.browser.find(model_id, model_class=self.model_name)
 
+    async def find_async(self, model_id):
+        return await self.browser.find_async(model_id, model_class=self.model_name)
+
     def find_by_name(self, name):
         return self.browser.find_by_name(
             name, model_class=self.model_name, primary_key="name"
@@ -826,6 +1650,21 @@ class BrowserInterface(SessionInterface, QueryInterfaceABC):
             page_size=page_size,
         )
 
+    async def where_async(
+        self,
+        criteria,
+        methods: List[str] = None,
+        page_size: int = None,
+        opts: dict = None,
+    ):
+        return await self.browser.where_async(
+            criteria,
+            model_class=self.model_name,
+            methods=methods,
+            opts=opts,
+            page_size=page_size,
+        )
+
     def one(self, query: dict = None, first: bool = False, opts: dict = None):
         return self.browser.one(model_class=self.model_name, query=query, opts=opts)
 
@@ -844,6 +1683,16 @@ class BrowserInterface(SessionInterface, QueryInterfaceABC):
     def all(self, opts: dict = None):
         return self.browser.all(model_class=self.model_name, opts=opts)
 
+    async def one_async(
+        self, query: dict = None, first: bool = False, opts: dict = None
+    ):
+        return await self.browser.one_async(
+            model_class=self.model_name, query=query, opts=opts
+        )
+
+    async def all_async(self, opts: dict = None):
+        return await self.browser.all_async(model_class=self.model_name, opts=opts)
+
     # TODO: load_from using new session
     def load(self, post_response: dict) -> List[SchemaModel]:
         """Loads model instance(s) from data.
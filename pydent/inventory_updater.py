@@ -1,5 +1,9 @@
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from typing import Iterable
 from typing import List
+from typing import Set
 from typing import Union
 
 import networkx as nx
@@ -15,6 +19,12 @@ from pydent.sessionabc import SessionABC
 VALID_INVENTORY_TYPES = [Sample, Item, Plan, Collection]
 InventoryType = Union[Item, Sample, Collection, Plan]
 
+MAX_WORKERS = 8  #: default number of concurrent saves in a level
+
+#: Models saved at one topological depth of the inventory graph and the
+#: seconds it took to save them.
+InventoryLevel = namedtuple("InventoryLevel", ["depth", "models", "seconds"])
+
 
 def to_node(model):
     key = model.id or model._primary_key
@@ -43,7 +53,7 @@ def is_inventory_type(m):
 
 
 def _handle_sample(
-    g: nx.DiGraph, m: InventoryType, to_visit: List[InventoryType], visited: List[str]
+    g: nx.DiGraph, m: InventoryType, to_visit: List[InventoryType], visited: Set[str]
 ):
     if m.is_deserialized("field_values"):
         for fv in m.field_values:
@@ -107,13 +117,13 @@ def models_to_graph(session: SessionABC, models: Iterable[InventoryType]) -> nx.
             add_node(graph, m)
 
         to_visit = models[:]
-        visited = []
+        visited = set()
         while to_visit:
             m = to_visit.pop()
             if to_node(m) in visited:
                 continue
             else:
-                visited.append(to_node(m))
+                visited.add(to_node(m))
             cls = m.__class__.__name__
             if isinstance(m, Item):
                 _handle_item(graph, m, to_visit)
@@ -130,25 +140,122 @@ def models_to_graph(session: SessionABC, models: Iterable[InventoryType]) -> nx.
     return graph
 
 
+def inventory_levels(graph: nx.DiGraph) -> List[List[InventoryType]]:
+    """Groups the models of an inventory graph (see :func:`models_to_graph`)
+    by topological depth. The dependencies of every model are in an earlier
+    level, so the models within a level can be saved independently.
+
+    .. versionadded:: 1.0.7
+
+    :param graph: the inventory graph
+    :return: list of levels of models
+    """
+    # edges point from a model to its dependencies
+    num_dependencies = {n: graph.out_degree(n) for n in graph}
+    level = [n for n, d in num_dependencies.items() if d == 0]
+    levels = []
+    while level:
+        levels.append([graph.nodes[n]["model"] for n in level])
+        next_level = []
+        for n in level:
+            for dependent in graph.predecessors(n):
+                num_dependencies[dependent] -= 1
+                if num_dependencies[dependent] == 0:
+                    next_level.append(dependent)
+        level = next_level
+    if sum(len(models) for models in levels) != len(graph):
+        raise nx.NetworkXUnfeasible("Inventory graph contains a cycle.")
+    return levels
+
+
+def _save_model(model: InventoryType, merge_samples: bool):
+    if merge_samples and isinstance(model, Sample):
+        model.merge()
+    else:
+        model.save()
+
+
+def _save_level(
+    session: SessionABC,
+    models: List[InventoryType],
+    merge_samples: bool,
+    max_workers: int,
+):
+    new_samples = []
+    others = []
+    for model in models:
+        if not merge_samples and isinstance(model, Sample):
+            new_samples.append(model)
+        else:
+            others.append(model)
+
+    if new_samples:
+        for sample in new_samples:
+            sample.is_savable(do_raise=True)
+        session.utils.create_samples(new_samples)
+
+    if len(others) == 1 or max_workers <= 1:
+        for model in others:
+            _save_model(model, merge_samples)
+    elif others:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(others))) as pool:
+            futures = [pool.submit(_save_model, m, merge_samples) for m in others]
+            for future in futures:
+                future.result()
+
+
+def save_inventory_levels(
+    session: SessionABC,
+    inventory: List[InventoryType],
+    merge_samples: bool = False,
+    max_workers: int = MAX_WORKERS,
+) -> List[InventoryLevel]:
+    """Saves a list of inventory items to the server, level by level.
+
+    Models are grouped by their topological depth (see
+    :func:`inventory_levels`). All new Samples in a level are created with a
+    single `create_samples` request and the remaining models of the level are
+    saved concurrently.
+
+    .. versionadded:: 1.0.7
+
+    :param session: the AqSession instance
+    :param inventory: list of inventory items
+    :param merge_samples: if True, will merge Samples by name if a sample with
+        the same name already exists. See the :method:`merge_sample_by_name` method.
+    :param max_workers: maximum number of concurrent saves in a level
+    :return: list of the models saved at each level and the time it took
+    """
+    graph = models_to_graph(session, inventory)
+    levels = []
+    for depth, models in enumerate(inventory_levels(graph)):
+        models = [m for m in models if not m.id]
+        if not models:
+            continue
+        t1 = time.time()
+        _save_level(session, models, merge_samples, max_workers)
+        levels.append(InventoryLevel(depth, models, time.time() - t1))
+    return levels
+
+
 def save_inventory(
-    session: SessionABC, inventory: List[InventoryType], merge_samples: bool = False
+    session: SessionABC,
+    inventory: List[InventoryType],
+    merge_samples: bool = False,
+    max_workers: int = MAX_WORKERS,
 ) -> List[InventoryType]:
     """Saves a list of inventory items to the server.
 
+    .. versionchanged:: 1.0.7
+        Independent models are saved together. See
+        :func:`save_inventory_levels`.
+
     :param session: the AqSession instance
     :param inventory: list of inventory items
     :param merge_samples: if True, will merge Samples by name if a sample with
         the same name already exists. See the :method:`merge_sample_by_name` method.
+    :param max_workers: maximum number of concurrent saves in a level
     :return: list of inventory that was saved.
     """
-    graph = models_to_graph(session, inventory)
-    new_inventory = []
-    for n in nx.topological_sort(graph.reverse()):
-        model = graph.nodes[n]["model"]
-        if not model.id:
-            new_inventory.append(model)
-            if merge_samples and isinstance(model, Sample):
-                model.merge()
-            else:
-                model.save()
-    return new_inventory
+    levels = save_inventory_levels(session, inventory, merge_samples, max_workers)
+    return [model for level in levels for model in level.models]
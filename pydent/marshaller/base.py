@@ -1,7 +1,6 @@
 """Model base class."""
 import functools
 import inspect
-from copy import deepcopy
 from typing import Any
 from typing import Dict
 from typing import List
@@ -11,10 +10,10 @@ from typing import Union
 from pydent.marshaller.descriptors import DataAccessor
 from pydent.marshaller.exceptions import SchemaException
 from pydent.marshaller.exceptions import SchemaModelException
-from pydent.marshaller.fields import Callback
 from pydent.marshaller.registry import ModelRegistry
 from pydent.marshaller.schema import DynamicSchema
 from pydent.marshaller.schema import SchemaRegistry
+from pydent.marshaller.utils import copy_json
 
 
 def add_schema(cls):
@@ -134,6 +133,29 @@ class SchemaModel(metaclass=ModelRegistry):
         SchemaModel.__init__(instance, data)
         return instance
 
+    @classmethod
+    def _set_data_many(cls, rows: List[dict]) -> List["SchemaModel"]:
+        """Same as calling :meth:`_set_data` for each row, but the data
+        accessors of all the rows are initialized in a single pass.
+
+        .. versionadded:: 1.0.7
+        """
+        data_key = ModelRegistry._data_key
+        deserialized_key = ModelRegistry._deserialized_key
+        rows = [{} if data is None else data for data in rows]
+        instances = []
+        for data in rows:
+            instance = SchemaModel.__new__(cls)
+            instance.__dict__[data_key] = data
+            instance.__dict__[deserialized_key] = {}
+            instances.append(instance)
+        if instances and not cls.model_schema:
+            # raises the missing schema exception
+            instances[0].add_data(None)
+        if instances:
+            cls.model_schema.init_data_accessors_many(instances, rows)
+        return instances
+
     @staticmethod
     def _keys_to_dict(keys):
         if keys is None:
@@ -152,10 +174,24 @@ class SchemaModel(metaclass=ModelRegistry):
         only: Union[str, List[str], Tuple[str], Dict[str, Any]] = None,
         include: Union[str, List[str], Tuple[str], Dict[str, Any]] = None,
         ignore: Union[str, List[str], Tuple[str], Dict[str, Any]] = None,
+        memo: dict = None,
         **kwargs,
     ) -> dict:
+        """Dumps the object into freshly built containers. Output does not
+        share any mutable data with the object.
+
+        .. versionchanged:: 1.0.7
+            Output is built without copying it afterwards. Models found in
+            `memo` under the same arguments are dumped only once.
+        """
         if not issubclass(type(obj), SchemaModel):
-            return obj
+            return copy_json(obj)
+
+        only_arg, include_arg, ignore_arg = only, include, ignore
+        if memo is not None:
+            memo_key = (id(obj), id(only), id(include), id(ignore))
+            if memo_key in memo:
+                return memo[memo_key][-1]
 
         only = cls._keys_to_dict(only)
         include = cls._keys_to_dict(include)
@@ -165,34 +201,23 @@ class SchemaModel(metaclass=ModelRegistry):
 
         serialized_data = obj._get_data()
 
-        include_and_only = set(include).union(set(only))
+        include_and_only = set(include).union(only)
 
         for fname in include_and_only:
             getattr(obj, fname)
 
-        keys = set(serialized_data.keys())
-        keys = keys.difference(set(ignore))
-        if only:
-            keys = keys.intersection(set(only))
-
-        model_fields = obj.__class__.model_schema.fields
-
-        callback_fields = []
-        always_dump = []
-        for fname, field in model_fields.items():
-            if hasattr(field, "nested") or issubclass(type(field), Callback):
-                callback_fields.append(fname)
-            if getattr(field, "always_dump", None):
-                always_dump.append(fname)
+        model_schema = obj.__class__.model_schema
+        model_fields = model_schema.fields
+        dump_plan = model_schema.dump_plan
+        callback_fields = dump_plan["callbacks"]
 
-        include_and_only = include_and_only.union(set(always_dump))
-        callback_keys = include_and_only.intersection(set(callback_fields))
-        callback_keys = callback_keys.difference(set(ignore))
+        for key, value in serialized_data.items():
+            if key in ignore or key in callback_fields or (only and key not in only):
+                continue
+            data[key] = copy_json(value)
 
-        data_keys = keys.difference(set(callback_fields))
-
-        for key in data_keys:
-            data[key] = serialized_data[key]
+        callback_keys = include_and_only.union(dump_plan["always_dump"])
+        callback_keys = callback_keys.intersection(callback_fields).difference(ignore)
         for key in callback_keys:
             field = model_fields[key]
             val = getattr(obj, key)
@@ -200,14 +225,18 @@ class SchemaModel(metaclass=ModelRegistry):
                 include=include.pop(key, None),
                 only=only.pop(key, None),
                 ignore=ignore.pop(key, None),
+                memo=memo,
             )
             dump_kwargs.update(kwargs)
             dump = functools.partial(cls._dump, **dump_kwargs)
-            if getattr(model_fields[key], "nested", None) and model_fields[key].many:
+            if key in dump_plan["many"]:
                 if isinstance(val, list):
                     data[field.data_key] = [dump(v) for v in val]
             else:
                 data[field.data_key] = dump(val)
+        if memo is not None:
+            # keep the keyed objects alive so that their ids are not reused
+            memo[memo_key] = (obj, only_arg, include_arg, ignore_arg, data)
         return data
 
     def dump(
@@ -218,6 +247,9 @@ class SchemaModel(metaclass=ModelRegistry):
     ) -> dict:
         """Dump/serializes the model to a json-like dictionary.
 
+        .. versionchanged:: 1.0.7
+            The dump is built freshly rather than deep copied.
+
         :param only: restricts dump/serialization to the provided keys
         :type only: basestring|list|tuple|dict
         :param include: include any callback fields in the dump/serialization
@@ -227,7 +259,35 @@ class SchemaModel(metaclass=ModelRegistry):
         :return: the serialized data
         :rtype: dict
         """
-        return deepcopy(self._dump(self, only=only, include=include, ignore=ignore))
+        return self._dump(self, only=only, include=include, ignore=ignore)
+
+    @classmethod
+    def dump_many(
+        cls,
+        models: List["SchemaModel"],
+        only: Union[str, List[str], Tuple[str], Dict[str, Any]] = None,
+        include: Union[str, List[str], Tuple[str], Dict[str, Any]] = None,
+        ignore: Union[str, List[str], Tuple[str], Dict[str, Any]] = None,
+        **kwargs,
+    ) -> List[dict]:
+        """Dumps a list of models. Same as calling :meth:`dump` on each model,
+        except that a model reached several times with the same arguments
+        (for example, a sample shared by many field values) is dumped only
+        once, and its dump is shared in the output.
+
+        .. versionadded:: 1.0.7
+
+        :param models: list of models
+        :param only: restricts dump/serialization to the provided keys
+        :param include: include any callback fields in the dump/serialization
+        :param ignore: ignores fields in the dump/serialization
+        :return: list of serialized data
+        """
+        memo = {}
+        return [
+            cls._dump(m, only=only, include=include, ignore=ignore, memo=memo, **kwargs)
+            for m in models
+        ]
 
     # def __dir__(self):
     #     return ['a']
@@ -14,6 +14,7 @@ class SchemaRegistry(type):
     schemas = {}  # the registry of Schemas instantiated
     _fields = None  # list of fields instantiated
     _model_class = None  # reference to model class the schema is attached to
+    _field_tables = None  # memoized field tables (see `build_field_tables`)
     BASE = "DynamicSchema"
 
     def __init__(cls, name, bases, selfdict):
@@ -41,13 +42,99 @@ class SchemaRegistry(type):
         """Fields grouped by their base classes.
 
         Returns empty list of base class not in fields.
+
+        .. versionchanged:: 1.0.7
+            Grouped fields are memoized. The returned dictionary must not
+            be modified.
+        """
+        return cls.field_tables["grouped"]
+
+    @property
+    def relationships(cls):
+        """Relationship fields (including aliases of relationships), keyed by
+        field name.
+
+        .. versionadded:: 1.0.7
+        """
+        return cls.field_tables["relationships"]
+
+    @property
+    def callbacks(cls):
+        """Callback fields keyed by field name.
+
+        .. versionadded:: 1.0.7
+        """
+        return cls.field_tables["callbacks"]
+
+    @property
+    def dump_plan(cls):
+        """The fields dumped through their callbacks (`callbacks`), the
+        fields always dumped (`always_dump`) and the nested fields dumped as
+        lists (`many`), as frozensets of field names.
+
+        .. versionadded:: 1.0.7
+        """
+        return cls.field_tables["dump"]
+
+    @property
+    def field_tables(cls):
+        """The memoized field tables of the schema.
+
+        .. versionadded:: 1.0.7
+        """
+        if cls._field_tables is None:
+            cls.build_field_tables()
+        return cls._field_tables
+
+    def build_field_tables(cls):
+        """Groups the schema fields by their base classes and builds the
+        relationship and callback tables. Called when the schema is
+        registered to a model class.
+
+        .. versionadded:: 1.0.7
         """
         grouped = defaultdict(dict)
-        for fname, field in cls.fields.items():
+        for fname, field in (cls.fields or {}).items():
             mro = field.__class__.__mro__
             for b in mro[:-2]:
                 grouped[b.__name__][fname] = field
-        return grouped
+        relationships = dict(grouped["Relationship"])
+        for aname, alias_field in grouped["Alias"].items():
+            aliased = relationships.get(alias_field.alias, None)
+            if aliased:
+                relationships[aname] = aliased
+        fields = cls.fields or {}
+        dump_callbacks = frozenset(
+            fname
+            for fname, field in fields.items()
+            if hasattr(field, "nested") or fname in grouped["Callback"]
+        )
+        cls._field_tables = {
+            "grouped": grouped,
+            "relationships": relationships,
+            "callbacks": grouped["Callback"],
+            "dump": {
+                "callbacks": dump_callbacks,
+                "always_dump": frozenset(
+                    fname
+                    for fname, field in fields.items()
+                    if getattr(field, "always_dump", None)
+                ),
+                "many": frozenset(
+                    fname
+                    for fname in dump_callbacks
+                    if getattr(fields[fname], "nested", None) and fields[fname].many
+                ),
+            },
+        }
+
+    def invalidate_field_tables(cls):
+        """Clears the memoized field tables. Must be called if the schema
+        fields are changed after the schema is registered.
+
+        .. versionadded:: 1.0.7
+        """
+        cls._field_tables = None
 
     @staticmethod
     def make_schema_name(name):
@@ -1,5 +1,9 @@
 """Model serialization/deserialization schema."""
 import inspect
+from typing import Any
+from typing import Callable
+from typing import List
+from typing import Tuple
 from typing import Type
 
 from pydent.marshaller.descriptors import DataAccessor
@@ -68,6 +72,102 @@ class DynamicSchema(metaclass=SchemaRegistry):
             except AttributeError as e:
                 raise e
 
+    @classmethod
+    def get_data_accessor(cls, key: str) -> Tuple[Any, bool]:
+        """Returns the class attribute used to set `key` on the model
+        instances and whether it is a plain :class:`DataAccessor` of the
+        serialized data. Missing accessors are installed as in
+        :meth:`init_data_accessors`.
+
+        .. versionadded:: 1.0.7
+
+        :param key: data key
+        :return: tuple of the class attribute and whether it is plain
+        """
+        model_class = cls.model_class
+        if key not in model_class.__dict__:
+            setattr(model_class, key, DataAccessor(key, model_class._data_key))
+        accessor = model_class.__dict__[key]
+        plain = (
+            type(accessor) is DataAccessor
+            and accessor.name == key
+            and accessor.accessor == model_class._data_key
+        )
+        return accessor, plain
+
+    @classmethod
+    def data_loader(cls) -> Callable[[Any, dict, dict], None]:
+        """Returns a function `load(instance, serialized, data)` that sets
+        the data of a row on an instance whose serialized data is
+        `serialized`, skipping ignored keys.
+
+        Same as :meth:`init_data_accessors`, but the accessors are looked up
+        once per distinct set of keys rather than once per row. Plain data
+        keys are written directly into the serialized data rather than
+        through their descriptors. The loader is meant for a single batch of
+        rows, during which the attributes of the model class do not change.
+
+        .. versionadded:: 1.0.7
+
+        :return: the loader
+        """
+        ignore = cls.ignore
+        shapes = {}
+
+        def compile_shape(keys):
+            plain = []
+            for k in keys:
+                if k in ignore:
+                    plain.append(None)
+                else:
+                    plain.append(cls.get_data_accessor(k)[1])
+            ignored = [k for k, is_plain in zip(keys, plain) if is_plain is None]
+            return plain, False not in plain, ignored
+
+        def load(instance, serialized: dict, data: dict):
+            keys = tuple(data)
+            try:
+                plain, no_setters, ignored = shapes[keys]
+            except KeyError:
+                plain, no_setters, ignored = shapes[keys] = compile_shape(keys)
+            if no_setters:
+                if serialized is not data:
+                    serialized.update(data)
+                    for k in ignored:
+                        del serialized[k]
+                return
+            for (k, v), is_plain in zip(tuple(data.items()), plain):
+                if is_plain:
+                    serialized[k] = v
+                elif is_plain is not None:
+                    setattr(instance, k, v)
+
+        return load
+
+    @classmethod
+    def init_data_accessors_many(cls, instances: List, rows: List[dict]):
+        """Initializes data accessors for lists of instances and data in a
+        single pass. Same as calling :meth:`init_data_accessors` for each
+        instance and its data.
+
+        .. versionadded:: 1.0.7
+
+        :param instances: model instances
+        :param rows: data of each instance
+        :return: None
+        """
+        model_class = cls.model_class
+        data_key = model_class._data_key
+        ignore = cls.ignore
+        load = cls.data_loader()
+        for instance, data in zip(instances, rows):
+            if model_class is not instance.__class__:
+                raise SchemaException("Instance and model class are different")
+            serialized = getattr(instance, data_key)
+            for k in ignore:
+                data.pop(k, None)
+            load(instance, serialized, data)
+
     @classmethod
     def validate_callbacks(cls):
         """Validates expected callback signature found in any callback in the
@@ -195,5 +295,6 @@ class DynamicSchema(metaclass=SchemaRegistry):
             setattr(model_class, "_ignored_fields", ignored_fields)
         setattr(cls, "_fields", schema_fields)
         setattr(cls, "_ignored_fields", ignored_fields)
+        cls.build_field_tables()
         cls.init_field_accessors()
         cls.validate_callbacks()
@@ -1,5 +1,27 @@
+from copy import deepcopy
+
+
 def make_signature_str(_args, _kwargs):
     return "({}, {})".format(
         ", ".join([str(_a) for _a in _args]),
         ", ".join(["{}={}".format(name, val) for name, val in _kwargs.items()]),
     )
+
+
+_SCALARS = (str, int, float, bool, type(None))
+
+
+def copy_json(value):
+    """Copies json-like data. Dictionaries and lists are rebuilt, scalars
+    are returned as is and any other value is deep copied.
+
+    .. versionadded:: 1.0.7
+    """
+    vtype = type(value)
+    if vtype in _SCALARS:
+        return value
+    if vtype is dict:
+        return {k: copy_json(v) for k, v in value.items()}
+    if vtype is list:
+        return [copy_json(v) for v in value]
+    return deepcopy(value)
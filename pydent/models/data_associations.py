@@ -263,18 +263,29 @@ class Upload(ModelBase):
         ].raw
         return data["expiring_url"]
 
+    def _transport(self):
+        """Returns the pooled http transport of the attached session."""
+        return self.session._aqhttp.transport
+
     @staticmethod
-    def _download_file_from_url(url, outpath):
+    def _download_file_from_url(url, outpath, transport=None):
         """Downloads a file from a url.
 
         :param url: url of file
         :type url: str
         :param outpath: filepath of out file
         :type outpath: str
+        :param transport: optional pooled transport to make the request with
+        :type transport: AqTransport
         :return: http response
         :rtype: str
         """
-        response = requests.get(url, stream=True)
+        if transport is None:
+            response = requests.get(url, stream=True)
+        else:
+            response = transport.get(url, stream=True)
+        # the transport requests gzip encoded responses
+        response.raw.decode_content = True
         with open(outpath, "wb") as out_file:
             shutil.copyfileobj(response.raw, out_file)
         return response.raw
@@ -343,13 +354,15 @@ class Upload(ModelBase):
             filename = "{}_{}".format(self.id, self.upload_file_name)
         filepath = os.path.join(outdir, filename)
         if not os.path.exists(filepath) or overwrite:
-            self._download_file_from_url(self.temp_url(), filepath)
+            self._download_file_from_url(
+                self.temp_url(), filepath, transport=self._transport()
+            )
         return filepath
 
     @property
     def data(self):
         """Return the data associated with the upload."""
-        result = requests.get(self.temp_url())
+        result = self._transport().get(self.temp_url())
         return result.content
 
     def create(self):
@@ -276,23 +276,36 @@ class FieldValue(FieldMixin, JSONSaveMixin, JSONDeleteMixin, ModelBase):
         if not self.role or self.parent_class != "Operation":
             return None
         elif self.operation and self.operation.plan:
-            wires = self.operation.plan.wires
+            plan = self.operation.plan
             if self.role == "input":
-                return [w for w in wires if w.does_wire_to(self)]
+                return plan.get_incoming_wires(self)
             elif self.role == "output":
-                return [w for w in wires if w.does_wire_from(self)]
+                return plan.get_outgoing_wires(self)
         return []
 
     @property
     def incoming_wires(self):
+        """The wires of the operation's plan whose destination is this
+        FieldValue.
+
+        .. versionchanged:: 1.0.7
+            Returns the wires from the plan's wire index instead of an
+            empty list.
+        """
         if self.role == "input":
-            self.get_wires()
+            return self.get_wires() or []
         return []
 
     @property
     def outgoing_wires(self):
+        """The wires of the operation's plan whose source is this FieldValue.
+
+        .. versionchanged:: 1.0.7
+            Returns the wires from the plan's wire index instead of an
+            empty list.
+        """
         if self.role == "output":
-            self.get_wires()
+            return self.get_wires() or []
         return []
 
     @property
@@ -1,6 +1,9 @@
 """Models related to inventory, like Items, Collections, ObjectTypes, and
 PartAssociations."""
+import weakref
 from abc import abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from typing import Any
 from typing import Dict
 from typing import List
@@ -25,6 +28,21 @@ from pydent.utils.matrix_mapper import IndexType
 from pydent.utils.matrix_mapper import MatrixMapping
 from pydent.utils.matrix_mapper import MatrixMappingFactory
 
+MAX_WORKERS = 8  #: default number of concurrent requests when flushing collections
+
+# the '__Part' ObjectType, resolved once per session
+_part_object_types = weakref.WeakKeyDictionary()
+
+
+def _get_part_object_type(session) -> "ObjectType":
+    """Returns the '__Part' ObjectType, finding it at most once per
+    session."""
+    object_type = _part_object_types.get(session)
+    if object_type is None:
+        object_type = session.ObjectType.find_by_name("__Part")
+        _part_object_types[session] = object_type
+    return object_type
+
 
 @add_schema
 class ObjectType(SaveMixin, ModelBase):
@@ -350,6 +368,24 @@ class Collection(
             # delete all of the 'key' associations
             collection.delete_association_at('key', slice(None, None, None), slice(None, None, None))
 
+        **Buffering writes**
+
+        .. versionadded:: 1.0.7
+            Write buffer added
+
+        Cell edits are kept in a write buffer until the collection is
+        flushed or updated. Within a `buffered` block, `assign_sample` and
+        `remove_sample` are buffered as well and the collection is flushed
+        once at the end of the block.
+
+        .. code-block:: python
+
+            with collection.buffered():
+                collection[0] = 1
+                collection.assign_sample(2, [(1, 0), (1, 1)])
+                collection.remove_sample([(2, 2)])
+            # one request per distinct sample, sent concurrently, and one refresh
+
 
         :param object_type:
         :param location:
@@ -441,28 +477,34 @@ class Collection(
         c: int,
         sample: Union[int, Sample],
     ):
+        if not isinstance(sample, (int, Sample)) and sample is not None:
+            raise ValueError("{} must be a Sample instance or an int".format(sample))
+        self.pending_cells[r, c] = sample
         if data[r][c]:
             part = data[r][c].part
+        elif sample is None:
+            return
         else:
             part = self.session.Item.new(
-                object_type_id=self.session.ObjectType.find_by_name("__Part").id
+                object_type_id=_get_part_object_type(self.session).id
             )
             association = self.session.PartAssociation.new(
                 part_id=part.id, collection_id=self.id, row=r, column=c
             )
             association.part = part
             self.append_to_many("part_associations", association)
+            data[r][c] = association
+            self._update_mapping_signature(data)
         if isinstance(sample, int):
             part.sample_id = sample
-            part.reset_field("sample")
+            if part.is_deserialized("sample"):
+                part.reset_field("sample")
         elif isinstance(sample, Sample):
             part.sample = sample
             part.sample_id = sample.id
-        elif sample is None:
+        else:
             part.sample = None
             part.sample_id = None
-        else:
-            raise ValueError("{} must be a Sample instance or an int".format(sample))
 
     def _set_key_values(
         self,
@@ -483,8 +525,54 @@ class Collection(
         for k, v in data_dict.items():
             part.associate(k, v)
 
+    def _mapping_signature(self) -> tuple:
+        """Returns the part associations list, the identity and location of
+        each of its part associations and the dimensions the cached mapping
+        was built from."""
+        part_associations = self.part_associations
+        if part_associations is None:
+            locations = ()
+        else:
+            locations = tuple((id(a), a.row, a.column) for a in part_associations)
+        return part_associations, locations, tuple(self.dimensions)
+
+    def _is_mapping_stale(self, signature: tuple) -> bool:
+        cached = self.__dict__.get("_mapping_cache")
+        if cached is None:
+            return True
+        cached_signature = cached[0]
+        return (
+            cached_signature[0] is not signature[0]
+            or cached_signature[1:] != signature[1:]
+        )
+
+    def _update_mapping_signature(self, data: List[List[PartAssociation]]):
+        """Keeps the cached mapping after a new part association was added to
+        its matrix in place."""
+        cached = self.__dict__.get("_mapping_cache")
+        if cached is not None and cached[1].data is data:
+            self.__dict__["_mapping_cache"] = (self._mapping_signature(), cached[1])
+
+    def _clear_mapping(self):
+        self.__dict__["_mapping_cache"] = None
+
     @property
     def _mapping(self):
+        """The views of the (row, column) index of part associations.
+
+        .. versionchanged:: 1.0.7
+            The index is built once and rebuilt only when the
+            `part_associations` (or their locations) or `dimensions` of the
+            collection change.
+        """
+        signature = self._mapping_signature()
+        if not self._is_mapping_stale(signature):
+            return self.__dict__["_mapping_cache"][1]
+        factory = self._new_mapping()
+        self.__dict__["_mapping_cache"] = (signature, factory)
+        return factory
+
+    def _new_mapping(self):
         factory = MatrixMappingFactory(self.__part_association_matrix())
         default_setter = self._no_setter
         factory.new("part_association", setter=default_setter, getter=None)
@@ -607,24 +695,213 @@ class Collection(
                     )
                 )
 
-    def update(self):
+    @property
+    def pending_cells(self) -> Dict[Tuple[int, int], Union[int, Sample, None]]:
+        """The write buffer of cell edits that have not yet been sent to the
+        server, keyed by (row, column).
+
+        .. versionadded:: 1.0.7
+        """
+        pending = self.__dict__.get("_pending_cells")
+        if pending is None:
+            pending = self.__dict__["_pending_cells"] = {}
+        return pending
+
+    def _discard_pending_cells(self, pairs: List[Tuple[int, int]]):
+        """Drops the pending edits of cells that are written directly to the
+        server, so that a later flush does not undo the direct write."""
+        pending = self.pending_cells
+        for r, c in pairs:
+            pending.pop((r, c), None)
+
+    def refresh(self):
+        """Refresh this collection from data from the server.
+
+        .. versionchanged:: 1.0.7
+            Pending cell edits are discarded, as the collection now reflects
+            the server.
+
+        :return: self
+        """
+        self.pending_cells.clear()
+        return super().refresh()
+
+    @property
+    def is_buffered(self) -> bool:
+        """Whether `assign_sample` and `remove_sample` are being buffered.
+
+        .. versionadded:: 1.0.7
+        """
+        return self.__dict__.get("_buffer_depth", 0) > 0
+
+    @contextmanager
+    def buffered(self, max_workers: int = MAX_WORKERS):
+        """Context manager that buffers `assign_sample` and `remove_sample`
+        and flushes the collection on exit.
+
+        .. versionadded:: 1.0.7
+
+        :param max_workers: maximum number of concurrent requests of the flush
+        :return: self
+        """
+        self.__dict__["_buffer_depth"] = self.__dict__.get("_buffer_depth", 0) + 1
+        try:
+            yield self
+        finally:
+            self.__dict__["_buffer_depth"] -= 1
+        if not self.is_buffered:
+            self.flush(max_workers=max_workers)
+
+    def _flush_requests(self) -> List[Tuple[str, dict]]:
+        """Groups the pending cells into `assign_sample` requests, one per
+        distinct sample, and a single `delete_selection` request."""
+        pairs_by_sample = {}
+        removed = []
+        for (r, c), sample in sorted(self.pending_cells.items()):
+            if sample is None:
+                removed.append([r, c])
+                continue
+            sample_id = sample if isinstance(sample, int) else sample.id
+            if sample_id is None:
+                raise ValueError(
+                    "Cannot flush. Collection contains Samples ({r},{c})"
+                    " that have not yet been saved.".format(r=r, c=c)
+                )
+            pairs_by_sample.setdefault(sample_id, []).append([r, c])
+        requests = [
+            ("assign_sample", {"sample_id": sample_id, "pairs": pairs})
+            for sample_id, pairs in pairs_by_sample.items()
+        ]
+        if removed:
+            requests.append(("delete_selection", {"pairs": removed}))
+        return requests
+
+    def _send_flush_requests(self, requests, max_workers: int = MAX_WORKERS):
+        table = self.get_tableized_name()
+
+        def send(request):
+            method, data = request
+            return self.controller_method(method, table, self.id, data=data)
+
+        if len(requests) > 1 and max_workers > 1:
+            with ThreadPoolExecutor(
+                max_workers=min(max_workers, len(requests))
+            ) as pool:
+                list(pool.map(send, requests))
+        else:
+            for request in requests:
+                send(request)
+
+    def flush(self, max_workers: int = MAX_WORKERS, refresh: bool = True):
+        """Sends the buffered cell edits to the server and clears the write
+        buffer.
+
+        Parts and part associations are created by the server with one
+        `assign_sample` request per distinct sample and one
+        `delete_selection` request for cleared cells. Requests are sent
+        concurrently and the collection is refreshed once.
+
+        .. versionadded:: 1.0.7
+
+        :param max_workers: maximum number of concurrent requests
+        :param refresh: whether to refresh the collection afterwards
+        :return: self
+        """
+        if not self.pending_cells:
+            return self
+        if not self.id:
+            raise ValueError("Cannot flush cells since the Collection is not saved.")
+        requests = self._flush_requests()
+        self._send_flush_requests(requests, max_workers=max_workers)
+        self.pending_cells.clear()
+        if refresh:
+            self.refresh()
+        return self
+
+    def update(self, max_workers: int = MAX_WORKERS):
+        """Saves the location, parts and part associations of the collection.
+
+        .. versionchanged:: 1.0.7
+            Buffered cells are flushed and the remaining part associations are
+            saved concurrently. Unsaved data associations of the flushed cells
+            are saved to the parts created by the server.
+
+        :param max_workers: maximum number of concurrent requests
+        :return: self
+        """
         self._validate_for_update()
         self.move(self.location)
-        for association in self.part_associations:
+        flushed = set(self.pending_cells)
+        unsaved_data = self._unsaved_data_associations(flushed)
+        self.flush(max_workers=max_workers, refresh=False)
+
+        def save_association(association):
             if not association.collection_id:
                 association.collection_id = self.id
             association.part.save()
             association.part_id = association.part.id
             association.save()
+
+        associations = [
+            a for a in self.part_associations if (a.row, a.column) not in flushed
+        ]
+        if len(associations) > 1 and max_workers > 1:
+            with ThreadPoolExecutor(
+                max_workers=min(max_workers, len(associations))
+            ) as pool:
+                list(pool.map(save_association, associations))
+        else:
+            for association in associations:
+                save_association(association)
+        if unsaved_data:
+            # the server created the parts of the flushed cells, so their
+            # data is saved to the parts found after a refresh
+            self.refresh()
+            parts = self.part_matrix
+            for (r, c), data_associations in unsaved_data.items():
+                part = parts[r, c]
+                for association in data_associations:
+                    association.parent_id = part.id
+                    association.parent = part
+                    part._try_update_data_association(association)
         self.refresh()
+        return self
+
+    def _unsaved_data_associations(
+        self, cells
+    ) -> Dict[Tuple[int, int], List[DataAssociation]]:
+        """Returns the data associations of the parts in `cells` that have not
+        been saved, keyed by (row, column)."""
+        unsaved = {}
+        associations = self.part_association_matrix
+        for r, c in cells:
+            association = associations[r, c]
+            if not association or not association.part:
+                continue
+            part = association.part
+            if not part.is_deserialized("data_associations"):
+                continue
+            data_associations = [da for da in part.data_associations if not da.id]
+            if data_associations:
+                unsaved[r, c] = data_associations
+        return unsaved
 
     def assign_sample(self, sample_id: int, pairs: List[Tuple[int, int]]):
         """Assign sample id to the (row, column) pairs for the collection.
 
+        .. versionchanged:: 1.0.7
+            Buffered within a `buffered` block.
+
         :param sample_id: the sample id to assign
         :param pairs: list of (row, column) tuples
         :return: self
         """
+        if self.is_buffered:
+            matrix = self.sample_id_matrix
+            for r, c in pairs:
+                matrix[r, c] = sample_id
+            return self
+        self._discard_pending_cells(pairs)
         self.controller_method(
             "assign_sample",
             self.get_tableized_name(),
@@ -638,9 +915,18 @@ class Collection(
         """Clear the sample_id assigment in the (row, column) pairs for the
         collection.
 
+        .. versionchanged:: 1.0.7
+            Buffered within a `buffered` block.
+
         :param pairs: list of (row, column) tuples
         :return: self
         """
+        if self.is_buffered:
+            matrix = self.sample_id_matrix
+            for r, c in pairs:
+                matrix[r, c] = None
+            return self
+        self._discard_pending_cells(pairs)
         self.controller_method(
             "delete_selection",
             self.get_tableized_name(),
@@ -1,6 +1,11 @@
 """Models related to plans, plan associations, and wires."""
 import json
+from typing import Any
+from typing import List
+from typing import Tuple
 from warnings import warn
+from weakref import WeakKeyDictionary
+from weakref import WeakSet
 
 from pydent.base import ModelBase
 from pydent.exceptions import AquariumModelError
@@ -19,6 +24,178 @@ from pydent.relationships import Many
 from pydent.relationships import Raw
 
 
+class WireList(list):
+    """A list of wires that counts its in-place changes, so that a
+    :class:`WireIndex` can tell when the list was modified directly.
+
+    .. versionadded:: 1.0.7
+    """
+
+    def __init__(self, *args):
+        super().__init__(*args)
+        self.version = 0  #: number of in-place changes of the list
+
+
+def _counts_changes(name):
+    method = getattr(list, name)
+
+    def counted(self, *args):
+        self.version += 1
+        return method(self, *args)
+
+    counted.__name__ = name
+    return counted
+
+
+for _name in [
+    "__setitem__",
+    "__delitem__",
+    "__iadd__",
+    "__imul__",
+    "append",
+    "extend",
+    "insert",
+    "pop",
+    "remove",
+    "clear",
+]:
+    setattr(WireList, _name, _counts_changes(_name))
+
+
+class WireIndex:
+    """Adjacency index of the wires of a plan, keyed by the identity of their
+    source and destination FieldValues.
+
+    FieldValues are indexed by `rid` and, once saved, by `id` so that
+    different instances of the same FieldValue resolve to the same wires.
+    Indexed wires are re-indexed when their source or destination is set and
+    removed from the index when they are deleted.
+
+    .. versionadded:: 1.0.7
+    """
+
+    # the indexes of each indexed wire
+    _indexes_by_wire = WeakKeyDictionary()
+
+    def __init__(self, wires: List["Wire"] = None):
+        """Initializes the index.
+
+        :param wires: the list of wires to index. The list is kept by the
+            index and updated by :meth:`add` and :meth:`remove`.
+        """
+        if wires is None:
+            wires = []
+        self.wires = wires
+        self._entries = {}
+        self._incoming = {}
+        self._outgoing = {}
+        for wire in wires:
+            self._index(wire)
+        self._version = getattr(wires, "version", None)
+
+    @classmethod
+    def indexes_of(cls, wire: "Wire") -> List["WireIndex"]:
+        """Returns the indexes that contain the wire."""
+        return [index for index in cls._indexes_by_wire.get(wire, ()) if wire in index]
+
+    @staticmethod
+    def _keys(field_value: FieldValue) -> List[Tuple[str, Any]]:
+        if field_value is None:
+            return []
+        keys = [("rid", field_value.rid)]
+        fvid = getattr(field_value, "id", None)
+        if fvid is not None:
+            keys.append(("id", fvid))
+        return keys
+
+    def _index(self, wire: "Wire"):
+        source_keys = self._keys(wire.source)
+        destination_keys = self._keys(wire.destination)
+        self._entries[wire.rid] = (source_keys, destination_keys)
+        for key in source_keys:
+            self._outgoing.setdefault(key, {})[wire.rid] = wire
+        for key in destination_keys:
+            self._incoming.setdefault(key, {})[wire.rid] = wire
+        self._indexes_by_wire.setdefault(wire, WeakSet()).add(self)
+
+    def _unindex(self, wire: "Wire") -> bool:
+        entry = self._entries.pop(wire.rid, None)
+        if entry is None:
+            return False
+        source_keys, destination_keys = entry
+        for table, keys in [
+            (self._outgoing, source_keys),
+            (self._incoming, destination_keys),
+        ]:
+            for key in keys:
+                wires = table.get(key)
+                if wires is not None:
+                    wires.pop(wire.rid, None)
+                    if not wires:
+                        del table[key]
+        return True
+
+    def reindex(self, wire: "Wire"):
+        """Updates the index after the source or destination of an indexed
+        wire changed."""
+        if self._unindex(wire):
+            self._index(wire)
+
+    def is_stale(self, wires: List["Wire"]) -> bool:
+        """Whether the index no longer reflects the list of wires (e.g. if
+        the list was reassigned or modified directly).
+
+        In-place changes are only detected for a :class:`WireList`.
+        """
+        return (
+            wires is not self.wires
+            or len(wires) != len(self._entries)
+            or getattr(wires, "version", None) != self._version
+        )
+
+    def __contains__(self, wire: "Wire") -> bool:
+        return wire.rid in self._entries
+
+    def __len__(self):
+        return len(self._entries)
+
+    def add(self, wire: "Wire") -> bool:
+        """Adds the wire to the list of wires and the index. Returns False if
+        the wire is already indexed."""
+        if wire in self:
+            return False
+        self.wires.append(wire)
+        self._index(wire)
+        self._version = getattr(self.wires, "version", None)
+        return True
+
+    def remove(self, wire: "Wire") -> bool:
+        """Removes the wire from the list of wires and the index. Returns
+        False if the wire is not indexed."""
+        if not self._unindex(wire):
+            return False
+        for i, w in enumerate(self.wires):
+            if w is wire:
+                del self.wires[i]
+                break
+        self._version = getattr(self.wires, "version", None)
+        return True
+
+    def _lookup(self, table: dict, field_value: FieldValue) -> List["Wire"]:
+        found = {}
+        for key in self._keys(field_value):
+            found.update(table.get(key, {}))
+        return list(found.values())
+
+    def incoming(self, field_value: FieldValue) -> List["Wire"]:
+        """Returns the wires whose destination is the field value."""
+        return self._lookup(self._incoming, field_value)
+
+    def outgoing(self, field_value: FieldValue) -> List["Wire"]:
+        """Returns the wires whose source is the field value."""
+        return self._lookup(self._outgoing, field_value)
+
+
 @add_schema
 class Plan(DataAssociatorMixin, SaveMixin, DeleteMixin, ModelBase):
     """A Plan model."""
@@ -36,6 +213,11 @@ class Plan(DataAssociatorMixin, SaveMixin, DeleteMixin, ModelBase):
     )
     query_hook = {"include": ["plan_associations", "operations"]}
 
+    def __setattr__(self, name, value):
+        if name == "wires" and value is not None and not isinstance(value, WireList):
+            value = WireList(value)
+        super().__setattr__(name, value)
+
     def __init__(self, name="MyPlan", status="planning"):
         super().__init__(
             name=name,
@@ -95,11 +277,72 @@ class Plan(DataAssociatorMixin, SaveMixin, DeleteMixin, ModelBase):
         """
 
         found = []
-        for wire in self.wires:
+        for wire in self.wire_index.outgoing(src):
             if src.rid == wire.source.rid and dest.rid == wire.destination.rid:
                 found.append(wire)
         return found
 
+    @property
+    def wire_index(self) -> WireIndex:
+        """The adjacency index of the plan's wires. The index is rebuilt if
+        `plan.wires` was reassigned or modified outside of :meth:`add_wire`
+        and :meth:`remove_wire`. Wires set on the plan are held in a
+        :class:`WireList`, which tracks in-place changes.
+
+        .. versionadded:: 1.0.7
+        """
+        wires = self.wires
+        if wires is None:
+            return WireIndex(WireList())
+        index = getattr(self, "_wire_index", None)
+        if index is None or index.is_stale(wires):
+            index = WireIndex(wires)
+            self._wire_index = index
+        return index
+
+    def add_wire(self, wire: "Wire") -> "Wire":
+        """Adds a wire to the plan, if the wire is not already in the plan.
+
+        .. versionadded:: 1.0.7
+
+        :param wire: the wire to add
+        :return: the wire
+        """
+        if self.wires is None:
+            self.wires = []
+        self.wire_index.add(wire)
+        return wire
+
+    def remove_wire(self, wire: "Wire") -> "Wire":
+        """Removes a wire from the plan.
+
+        .. versionadded:: 1.0.7
+
+        :param wire: the wire to remove
+        :return: the wire
+        """
+        self.wire_index.remove(wire)
+        return wire
+
+    def get_incoming_wires(self, field_value: FieldValue) -> List["Wire"]:
+        """Returns the wires of the plan whose destination is the field value.
+
+        .. versionadded:: 1.0.7
+        """
+        return self.wire_index.incoming(field_value)
+
+    def get_outgoing_wires(self, field_value: FieldValue) -> List["Wire"]:
+        """Returns the wires of the plan whose source is the field value.
+
+        .. versionadded:: 1.0.7
+        """
+        return self.wire_index.outgoing(field_value)
+
+    def anonymize(self):
+        # the rids of the wired field values may change
+        self._wire_index = None
+        return super().anonymize()
+
     def wire(self, src, dest):
         """Creates a new wire between src and dest FieldValues. Returns the new
         wire if it does not exist in the plan. If the wire already exists and
@@ -134,7 +377,7 @@ class Plan(DataAssociatorMixin, SaveMixin, DeleteMixin, ModelBase):
         #     )
 
         wire = Wire(source=src, destination=dest)
-        self.append_to_many("wires", wire)
+        self.add_wire(wire)
         return wire
 
     def _collect_wires(self):
@@ -224,7 +467,7 @@ class Plan(DataAssociatorMixin, SaveMixin, DeleteMixin, ModelBase):
         for op in self.operations:
             for fv in op.field_values:
                 field_values.append(fv)
-        fv_keys = [fv._primary_key for fv in field_values]
+        fv_keys = {fv._primary_key for fv in field_values}
         for wire in self.wires:
             for _fvtype in ["source", "destination"]:
                 field_value = getattr(wire, _fvtype)
@@ -262,8 +505,9 @@ class Plan(DataAssociatorMixin, SaveMixin, DeleteMixin, ModelBase):
         for op in self.operations:
             op.field_values
 
-        json_data = self.dump(
-            include={"operations": {"field_values": ["sample", "item"]}}
+        # samples and items shared by field values are dumped once
+        (json_data,) = self.dump_many(
+            [self], include={"operations": {"field_values": ["sample", "item"]}}
         )
 
         # remove redundant wires
@@ -394,6 +638,12 @@ class Wire(DeleteMixin, ModelBase):
 
     WIRABLE_PARENT_CLASSES = ["Operation"]
 
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        if name in ("source", "destination"):
+            for index in WireIndex.indexes_of(self):
+                index.reindex(self)
+
     def __init__(self, source=None, destination=None):
 
         self._validate_field_values(source, destination)
@@ -512,10 +762,16 @@ class Wire(DeleteMixin, ModelBase):
     def delete(self):
         """Permanently deletes the wire instance on the Aquarium server.
 
+        .. versionchanged:: 1.0.7
+            The wire is removed from the plans whose wire index contains it.
+
         :return:
         :rtype:
         """
-        return self.session.utils.delete_wire(self)
+        result = self.session.utils.delete_wire(self)
+        for index in WireIndex.indexes_of(self):
+            index.remove(self)
+        return result
 
     def show(self, pre=""):
         """Show the wire nicely."""
@@ -1,6 +1,5 @@
 import json
 from collections import OrderedDict
-from hashlib import sha1
 from typing import List
 
 import networkx as nx
@@ -32,54 +31,82 @@ class PlanOptimizer:
             self.logger = logger(self)
 
         self.merge_missing_samples = merge_missing_samples
+        self._fv_hashes = {}
+        self._op_hashes = {}
 
     # TODO: there could be a setting here to merge things with .sample=None
 
+    @staticmethod
+    def _hashable(value):
+        try:
+            hash(value)
+        except TypeError:
+            return json.dumps(value, sort_keys=True)
+        return value
+
+    @staticmethod
+    def _sorted_keys(keys):
+        # keys may mix None, numbers and strings, so sort by their repr
+        return tuple(sorted(keys, key=repr))
+
+    def _clear_hashes(self):
+        """Clears the field value and operation keys cached during an
+        optimization pass."""
+        self._fv_hashes = {}
+        self._op_hashes = {}
+
     def _fv_to_hash(self, fv, ft):
+        """Returns a canonical key of a field value.
+
+        .. versionchanged:: 1.0.7
+            Returns a tuple instead of a json string. Keys are cached
+            during an optimization pass.
+        """
+        cache_key = (fv.rid, ft.rid)
+        fvhash = self._fv_hashes.get(cache_key)
+        if fvhash is None:
+            fvhash = self._fv_hashes[cache_key] = self._compute_fv_hash(fv, ft)
+        return fvhash
+
+    def _compute_fv_hash(self, fv, ft):
         # none valued Samples are never equivalent
-        fvhash = OrderedDict(
-            {
-                "ftype": fv.field_type.ftype,
-                "role": fv.role,
-                "name": fv.name,
-                "array": ft.array,
-                "sample": OrderedDict(),
-                "item": OrderedDict(),
-                "value": None,
-            }
-        )
+        sample = None
+        value = None
         if fv.sample is not None:
-            sample_id = fv.child_sample_id or fv.sample.id
-            fvhash["sample"]["id"] = sample_id
+            sample = ("id", fv.child_sample_id or fv.sample.id)
         elif fv.field_type.ftype != "sample":
-            fvhash["value"] = fv.value
+            value = self._hashable(fv.value)
         elif fv.allowable_field_type.sample_type_id is None:
             pass
         elif not self.merge_missing_samples:
-            # a deterministic hash for field values missing samples
-            fvid = fv.id or fv._primary_key
-            ftid = ft.id
-            hashed = sha1("{}{}".format(fvid, ftid).encode("utf-8"))
-            sid = hashed.hexdigest()
-            fvhash["sample"] = sid
+            # a deterministic key for field values missing samples
+            sample = ("missing", fv.id or fv._primary_key, ft.id)
 
+        item = None
         if fv.item is not None:
-            fvhash["item"]["id"] = fv.item.id
+            item = ("id", fv.item.id)
             if ft.part:
-                fvhash["item"]["row"] = fv.row
-                fvhash["item"]["column"] = fv.column
+                item += (fv.row, fv.column)
 
-        return json.dumps(fvhash, indent=2)
+        return (fv.field_type.ftype, fv.role, fv.name, ft.array, sample, item, value)
 
-    def _fv_array_to_hash(self, fv_array, ft, sort=True, sep="*"):
+    def _fv_array_to_hash(self, fv_array, ft, sort=True):
         arr = [self._fv_to_hash(fv, ft) for fv in fv_array]
         if sort:
-            arr.sort()
-        return sep.join(arr)
+            return self._sorted_keys(arr)
+        return tuple(arr)
 
     def _op_to_hash(self, op):
         """Turns a operation into a hash using the operation_type_id, item_id,
-        and sample_id."""
+        and sample_id.
+
+        .. versionchanged:: 1.0.7
+            Returns a tuple instead of a string. Keys are cached during an
+            optimization pass.
+        """
+        ophash = self._op_hashes.get(op.rid)
+        if ophash is not None:
+            return ophash
         ot_id = op.operation_type.id
 
         field_value_hashes = []
@@ -92,10 +119,13 @@ class PlanOptimizer:
                     fv_array = op.field_value_array(ft.name, ft.role)
                     field_value_hashes.append(self._fv_array_to_hash(fv_array, ft))
 
-        field_value_hashes = sorted(field_value_hashes)
-        return "{}_{}\n{}".format(
-            ot_id, op.operation_type.name, "\n".join(field_value_hashes)
+        ophash = (
+            ot_id,
+            op.operation_type.name,
+            self._sorted_keys(field_value_hashes),
         )
+        self._op_hashes[op.rid] = ophash
+        return ophash
 
     def _group_ops_by_hashes(self, ops):
         hashgroup = {}
@@ -163,6 +193,7 @@ class PlanOptimizer:
             self.planner.operations
         )
 
+        self._clear_hashes()
         self.logger.info("Optimizing plan...")
         if operations is not None:
             self.logger.info(
@@ -185,6 +216,8 @@ class PlanOptimizer:
             elif ignore_on_the_fly and op.operation_type.on_the_fly:
                 ignore_ops.append(op)
 
+        ignore_ops = set(ignore_ops)
+
         operations = [op for op in operations if op.status == "planning"]
         nxgraph = self.graph.ops_to_subgraph(operations).nxgraph
         assert nxgraph.number_of_nodes() == len(operations)
@@ -196,23 +229,26 @@ class PlanOptimizer:
 
         # create 'group_graph'
         # group graph are all of the operations grouped into hashes
-        # each group has an edge to another group
+        # each group has an edge to another group. Group keys are interned
+        # as integer group ids.
         group_graph = nx.DiGraph()
+        group_ids = {}
 
         for n in nx.topological_sort(nxgraph):
             op = nxgraph.nodes[n]["operation"]
             op_hash = self._op_to_hash(op)
             sorted_fvs = sorted(
-                op.inputs, key=lambda fv: self._fv_to_hash(fv, fv.field_type)
+                op.inputs, key=lambda fv: repr(self._fv_to_hash(fv, fv.field_type))
             )
             sorted_in_wires = []
             for fv_input in sorted_fvs:
                 sorted_in_wires += self.planner.get_incoming_wires(fv_input)
             sorted_src_ops = [w.source.operation for w in sorted_in_wires]
             predecessor_groups = [op_to_group_id[opkey(_op)] for _op in sorted_src_ops]
-            predecessor_hash = "*".join(predecessor_groups)
 
-            final_hash = op_hash + "__" + predecessor_hash
+            final_hash = group_ids.setdefault(
+                (op_hash, tuple(predecessor_groups)), len(group_ids)
+            )
             op_to_group_id[opkey(op)] = final_hash
             group_id_to_ops.setdefault(final_hash, list())
             group_id_to_ops[final_hash].append(op)
@@ -267,11 +303,11 @@ class PlanOptimizer:
                                 dest_fv = dest_op.input(w.destination.name)
                                 wires_to_add.add((src_fv, dest_fv))
 
-        ops_to_keep = []
+        ops_to_keep = set()
         for dest_ops in group_id_to_ops.values():
             dest_ops = [op for op in dest_ops if op not in ignore_ops]
             ops_to_remove += dest_ops[1:]
-            ops_to_keep += dest_ops[:1]
+            ops_to_keep.update(dest_ops[:1])
             for op in dest_ops[1:]:
                 for fv in op.field_values:
                     if fv.role == "input":
@@ -288,10 +324,9 @@ class PlanOptimizer:
             if w.destination.operation not in ops_to_keep:
                 ops_to_remove.append(w.destination.operation)
 
-        operations_list = self.planner.operations
-        for op in ops_to_remove:
-            if op in operations_list:
-                operations_list.remove(op)
+        removed = set(ops_to_remove)
+        operations_list = [op for op in self.planner.operations if op not in removed]
+        self.planner.operations = operations_list
 
         for w in wires_to_add:
             self.planner.add_wire(*w)
@@ -301,7 +336,8 @@ class PlanOptimizer:
             (fv_src, target_op, target_fts),
         ) in wires_to_add_to_array.items():
             key_to_inputs = {
-                self._fv_to_hash(_fv, _fv.field_type): _fv for _fv in target_op.inputs
+                self._compute_fv_hash(_fv, _fv.field_type): _fv
+                for _fv in target_op.inputs
             }
             if key_to_inputs.get(key, None):
                 self.planner.quick_wire(fv_src, key_to_inputs[key])
@@ -3,6 +3,7 @@ import itertools
 import random
 import webbrowser
 from collections import defaultdict
+from contextlib import contextmanager
 from copy import deepcopy
 from functools import wraps
 from typing import Any
@@ -37,6 +38,7 @@ from pydent.planner.graph import PlannerLayout
 from pydent.planner.utils import _id_getter
 from pydent.planner.utils import arr_to_pairs
 from pydent.planner.utils import get_subgraphs
+from pydent.planner.utils import RoutingIndex
 from pydent.utils import empty_copy
 from pydent.utils import logger
 from pydent.utils import make_async
@@ -206,6 +208,9 @@ class Planner(AFTMatcher):
 
     def __init__(self, session_or_plan=None, plan_id=None):
         self._plan = None
+        self._routes = None
+        self._routes_signature = None
+        self._operation_keys = None
         if issubclass(type(session_or_plan), AqSession):
             # initialize with session
             self.session = session_or_plan
@@ -270,6 +275,7 @@ class Planner(AFTMatcher):
     @plan.setter
     def plan(self, new_plan: Plan):
         self._plan = new_plan
+        self._routes = None
         self.cache()
 
     @classmethod
@@ -346,13 +352,17 @@ class Planner(AFTMatcher):
         """
         self.plan.delete()
         self._plan = self.plan.copy()
+        self._routes = None
 
     def create_operation_by_type(
         self, ot: OperationType, status: str = "planning"
     ) -> Operation:
         op = ot.instance()
         op.status = status
-        self.plan.add_operation(op)
+        with self._updating_routes() as routes:
+            self.plan.add_operation(op)
+            for fv in op.field_values:
+                routes.add_field_value(fv)
         self.logger.debug("{} created".format(ot.name))
         return op
 
@@ -414,10 +424,8 @@ class Planner(AFTMatcher):
 
     @plan_verification_wrapper
     def get_wire(self, fv1: FieldValue, fv2: FieldValue) -> Union[None, Wire]:
-        for wire in self.plan.wires:
-            if self._model_are_equal(wire.source, fv1) and self._model_are_equal(
-                wire.destination, fv2
-            ):
+        for wire in self.plan.get_outgoing_wires(fv1):
+            if self._model_are_equal(wire.destination, fv2):
                 self.logger.debug("found wire from {} to {}".format(fv1.name, fv2.name))
                 return wire
 
@@ -430,37 +438,20 @@ class Planner(AFTMatcher):
         :return:
         """
         wire = self.get_wire(fv1, fv2)
-        wires = list(self.plan.wires)
         if wire:
             self.logger.debug("removing wire from {} to {}".format(fv1.name, fv2.name))
-            # wires_as_source = fv1.wires_as_source
-            # wires_as_dest = fv2.wires_as_dest
-            #
-            # wires_as_source.remove(wire)
-            # wires_as_dest.remove(wire)
-
-            # fv1.wires_as_source = wires_as_source
-            # fv2.wires_as_dest = wires_as_dest
-
-            wires.remove(wire)
-            self.plan.wires = wires
+            with self._updating_routes() as routes:
+                self.plan.remove_wire(wire)
+                routes.remove_wire(wire)
         return wire
 
     @plan_verification_wrapper
     def get_outgoing_wires(self, fv: FieldValue) -> List[Wire]:
-        wires = []
-        for wire in self.plan.wires:
-            if self._model_are_equal(wire.source, fv):
-                wires.append(wire)
-        return wires
+        return self.plan.get_outgoing_wires(fv)
 
     @plan_verification_wrapper
     def get_incoming_wires(self, fv: FieldValue) -> List[Wire]:
-        wires = []
-        for wire in self.plan.wires:
-            if self._model_are_equal(wire.destination, fv):
-                wires.append(wire)
-        return wires
+        return self.plan.get_incoming_wires(fv)
 
     def get_fv_successors(self, fv: FieldValue) -> List[FieldValue]:
         fvs = []
@@ -498,10 +489,18 @@ class Planner(AFTMatcher):
         return self.quick_wire_by_name(otname1, otname2)
 
     def _contains_op(self, op):
-        if op in self.plan.operations:
+        operations = self.plan.operations
+        signature = (id(operations), len(operations))
+        if self._operation_keys is None or self._operation_keys[0] != signature:
+            self._operation_keys = (
+                signature,
+                {id(x) for x in operations},
+                {x.id for x in operations if x.id is not None},
+            )
+        _, op_ids, plan_operation_ids = self._operation_keys
+        if id(op) in op_ids:
             return True
         else:
-            plan_operation_ids = [x.id for x in self.plan.operations]
             return op.id is not None and op.id in plan_operation_ids
 
     @plan_verification_wrapper
@@ -751,20 +750,27 @@ class Planner(AFTMatcher):
 
     def remove_operations(self, ops: Iterable[Operation]):
         self.clean_wires()
-        operations = self.plan.operations
-        wires = set(self.plan.wires)
-        wires_to_remove = set()
+        with self._updating_routes() as routes:
+            operations = self.plan.operations
+            wires = set(self.plan.wires)
+            wires_to_remove = set()
 
-        for op in ops:
-            operations.remove(op)
-            for fv in op.field_values:
-                wires_to_remove = wires_to_remove.union(set(fv.wires_as_source))
-                wires_to_remove = wires_to_remove.union(set(fv.wires_as_dest))
+            for op in ops:
+                operations.remove(op)
+                for fv in op.field_values:
+                    wires_to_remove = wires_to_remove.union(set(fv.wires_as_source))
+                    wires_to_remove = wires_to_remove.union(set(fv.wires_as_dest))
+
+            for wire in wires.intersection(wires_to_remove):
+                routes.remove_wire(wire)
+            for op in ops:
+                for fv in op.field_values:
+                    routes.remove_field_value(fv)
 
-        wires = list(wires.difference(wires_to_remove))
+            wires = list(wires.difference(wires_to_remove))
 
-        self.plan.operations = operations
-        self.plan.wires = wires
+            self.plan.operations = operations
+            self.plan.wires = wires
 
     # TODO: resolve afts if already set...
     # TODO: clean up _set_wire
@@ -887,7 +893,9 @@ class Planner(AFTMatcher):
         if wire is None:
             # wire does not exist, so create it
             self._set_wire(fv1, fv2)
-            wire = self.plan.wire(fv1, fv2)
+            with self._updating_routes() as routes:
+                wire = self.plan.wire(fv1, fv2)
+                routes.add_wire(wire)
             self.logger.debug("wired {} to {}".format(fv1.name, fv2.name))
         return wire
 
@@ -902,6 +910,23 @@ class Planner(AFTMatcher):
                     return routing_id
         return routing_id
 
+    @classmethod
+    def _routing_key(cls, fv: FieldValue) -> str:
+        """Returns the key of the field value in the :attr:`routes` index.
+
+        The key is the routing id, except for the members of an input array,
+        which are keyed by their own primary key rather than by their
+        position in the array (which changes when members are added or
+        removed).
+
+        .. versionadded:: 1.0.7
+        """
+        if fv.field_type.array and fv.role == "input":
+            return "{}_{}[{}]".format(
+                _id_getter(fv.operation), fv.field_type.routing, fv._primary_key
+            )
+        return cls._routing_id(fv)
+
     @staticmethod
     def get_sample_routing_of_operation(op: Operation) -> Dict[str, List[FieldValue]]:
         routing_dict = {}
@@ -934,6 +959,47 @@ class Planner(AFTMatcher):
             G.add_edge(src_id, dest_id, wire=w)
         return G
 
+    def _get_routes_signature(self):
+        operations = self.plan.operations
+        wires = self.plan.wires
+        return (
+            id(operations),
+            len(operations or []),
+            id(wires),
+            len(wires or []),
+        )
+
+    @property
+    def routes(self) -> RoutingIndex:
+        """The sample routing equivalence classes of the plan.
+
+        The classes are updated incrementally by :meth:`add_wire`,
+        :meth:`remove_wire`, :meth:`create_operation_by_type` and
+        :meth:`remove_operations`, and rebuilt if the operations or wires of
+        the plan were modified directly.
+
+        .. versionadded:: 1.0.7
+        """
+        signature = self._get_routes_signature()
+        if self._routes is None or signature != self._routes_signature:
+            routes = RoutingIndex(self._routing_key)
+            for op in self.plan.operations or []:
+                for fv in op.field_values:
+                    routes.add_field_value(fv)
+            for wire in self.plan.wires or []:
+                routes.add_wire(wire)
+            self._routes = routes
+            self._routes_signature = signature
+        return self._routes
+
+    @contextmanager
+    def _updating_routes(self):
+        """Yields the routing index for an incremental update of the
+        operations or wires of the plan."""
+        routes = self.routes
+        yield routes
+        self._routes_signature = self._get_routes_signature()
+
     # TODO: Support for row and column
     # TODO: routing dict does not work with input arrays (it groups them ALL together)
     @plan_verification_wrapper
@@ -1041,12 +1107,7 @@ class Planner(AFTMatcher):
             else:
                 sample = item.sample
             self.set_field_value(field_value, item=item, row=row, column=column)
-        routing_graph = self._routing_graph()
-        routing_id = self._routing_id(field_value)
-        subgraph = nx.bfs_tree(routing_graph.to_undirected(as_view=True), routing_id)
-        for node in subgraph:
-            n = routing_graph.nodes[node]
-            fv = n["fv"]
+        for fv in self.routes.field_values(field_value):
             self.set_field_value(fv, sample=sample, object_type=container, value=value)
         return field_value
 
@@ -1574,6 +1635,7 @@ class Planner(AFTMatcher):
         copied = empty_copy(self)
         data = self.__dict__.copy()
         data.pop("_plan")
+        data["_routes"] = None
         copied.__dict__ = deepcopy(data)
 
         # copy over anonymous copy
@@ -1676,23 +1738,27 @@ class Planner(AFTMatcher):
         # get independent operation graphs
         layouts = copied_plan.layout.get_independent_graphs()
 
+        # bucket the wires by independent graph
+        layout_index = {}
+        for i, layout in enumerate(layouts):
+            for opid in layout.nxgraph.nodes:
+                layout_index[opid] = i
+        layout_wires = [[] for _ in layouts]
+        for wire in copied_plan.plan.wires:
+            to_id = wire.destination.operation._primary_key
+            from_id = getattr(wire, "source").operation._primary_key
+            for i in {layout_index.get(to_id), layout_index.get(from_id)}:
+                if i is not None:
+                    layout_wires[i].append(wire)
+
         # for each independent graph, make a new plan
         new_plans = []
-        for layout in layouts:
+        for layout, wires in zip(layouts, layout_wires):
             new_plan = Planner(self.session)
             new_plans.append(new_plan)
 
             # copy over the operations
-            opids = list(layout.nxgraph.nodes)
-            ops = [layout.nxgraph.nodes[opid]["operation"] for opid in opids]
-            wires = []
-
-            # copy over relevant wires
-            for wire in copied_plan.plan.wires:
-                to_id = wire.destination.operation._primary_key
-                from_id = getattr(wire, "source").operation._primary_key
-                if to_id in opids or from_id in opids:
-                    wires.append(wire)
+            ops = [layout.nxgraph.nodes[opid]["operation"] for opid in layout.nxgraph]
 
             new_plan.plan.operations = ops
             new_plan.plan.wires = wires
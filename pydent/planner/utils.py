@@ -1,4 +1,5 @@
 from copy import deepcopy
+from typing import Callable
 
 import networkx as nx
 
@@ -34,14 +35,203 @@ def bfs_tree_subgraph(graph, source):
     return graph.subgraph(nodes)
 
 
+def get_subgraph_nodes(graph):
+    """Get the node sets of the independent (i.e. weakly connected)
+    subgraphs. Components are returned in the same order as
+    :func:`get_subgraphs`.
+
+    .. versionadded:: 1.0.7
+    """
+    if graph.is_directed():
+        components = nx.weakly_connected_components(graph)
+    else:
+        components = nx.connected_components(graph)
+    position = {n: i for i, n in enumerate(graph.nodes)}
+    return sorted(components, key=lambda c: -max(position[n] for n in c))
+
+
 def get_subgraphs(graph):
-    """Get independent subgraphs."""
-    node_list = list(graph.nodes)
-    subgraphs = []
-    while len(node_list) > 0:
-        node = node_list[-1]
-        subgraph = nx.bfs_tree(to_undirected(graph), node)
-        for n in subgraph.nodes:
-            node_list.remove(n)
-        subgraphs.append(graph.subgraph(subgraph.nodes))
-    return subgraphs
+    """Get independent subgraphs.
+
+    .. versionchanged:: 1.0.7
+        Returns subgraph views of the graph. The graph and its attached
+        models are no longer copied.
+    """
+    return [graph.subgraph(nodes) for nodes in get_subgraph_nodes(graph)]
+
+
+class UnionFind:
+    """Disjoint sets of nodes joined by (multi-)edges.
+
+    Edges are counted so that removing an edge or a node splits its set
+    again if the set is no longer connected. Splitting only visits the
+    affected set.
+
+    .. versionadded:: 1.0.7
+    """
+
+    def __init__(self):
+        self._parent = {}
+        self._members = {}
+        self._edges = {}
+
+    def __contains__(self, node):
+        return node in self._parent
+
+    def __len__(self):
+        return len(self._parent)
+
+    def add(self, node):
+        """Adds a node as a singleton set, if it does not exist."""
+        if node not in self._parent:
+            self._parent[node] = node
+            self._members[node] = {node}
+            self._edges[node] = {}
+
+    def find(self, node):
+        """Returns the representative node of the node's set."""
+        root = node
+        while self._parent[root] != root:
+            root = self._parent[root]
+        while self._parent[node] != root:
+            self._parent[node], node = root, self._parent[node]
+        return root
+
+    def members(self, node) -> set:
+        """Returns the nodes in the node's set."""
+        return self._members[self.find(node)]
+
+    def degree(self, node) -> int:
+        """Returns the number of edges of the node."""
+        return sum(self._edges[node].values())
+
+    def _merge(self, node1, node2):
+        root1 = self.find(node1)
+        root2 = self.find(node2)
+        if root1 == root2:
+            return
+        if len(self._members[root1]) < len(self._members[root2]):
+            root1, root2 = root2, root1
+        self._parent[root2] = root1
+        self._members[root1] |= self._members.pop(root2)
+
+    def union(self, node1, node2):
+        """Adds an edge between two nodes, merging their sets."""
+        self.add(node1)
+        self.add(node2)
+        edges1 = self._edges[node1]
+        edges1[node2] = edges1.get(node2, 0) + 1
+        if node1 != node2:
+            edges2 = self._edges[node2]
+            edges2[node1] = edges2.get(node1, 0) + 1
+        self._merge(node1, node2)
+
+    def _discard_edge(self, node1, node2):
+        edges = self._edges[node1]
+        count = edges.get(node2, 0) - 1
+        if count > 0:
+            edges[node2] = count
+        else:
+            edges.pop(node2, None)
+
+    def remove_edge(self, node1, node2):
+        """Removes an edge between two nodes, splitting their set if it is
+        no longer connected."""
+        if node2 not in self._edges.get(node1, {}):
+            return
+        self._discard_edge(node1, node2)
+        if node1 != node2:
+            self._discard_edge(node2, node1)
+        if node2 not in self._edges[node1]:
+            self._split(self.find(node1))
+
+    def remove(self, node):
+        """Removes a node and its edges."""
+        if node not in self._parent:
+            return
+        root = self.find(node)
+        for other in self._edges.pop(node):
+            if other != node:
+                self._edges[other].pop(node, None)
+        members = self._members.pop(root)
+        members.discard(node)
+        del self._parent[node]
+        for member in members:
+            self._parent[member] = member
+            self._members[member] = {member}
+        self._rejoin(members)
+
+    def _split(self, root):
+        members = self._members.pop(root)
+        for member in members:
+            self._parent[member] = member
+            self._members[member] = {member}
+        self._rejoin(members)
+
+    def _rejoin(self, members):
+        for member in members:
+            for other in self._edges[member]:
+                self._merge(member, other)
+
+
+class RoutingIndex:
+    """Sample routing equivalence classes of a plan.
+
+    Field values are grouped by their routing key (see
+    :meth:`Planner._routing_key <pydent.planner.Planner._routing_key>`) and
+    routing keys connected by wires are joined into a class. Field values in
+    the same class must share the same sample.
+
+    Keys are cached by field value `rid`, so the routing key of a field value
+    must not change while it is indexed (e.g. it must not depend on the
+    position of the field value in its input array).
+
+    .. versionadded:: 1.0.7
+    """
+
+    def __init__(self, routing_id: Callable):
+        """Initializes the index.
+
+        :param routing_id: function that returns the routing key of a field
+            value
+        """
+        self.routing_id = routing_id
+        self.classes = UnionFind()
+        self._keys = {}
+        self._field_values = {}
+
+    def key(self, field_value) -> str:
+        """Returns the routing key of the field value, adding the field value
+        to the index if it is missing."""
+        key = self._keys.get(field_value.rid)
+        if key is None:
+            key = self.routing_id(field_value)
+            self._keys[field_value.rid] = key
+            self._field_values.setdefault(key, field_value)
+            self.classes.add(key)
+        return key
+
+    def add_field_value(self, field_value):
+        self._field_values[self.key(field_value)] = field_value
+
+    def remove_field_value(self, field_value):
+        """Removes the field value, unless it is still wired."""
+        key = self._keys.get(field_value.rid)
+        if key is not None and not self.classes.degree(key):
+            del self._keys[field_value.rid]
+            self._field_values.pop(key, None)
+            self.classes.remove(key)
+
+    def add_wire(self, wire):
+        self.add_field_value(wire.source)
+        self.add_field_value(wire.destination)
+        self.classes.union(self.key(wire.source), self.key(wire.destination))
+
+    def remove_wire(self, wire):
+        self.classes.remove_edge(self.key(wire.source), self.key(wire.destination))
+
+    def field_values(self, field_value) -> list:
+        """Returns a field value for every routing key in the field value's
+        class."""
+        members = self.classes.members(self.key(field_value))
+        return [self._field_values[key] for key in members]
@@ -92,6 +92,7 @@ class BaseRelationship(fields.Relationship):
 
     QUERY_TYPE = None
     ACCESSOR = BaseRelationshipAccessor
+    BATCHED = False  #: whether the relationship is loaded for all siblings at once
 
     def __init__(
         self,
@@ -166,7 +167,87 @@ class BaseRelationship(fields.Relationship):
             ref = "{}_{}".format(inflection.underscore(nested), attr)
         return ref, attr
 
+    def _get_query_key(self, model):
+        if self.QUERY_TYPE == "by_id":
+            return getattr(model, self.ref)
+        return getattr(model, self.attr)
+
+    def _unloaded_siblings(self, owner) -> list:
+        """Returns the siblings of the owner (see
+        :meth:`pydent.base.ModelBase.get_siblings`) whose relationship can
+        be loaded in a single batched query."""
+        if (
+            not self.BATCHED
+            or self.attr != "id"
+            or self.callback
+            not in (ModelBase.find_callback.__name__, ModelBase.where_callback.__name__)
+        ):
+            return []
+        siblings = owner.get_siblings()
+        if len(siblings) < 2 or owner.session is None:
+            return []
+        if self._get_query_key(owner) is None:
+            return []
+        return [
+            m
+            for m in siblings
+            if m.session is owner.session
+            and m.id is not None
+            and not m.is_deserialized(self.data_key)
+            and self._get_query_key(m) is not None
+        ]
+
+    def _fullfill_siblings(self, owner) -> bool:
+        """Loads the relationship for the owner and all of its unloaded
+        siblings using :meth:`pydent.browser.Browser.retrieve`.
+
+        .. versionadded:: 1.0.7
+
+        :return: whether the owner's relationship was loaded
+        """
+        siblings = self._unloaded_siblings(owner)
+        if owner not in siblings or len(siblings) < 2:
+            return False
+        session = owner.session
+        if session.using_cache:
+            browser = session.browser
+        else:
+            browser = session._get_uncached_browser()
+        session._log_to_aqhttp(
+            "CALLBACK '{clsname}(rid={rid})' made a batched request for '{name}' "
+            "of {num} models".format(
+                clsname=owner.__class__.__name__,
+                rid=owner.rid,
+                name=self.data_key,
+                num=len(siblings),
+            )
+        )
+        browser.retrieve(siblings, self.data_key)
+
+        # siblings with no related models on the server
+        empty = [] if self.many else None
+        for model in siblings:
+            if not model.is_deserialized(self.data_key):
+                self.cache_result(model, empty)
+        return True
+
     def fullfill(self, owner, cache=None, extra_args=None, extra_kwargs=None):
+        """Calls the callback function using the owner object (see
+        :meth:`pydent.marshaller.fields.Callback.fullfill`).
+
+        .. versionchanged:: 1.0.7
+            If the result is cached, the relationship is loaded for the
+            unloaded siblings of the owner in a single batched query.
+        """
+        if cache is None:
+            cache = self.cache
+        if (
+            cache
+            and not extra_args
+            and not extra_kwargs
+            and self._fullfill_siblings(owner)
+        ):
+            return owner._get_deserialized_data()[self.data_key]
         try:
             return super().fullfill(
                 owner, cache, extra_args=extra_args, extra_kwargs=extra_kwargs
@@ -176,28 +257,39 @@ class BaseRelationship(fields.Relationship):
 
     def build_query(self, models):
         """Bundles all of the callback args for the models into a single
-        query."""
+        query.
+
+        .. versionchanged:: 1.0.7
+            Duplicated values are dropped using sets rather than list
+            lookups.
+        """
         args = {}
+        seen = {}
+
+        def add(k, v):
+            arg_set = seen.setdefault(k, set())
+            if v not in arg_set:
+                arg_set.add(v)
+                args[k].append(v)
+
         for s in models:
             callback_args = self.get_callback_args(s)[1:]
             if self.QUERY_TYPE == "by_id":
                 args.setdefault(self.attr, [])
                 for x in callback_args:
-                    if x is not None and x not in args[self.attr]:
-                        args[self.attr].append(x)
+                    if x is not None:
+                        add(self.attr, x)
             else:
                 for cba in callback_args:
                     for k in cba:
                         args.setdefault(k, [])
-                        arg_arr = args[k]
                         val = cba[k]
                         if val is not None:
                             if isinstance(val, list):
                                 for v in val:
-                                    if v not in arg_arr:
-                                        arg_arr.append(v)
-                            elif val not in arg_arr:
-                                arg_arr.append(val)
+                                    add(k, v)
+                            else:
+                                add(k, val)
         return args
 
 
@@ -287,6 +379,8 @@ class Many(BaseRelationship):
 
 
 class HasOne(One):
+    BATCHED = True
+
     def __init__(
         self, nested, attr=None, ref=None, callback=None, callback_kwargs=None, **kwargs
     ):
@@ -337,6 +431,8 @@ class HasMany(Many):
     """A relationship that establishes a One-to-Many relationship with another
     model."""
 
+    BATCHED = True
+
     def __init__(
         self,
         nested,
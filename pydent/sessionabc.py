@@ -1,6 +1,33 @@
 from abc import ABC
 
 
+class SessionHandle:
+    """A reference to a session shared by the models of the session.
+
+    Models refer to their session through its handle. Moving all of the
+    models of a session to another session re-points the handle to the
+    handle of the other session rather than updating every model.
+
+    .. versionadded:: 1.0.7
+    """
+
+    __slots__ = ["target"]
+
+    def __init__(self, target):
+        self.target = target  #: the session, or the handle it was moved to
+
+    @property
+    def session(self) -> "SessionABC":
+        """The session this handle resolves to."""
+        handle = self
+        while type(handle.target) is SessionHandle:
+            handle = handle.target
+        if handle is not self and self.target is not handle:
+            # shorten the chain for the next lookups
+            self.target = handle
+        return handle.target
+
+
 class SessionABC(ABC):
     """Session abstract base class."""
 
@@ -31,3 +58,25 @@ class SessionABC(ABC):
     User = None  #: User model interface
     UserBudgetAssociation = None  #: UserBudgetAssociation model interface
     Wire = None  #: Wire model interface
+
+    def _get_handle(self) -> SessionHandle:
+        """Returns the handle that new models of this session refer to.
+
+        .. versionadded:: 1.0.7
+        """
+        handle = self.__dict__.get("_session_handle", None)
+        if handle is None:
+            handle = self._session_handle = SessionHandle(self)
+        return handle
+
+    def _move_models(self, to_session: "SessionABC"):
+        """Moves all of the models of this session to another session in
+        constant time. Models created afterwards belong to this session.
+
+        .. versionadded:: 1.0.7
+        """
+        if to_session is self:
+            return
+        handle = self.__dict__.pop("_session_handle", None)
+        if handle is not None:
+            handle.target = to_session._get_handle()
@@ -0,0 +1,462 @@
+"""A minimal asyncio HTTP/1.1 client.
+
+Connections are opened with :func:`asyncio.open_connection` and kept
+alive in a per-host pool so that many concurrent requests can be made
+from a single thread without a thread pool.
+
+Requests are sent with the settings of a :class:`requests.Session`: its
+cookie jar is sent and updated as responses set cookies, and its proxies
+and `verify` and `cert` settings, merged with the environment
+(`HTTP_PROXY`, `HTTPS_PROXY`, `NO_PROXY`, `REQUESTS_CA_BUNDLE`, etc.) as
+:mod:`requests` does, are used to open connections.
+"""
+
+import asyncio
+import email.message
+import gzip
+import json
+import os
+import ssl
+import time
+import zlib
+from datetime import timedelta
+from urllib.parse import urljoin
+from urllib.parse import urlsplit
+from urllib.parse import urlunsplit
+
+import requests
+from requests.auth import _basic_auth_str
+from requests.cookies import get_cookie_header
+from requests.cookies import MockRequest
+from requests.cookies import MockResponse
+from requests.structures import CaseInsensitiveDict
+from requests.utils import DEFAULT_CA_BUNDLE_PATH
+from requests.utils import get_auth_from_url
+from requests.utils import select_proxy
+
+MAX_REDIRECTS = 5
+#: methods that are retried on a new connection if a reused one was closed
+IDEMPOTENT_METHODS = frozenset(["GET", "HEAD", "PUT", "DELETE", "OPTIONS", "TRACE"])
+#: headers that are not sent to a redirect on another host
+CREDENTIAL_HEADERS = frozenset(["cookie", "authorization"])
+#: statuses whose responses never have a body
+BODILESS_STATUSES = frozenset([204, 304])
+
+
+class AsyncRequest:
+    """The request that produced an :class:`AsyncResponse`."""
+
+    def __init__(self, method: str, url: str, body: bytes = None):
+        self.method = method.upper()
+        self.url = url
+        self.body = body
+
+
+class AsyncResponse:
+    """A decoded http response. Mirrors the subset of the
+    :class:`requests.Response` api that trident uses."""
+
+    def __init__(
+        self,
+        request: AsyncRequest,
+        url: str,
+        status_code: int,
+        reason: str,
+        headers: CaseInsensitiveDict,
+        content: bytes,
+        elapsed: float,
+    ):
+        self.request = request
+        self.url = url
+        self.status_code = status_code
+        self.reason = reason
+        self.headers = headers
+        self.content = content
+        self.elapsed = timedelta(seconds=elapsed)
+
+    @property
+    def text(self) -> str:
+        return self.content.decode("utf-8", errors="replace")
+
+    def json(self):
+        return json.loads(self.text)
+
+    def __repr__(self):
+        return "<{} [{}]>".format(self.__class__.__name__, self.status_code)
+
+
+class AsyncConnectionPool:
+    """Pool of idle keep-alive connections keyed by (scheme, host, port) and
+    the proxy and ssl settings of the connection."""
+
+    def __init__(
+        self, maxsize: int = 10, headers: dict = None, session: requests.Session = None
+    ):
+        """Initializes the pool.
+
+        :param maxsize: maximum number of idle connections to keep per host
+        :param headers: default headers to send with every request
+        :param session: the requests session whose cookie jar, proxies and
+            `verify`, `cert` and `trust_env` settings are used. Defaults to a
+            new session.
+        """
+        if session is None:
+            session = requests.Session()
+        self.maxsize = maxsize
+        self.headers = dict(headers or {})
+        self.session = session
+        self.num_connections = 0  #: number of connections opened
+        self._idle = {}
+        self._ssl_contexts = {}
+
+    @staticmethod
+    def _origin(parts):
+        port = parts.port
+        if port is None:
+            port = 443 if parts.scheme == "https" else 80
+        return parts.scheme, parts.hostname, port
+
+    def _key(self, url):
+        """Returns the key of the connections for the url: its origin, the
+        proxy to connect through and the ssl settings."""
+        settings = self.session.merge_environment_settings(url, {}, None, None, None)
+        proxy = select_proxy(url, settings["proxies"])
+        verify, cert = settings["verify"], settings["cert"]
+        if isinstance(cert, list):
+            cert = tuple(cert)
+        return self._origin(urlsplit(url)) + (proxy, verify, cert)
+
+    def _ssl_context(self, verify, cert) -> ssl.SSLContext:
+        """Returns the ssl context for the `verify` and `cert` settings (see
+        :meth:`requests.Session.request`)."""
+        key = verify, cert
+        context = self._ssl_contexts.get(key)
+        if context is not None:
+            return context
+        if verify is False:
+            context = ssl.create_default_context()
+            context.check_hostname = False
+            context.verify_mode = ssl.CERT_NONE
+        else:
+            if not isinstance(verify, str):
+                verify = DEFAULT_CA_BUNDLE_PATH
+            if os.path.isdir(verify):
+                context = ssl.create_default_context(capath=verify)
+            else:
+                context = ssl.create_default_context(cafile=verify)
+        if cert:
+            if isinstance(cert, str):
+                context.load_cert_chain(cert)
+            else:
+                context.load_cert_chain(*cert)
+        self._ssl_contexts[key] = context
+        return context
+
+    @staticmethod
+    def _proxy_headers(proxy) -> dict:
+        username, password = get_auth_from_url(proxy)
+        if username:
+            return {"Proxy-Authorization": _basic_auth_str(username, password)}
+        return {}
+
+    async def _connect(self, key):
+        scheme, host, port, proxy, verify, cert = key
+        ssl_context = None
+        if scheme == "https":
+            ssl_context = self._ssl_context(verify, cert)
+        self.num_connections += 1
+        if proxy is None:
+            return await asyncio.open_connection(host, port, ssl=ssl_context)
+        proxy_parts = urlsplit(proxy if "://" in proxy else "http://" + proxy)
+        proxy_ssl = None
+        if proxy_parts.scheme == "https":
+            proxy_ssl = self._ssl_context(verify, None)
+        reader, writer = await asyncio.open_connection(
+            *self._origin(proxy_parts)[1:], ssl=proxy_ssl
+        )
+        if ssl_context is None:
+            # plain http requests are sent to the proxy with absolute urls
+            return reader, writer
+        try:
+            await self._open_tunnel(reader, writer, host, port, proxy)
+            if not hasattr(writer, "start_tls"):
+                raise ConnectionError(
+                    "Https requests through a proxy require Python 3.11 or later"
+                )
+            await writer.start_tls(ssl_context, server_hostname=host)
+        except BaseException:
+            writer.close()
+            raise
+        return reader, writer
+
+    async def _open_tunnel(self, reader, writer, host, port, proxy):
+        """Asks the proxy to tunnel the connection to the host."""
+        target = "{}:{}".format(host, port)
+        headers = {"Host": target}
+        headers.update(self._proxy_headers(proxy))
+        self._write_head(writer, "CONNECT", target, headers)
+        await writer.drain()
+        _, status, reason, _, _ = await self._read_head(reader)
+        if status != 200:
+            raise ConnectionError(
+                "Proxy {} refused to tunnel to {}: {} {}".format(
+                    proxy, target, status, reason
+                )
+            )
+
+    def _get_idle(self, key):
+        idle = self._idle.get(key, [])
+        while idle:
+            reader, writer = idle.pop()
+            if not reader.at_eof() and not writer.is_closing():
+                return reader, writer
+            writer.close()
+        return None
+
+    def _release(self, key, conn):
+        idle = self._idle.setdefault(key, [])
+        if len(idle) < self.maxsize:
+            idle.append(conn)
+        else:
+            conn[1].close()
+
+    def close(self):
+        """Closes all idle connections."""
+        for idle in self._idle.values():
+            for _, writer in idle:
+                writer.close()
+        self._idle = {}
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        headers: dict = None,
+        body: bytes = None,
+        timeout: float = None,
+        idempotent: bool = None,
+        cookies: dict = None,
+    ) -> AsyncResponse:
+        """Performs a http request, following redirects. Credential headers
+        and `cookies` are not sent to redirects on another host. The cookies of
+        the session's cookie jar are sent to the hosts they belong to.
+
+        :param idempotent: whether the request may be sent again if a reused
+            connection was closed by the server. Defaults to whether the method
+            is idempotent.
+        :param cookies: additional cookies to send to the host of the url
+        :raises asyncio.TimeoutError: if the request exceeds the timeout
+        """
+        return await asyncio.wait_for(
+            self._request_with_redirects(
+                method, url, headers, body, idempotent, cookies
+            ),
+            timeout,
+        )
+
+    @staticmethod
+    def _strip_credentials(headers):
+        return {
+            k: v
+            for k, v in (headers or {}).items()
+            if k.lower() not in CREDENTIAL_HEADERS
+        }
+
+    def _cookie_header(self, method, url, headers, cookies):
+        """Returns the Cookie header of a request: the given Cookie header,
+        the cookies of the session's cookie jar for the url and the `cookies`
+        that are not in the jar."""
+        values = [v for k, v in headers.items() if k.lower() == "cookie"]
+        jar_header = get_cookie_header(
+            self.session.cookies, requests.Request(method, url)
+        )
+        names = set()
+        if jar_header:
+            values.append(jar_header)
+            names = {c.split("=", 1)[0].strip() for c in jar_header.split(";")}
+        values += [
+            "{}={}".format(k, v) for k, v in (cookies or {}).items() if k not in names
+        ]
+        return "; ".join(values)
+
+    def _extract_cookies(self, method, url, set_cookies):
+        """Stores the cookies set by a response in the session's cookie jar."""
+        if not set_cookies:
+            return
+        message = email.message.Message()
+        for value in set_cookies:
+            message["Set-Cookie"] = value
+        self.session.cookies.extract_cookies(
+            MockResponse(message), MockRequest(requests.Request(method, url))
+        )
+
+    async def _request_with_redirects(
+        self, method, url, headers, body, idempotent=None, cookies=None
+    ):
+        request = AsyncRequest(method, url, body)
+        origin = self._origin(urlsplit(url))
+        headers = dict(headers or {})
+        start = time.time()
+        for _ in range(MAX_REDIRECTS + 1):
+            if idempotent is None:
+                retry = method.upper() in IDEMPOTENT_METHODS
+            else:
+                retry = idempotent
+            request_headers = {
+                k: v for k, v in headers.items() if k.lower() != "cookie"
+            }
+            cookie = self._cookie_header(method, url, headers, cookies)
+            if cookie:
+                request_headers["Cookie"] = cookie
+            status, reason, response_headers, content, set_cookies = (
+                await self._request(method, url, request_headers, body, retry=retry)
+            )
+            self._extract_cookies(method, url, set_cookies)
+            location = response_headers.get("Location")
+            if status in (301, 302, 303, 307, 308) and location:
+                url = urljoin(url, location)
+                if self._origin(urlsplit(url)) != origin:
+                    headers = self._strip_credentials(headers)
+                    cookies = None
+                if status in (301, 302, 303):
+                    method, body, idempotent = "GET", None, None
+                continue
+            break
+        return AsyncResponse(
+            request,
+            url,
+            status,
+            reason,
+            response_headers,
+            content,
+            time.time() - start,
+        )
+
+    async def _request(self, method, url, headers, body, retry=False):
+        parts = urlsplit(url)
+        key = self._key(url)
+        while True:
+            conn = self._get_idle(key)
+            reused = conn is not None
+            if conn is None:
+                conn = await self._connect(key)
+            try:
+                response = await self._send(conn, method, parts, key, headers, body)
+            except (ConnectionError, asyncio.IncompleteReadError):
+                conn[1].close()
+                if reused and retry:
+                    # the server closed an idle connection; retry on a new one
+                    continue
+                raise
+            except BaseException:
+                conn[1].close()
+                raise
+            status, reason, response_headers, content, set_cookies, keep_alive = (
+                response
+            )
+            if keep_alive:
+                self._release(key, conn)
+            else:
+                conn[1].close()
+            return status, reason, response_headers, content, set_cookies
+
+    @staticmethod
+    def _write_head(writer, method, target, headers):
+        lines = ["{} {} HTTP/1.1".format(method.upper(), target)]
+        lines += ["{}: {}".format(k, v) for k, v in headers.items()]
+        writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1"))
+
+    @staticmethod
+    async def _read_head(reader):
+        """Reads the status line and headers of a response.
+
+        :return: the http version, status, reason, headers and the values of
+            the Set-Cookie headers
+        """
+        status_line = await reader.readline()
+        if not status_line:
+            raise ConnectionResetError("Connection closed by server")
+        version, status, *reason = status_line.decode("latin-1").split(" ", 2)
+        reason = reason[0].strip() if reason else ""
+        headers = CaseInsensitiveDict()
+        set_cookies = []
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            k, v = line.decode("latin-1").split(":", 1)
+            k, v = k.strip(), v.strip()
+            if k.lower() == "set-cookie":
+                set_cookies.append(v)
+            headers[k] = v
+        return version, int(status), reason, headers, set_cookies
+
+    async def _send(self, conn, method, parts, key, headers, body):
+        reader, writer = conn
+        scheme, _, _, proxy, _, _ = key
+        target = parts.path or "/"
+        if parts.query:
+            target += "?" + parts.query
+        host = parts.hostname
+        if parts.port is not None:
+            host = "{}:{}".format(host, parts.port)
+        request_headers = dict(self.headers)
+        request_headers.update(headers or {})
+        request_headers["Host"] = host
+        request_headers["Content-Length"] = str(len(body) if body else 0)
+        if proxy is not None and scheme == "http":
+            target = urlunsplit((scheme, host, target, "", ""))
+            request_headers.update(self._proxy_headers(proxy))
+        self._write_head(writer, method, target, request_headers)
+        if body:
+            writer.write(body)
+        await writer.drain()
+
+        version, status, reason, response_headers, set_cookies = await self._read_head(
+            reader
+        )
+        keep_alive = response_headers.get("Connection", "").lower() != "close"
+        if version == "HTTP/1.0":
+            keep_alive = response_headers.get("Connection", "").lower() == "keep-alive"
+        if method.upper() == "HEAD" or status < 200 or status in BODILESS_STATUSES:
+            content = b""
+        elif response_headers.get("Transfer-Encoding", "").lower() == "chunked":
+            content = await self._read_chunked(reader)
+        elif "Content-Length" in response_headers:
+            content = await reader.readexactly(int(response_headers["Content-Length"]))
+        else:
+            content = await reader.read()
+            keep_alive = False
+        return (
+            status,
+            reason,
+            response_headers,
+            self._decode(content, response_headers),
+            set_cookies,
+            keep_alive,
+        )
+
+    @staticmethod
+    async def _read_chunked(reader) -> bytes:
+        chunks = []
+        while True:
+            line = await reader.readline()
+            size = int(line.split(b";")[0].strip(), 16)
+            if size == 0:
+                # discard trailers
+                while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                    pass
+                return b"".join(chunks)
+            chunks.append(await reader.readexactly(size))
+            await reader.readexactly(2)
+
+    @staticmethod
+    def _decode(content: bytes, headers: CaseInsensitiveDict) -> bytes:
+        encoding = headers.get("Content-Encoding", "").lower()
+        if not content:
+            return content
+        if encoding == "gzip":
+            return gzip.decompress(content)
+        elif encoding == "deflate":
+            return zlib.decompress(content)
+        return content
@@ -26,6 +26,7 @@ class MatrixMapping(Sequence, Generic[T]):
     ):
         self.data = data
         self.validate()
+        self._index_cache = None
         self.setter = setter
         if getter is None:
             self.getter = lambda x: x
@@ -60,12 +61,17 @@ class MatrixMapping(Sequence, Generic[T]):
 
     @property
     def _index_matrix(self):
-        index_matrix = []
-        for r in range(len(self.data)):
-            col_indices = list(range(len(self.data[0])))
-            tuples = [(r, c) for c in col_indices]
-            index_matrix.append(tuples)
-        return MatrixMapping(index_matrix)
+        """The matrix of (row, column) indices, cached until the dimensions
+        change."""
+        dimensions = self.dimensions
+        if self._index_cache is None or self._index_cache[0] != dimensions:
+            index_matrix = []
+            for r in range(len(self.data)):
+                col_indices = list(range(len(self.data[0])))
+                tuples = [(r, c) for c in col_indices]
+                index_matrix.append(tuples)
+            self._index_cache = (dimensions, MatrixMapping(index_matrix))
+        return self._index_cache[1]
 
     @property
     def _index_view(self):
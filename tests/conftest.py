@@ -19,6 +19,9 @@ def pytest_addoption(parser):
     parser.addoption(
         "--webtest", action="store_true", default=False, help="run web tests"
     )
+    parser.addoption(
+        "--runslow", action="store_true", default=False, help="run slow tests"
+    )
     parser.addoption(
         "--recordmode",
         action="store",
@@ -29,6 +32,7 @@ def pytest_addoption(parser):
 
 def pytest_collection_modifyitems(config, items):
     skip_web = pytest.mark.skip(reason="need --webtest option to run")
+    skip_slow = pytest.mark.skip(reason="need --runslow option to run")
     record_mode = pytest.mark.record(config.getoption("--recordmode"))
     for item in items:
         if config.getoption("--recordmode") != "no":
@@ -36,6 +40,8 @@ def pytest_collection_modifyitems(config, items):
         if "webtest" in item.keywords:
             if not config.getoption("--webtest"):
                 item.add_marker(skip_web)
+        if item.get_closest_marker("slow") and not config.getoption("--runslow"):
+            item.add_marker(skip_slow)
 
 
 @pytest.fixture(autouse=True)
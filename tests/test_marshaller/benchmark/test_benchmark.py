@@ -5,6 +5,7 @@ import pytest
 
 from pydent.marshaller.base import add_schema
 from pydent.marshaller.base import SchemaModel
+from pydent.marshaller.fields import Alias
 from pydent.marshaller.fields import Callback
 from pydent.marshaller.fields import Field
 from pydent.marshaller.fields import Relationship
@@ -244,3 +245,123 @@ class TestBenchmarkRelationships:
         instance = ModelRegistry.get_model(model)()
         benchmark(instance.dump, include=include)
         assert instance.dump(include=include) == expected
+
+
+@pytest.mark.benchmark
+class TestBenchmarkSchemaTables:
+    @pytest.fixture(scope="function")
+    def Author(self, base):
+        @add_schema
+        class Author(base):
+            fields = dict(
+                publisher=Relationship("Publisher", "find", 4),
+                books=Relationship("Book", "find", 1, many=True),
+                name=Field(),
+                cached=Callback("find"),
+                publishing_company=Alias("publisher"),
+            )
+
+            def find(self, *args):
+                return None
+
+        return Author
+
+    @pytest.mark.parametrize("memoized", [True, False], ids=["memoized", "rebuilt"])
+    def test_get_relationships_100k(self, benchmark, memoized):
+        from pydent.models import Sample
+
+        schema = Sample._model_schema
+
+        def get_relationships():
+            for _ in range(100000):
+                if not memoized:
+                    # mimic regrouping the fields on every call
+                    schema.invalidate_field_tables()
+                Sample.get_relationships()
+
+        benchmark.pedantic(get_relationships, rounds=1, iterations=1)
+        assert "sample_type" in Sample.get_relationships()
+
+    def test_tables_are_memoized(self, Author):
+        schema = Author.model_schema
+        assert schema.grouped_fields is schema.grouped_fields
+        assert schema.relationships is schema.relationships
+        assert (
+            schema.relationships["publishing_company"]
+            is schema.relationships["publisher"]
+        )
+        assert set(schema.relationships) == {
+            "publisher",
+            "books",
+            "publishing_company",
+        }
+        assert set(schema.callbacks) == {
+            "publisher",
+            "books",
+            "cached",
+            "publishing_company",
+        }
+
+    def test_invalidate_field_tables(self, Author):
+        schema = Author.model_schema
+        relationships = schema.relationships
+        schema.fields["editor"] = Relationship("Editor", "find", 1)
+        assert "editor" not in schema.relationships
+        schema.invalidate_field_tables()
+        assert "editor" in schema.relationships
+        assert schema.relationships is not relationships
+
+
+@pytest.mark.benchmark
+class TestBenchmarkBulkLoad:
+    NUM_ROWS = 100000
+
+    @classmethod
+    def rows(cls):
+        return [
+            {"id": i, "name": "model{}".format(i), "field": i, "mydata": str(i)}
+            for i in range(cls.NUM_ROWS)
+        ]
+
+    @pytest.mark.parametrize("method", ["set_data", "set_data_many"])
+    def test_set_data_100k_rows(self, benchmark, base, method):
+        @add_schema
+        class Row(base):
+            fields = dict(field=Field())
+
+        rows = self.rows()
+        if method == "set_data":
+
+            def load():
+                return [Row._set_data(row) for row in rows]
+
+        else:
+
+            def load():
+                return Row._set_data_many(rows)
+
+        models = benchmark.pedantic(load, rounds=1, iterations=1)
+        assert len(models) == self.NUM_ROWS
+        assert models[-1].name == "model{}".format(self.NUM_ROWS - 1)
+
+    @pytest.mark.parametrize("method", ["set_data", "load_from"])
+    def test_load_from_100k_rows(self, benchmark, method):
+        from pydent.models import Item
+
+        class Owner:
+            session = None
+
+        rows = self.rows()
+        if method == "set_data":
+
+            def load():
+                return [Item._set_data(row, Owner) for row in rows]
+
+        else:
+
+            def load():
+                return Item.load_from(rows, Owner)
+
+        models = benchmark.pedantic(load, rounds=1, iterations=1)
+        assert len(models) == self.NUM_ROWS
+        assert models[-1].name == "model{}".format(self.NUM_ROWS - 1)
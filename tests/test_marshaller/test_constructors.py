@@ -5,6 +5,7 @@ from pydent.marshaller.base import ModelRegistry
 from pydent.marshaller.base import SchemaModel
 from pydent.marshaller.exceptions import ModelValidationError
 from pydent.marshaller.exceptions import SchemaException
+from pydent.marshaller.exceptions import SchemaModelException
 from pydent.marshaller.exceptions import SchemaRegistryError
 from pydent.marshaller.fields import Callback
 from pydent.marshaller.fields import Relationship
@@ -359,3 +360,58 @@ class TestCallback:
         else:
             with pytest.raises(ModelValidationError):
                 make_model()
+
+
+class TestSetDataMany:
+    @pytest.fixture(scope="function")
+    def MyModel(self, base):
+        @add_schema
+        class MyModel(base):
+            fields = dict(
+                field=Callback("find", cache=False), ignore=("password", "secret")
+            )
+
+            def find(self):
+                return 5
+
+            @property
+            def special(self):
+                return self.__dict__.get("_special")
+
+            @special.setter
+            def special(self, value):
+                self.__dict__["_special"] = value * 2
+
+        return MyModel
+
+    @staticmethod
+    def rows():
+        return [
+            {"id": 1, "name": "a", "password": "p", "field": 1},
+            {"id": 2, "special": 3, "secret": "s"},
+            None,
+        ]
+
+    def test_same_as_set_data(self, MyModel):
+        expected = [MyModel._set_data(row) for row in self.rows()]
+        rows = self.rows()
+        models = MyModel._set_data_many(rows)
+        assert [vars(m) for m in models] == [vars(m) for m in expected]
+        assert models[0]._get_data() is rows[0]
+        assert rows[0] == {"id": 1, "name": "a", "field": 1}
+        assert models[1].special == 6
+        assert models[0].name == "a"
+        assert MyModel._set_data_many([]) == []
+
+    def test_missing_schema(self, base):
+        class MyModel(base):
+            pass
+
+        with pytest.raises(SchemaModelException):
+            MyModel._set_data_many([{"id": 1}])
+
+    def test_replaced_accessor(self, MyModel):
+        MyModel._set_data_many([{"name": "a"}])
+        MyModel.name = property(lambda self: "b")
+        with pytest.raises(AttributeError):
+            MyModel._set_data_many([{"name": "a"}])
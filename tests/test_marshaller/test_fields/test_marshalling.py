@@ -180,6 +180,62 @@ class TestDump:
         assert m.dump(include="field1") == {"field1": 100, "field2": 100}
         assert m.dump(ignore="field2") == {}
 
+    def test_dump_does_not_share_data(self, base):
+        """Expect that changing a dump does not change the model."""
+
+        @add_schema
+        class MyModel(base):
+            fields = dict(source=Callback("find"))
+
+            def find(self):
+                return {"values": [1, 2]}
+
+        model = MyModel._set_data({"data": {"values": [1, 2]}})
+        data = model.dump(include="source")
+        data["data"]["values"].append(3)
+        data["source"]["values"].append(3)
+        assert model.dump(include="source") == {
+            "data": {"values": [1, 2]},
+            "source": {"values": [1, 2]},
+        }
+
+    def test_dump_plan(self, base):
+        @add_schema
+        class MyModel(base):
+            fields = dict(
+                field=Field(),
+                source=Callback("find", always_dump=True),
+                children=Nested("MyModel", many=True),
+            )
+
+            def find(self):
+                return None
+
+        plan = MyModel.model_schema.dump_plan
+        assert plan["callbacks"] == {"source", "children"}
+        assert plan["always_dump"] == {"source"}
+        assert plan["many"] == {"children"}
+
+    def test_dump_many(self, base):
+        @add_schema
+        class Publisher(base):
+            pass
+
+        publisher = Publisher._set_data({"id": 1, "name": "MyPublisher"})
+
+        @add_schema
+        class Author(base):
+            fields = dict(publisher=Callback("find"))
+
+            def find(self):
+                return publisher
+
+        authors = [Author._set_data({"id": i}) for i in range(3)]
+        data = Author.dump_many(authors, include="publisher")
+        assert data == [a.dump(include="publisher") for a in authors]
+        assert data[0]["publisher"] is data[1]["publisher"]
+        assert Author.dump_many([]) == []
+
     def test_empty_list_field(self, base):
         """Expect."""
 
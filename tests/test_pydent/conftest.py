@@ -1,10 +1,20 @@
+import asyncio
+import gzip
 import json
+import operator
 import os
+import re
+import threading
+import time
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
 
 import pytest
 import requests
 
 from pydent.aqsession import AqSession
+from pydent.marshaller import ModelRegistry
 
 
 @pytest.fixture(scope="session")
@@ -80,3 +90,417 @@ def no_requests(monkeypatch):
         raise Exception("Requests are disabled in {}".format(os.path.abspath(__file__)))
 
     monkeypatch.setattr("requests.sessions.Session.request", dummy)
+
+
+# keep a reference to the real request method so that tests using the local
+# stub server can re-enable http requests
+_session_request = requests.sessions.Session.request
+
+
+def encode_json(data, accept_encoding=""):
+    """Returns the body and content headers of a json response, gzipped if
+    the request accepts it."""
+    body = json.dumps(data).encode("utf-8")
+    headers = {"Content-Type": "application/json"}
+    if "gzip" in accept_encoding:
+        body = gzip.compress(body)
+        headers["Content-Encoding"] = "gzip"
+    headers["Content-Length"] = str(len(body))
+    return body, headers
+
+
+class StubAquariumHandler(BaseHTTPRequestHandler):
+    """Handles requests to the :class:`StubAquarium` server."""
+
+    protocol_version = "HTTP/1.1"
+    # headers and body are written separately; avoid delayed-ack stalls
+    disable_nagle_algorithm = True
+
+    def log_message(self, *args):
+        pass
+
+    def setup(self):
+        super().setup()
+        self.server.connection_opened()
+
+    def finish(self):
+        super().finish()
+        self.server.connection_closed()
+
+    def _send_json(self, data, status=200, headers=None):
+        body, content_headers = encode_json(
+            data, self.headers.get("Accept-Encoding", "")
+        )
+        self.send_response(status)
+        for k, v in list((headers or {}).items()) + list(content_headers.items()):
+            self.send_header(k, v)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _read_json(self):
+        length = int(self.headers.get("Content-Length", 0))
+        if not length:
+            return None
+        return json.loads(self.rfile.read(length).decode("utf-8"))
+
+    def _handle(self, method):
+        body = self._read_json()
+        path = self.path.strip("/")
+        self.server.record(method, path, body, dict(self.headers))
+        if self.server.latency:
+            time.sleep(self.server.latency)
+        status, data, headers = self.server.respond(path, body)
+        self._send_json(data, status=status, headers=headers)
+
+    def do_GET(self):
+        self._handle("get")
+
+    def do_POST(self):
+        self._handle("post")
+
+    def do_PUT(self):
+        self._handle("put")
+
+    def do_DELETE(self):
+        self._handle("delete")
+
+
+class StubIncludeError(Exception):
+    """Raised when the :class:`StubAquarium` cannot include a relationship."""
+
+
+class StubAquariumBase:
+    """The routes, json query endpoint and request records of a local,
+    in-memory Aquarium server.
+
+    :param tables: rows keyed by model name (e.g. ``{"Sample": [{"id": 1}]}``)
+    :param latency: fixed number of seconds to wait before each response
+    """
+
+    def __init__(self, tables=None, latency=0.0):
+        self.tables = tables or {}
+        self.latency = latency
+        self.routes = {}
+        self.unincludable = set()  # relationship names that cannot be included
+        self.requests = []
+        self.num_connections = 0
+        self.active_connections = 0
+        self.peak_connections = 0
+        self.rows_scanned = 0
+        self._lock = threading.Lock()
+
+    @property
+    def url(self):
+        return "http://{}:{}".format(*self.server_address)
+
+    def connection_opened(self):
+        with self._lock:
+            self.num_connections += 1
+            self.active_connections += 1
+            self.peak_connections = max(
+                self.peak_connections, self.active_connections
+            )
+
+    def connection_closed(self):
+        with self._lock:
+            self.active_connections -= 1
+
+    def record(self, method, path, body, headers):
+        with self._lock:
+            self.requests.append(
+                {"method": method, "path": path, "body": body, "headers": headers}
+            )
+
+    def json_requests(self):
+        return [r for r in self.requests if r["path"] == "json"]
+
+    def reset(self):
+        with self._lock:
+            self.requests = []
+            self.num_connections = 0
+            self.peak_connections = self.active_connections
+            self.rows_scanned = 0
+
+    SQL_CONDITION = re.compile(r'(\w+) (=|!=|<=|>=|<|>) "(.*?)"')
+    SQL_OPS = {
+        "=": operator.eq,
+        "!=": operator.ne,
+        "<": operator.lt,
+        ">": operator.gt,
+        "<=": operator.le,
+        ">=": operator.ge,
+    }
+
+    @classmethod
+    def _match_sql(cls, sql, row):
+        """Matches the sql conditions produced by
+        :meth:`pydent.aql.QueryBuilder.sql` (conditions joined by AND,
+        optionally grouped by OR)."""
+        for part in sql.split(" AND "):
+            matched = False
+            for k, op, v in cls.SQL_CONDITION.findall(part):
+                row_val = row.get(k)
+                if isinstance(row_val, (int, float)):
+                    v = type(row_val)(v)
+                else:
+                    row_val = str(row_val)
+                if cls.SQL_OPS[op](row_val, v):
+                    matched = True
+            if not matched:
+                return False
+        return True
+
+    @classmethod
+    def _match(cls, criteria, row):
+        if isinstance(criteria, str):
+            return cls._match_sql(criteria, row)
+        for k, v in criteria.items():
+            if isinstance(v, list):
+                if row.get(k) not in v:
+                    return False
+            elif row.get(k) != v:
+                return False
+        return True
+
+    def _include(self, model, rows, include):
+        """Embeds the rows of plain HasOne and HasMany relationships, as
+        the json endpoint does for the `include` argument."""
+        if isinstance(include, str):
+            include = {include: {}}
+        elif isinstance(include, list):
+            include = {name: {} for name in include}
+        relationships = ModelRegistry.get_model(model).get_relationships()
+        included_rows = []
+        for row in rows:
+            row = dict(row)
+            for name, opts in include.items():
+                relation = relationships.get(name, None)
+                if (
+                    name in self.unincludable
+                    or relation is None
+                    or relation.__class__.__name__ not in ("HasOne", "HasMany")
+                ):
+                    raise StubIncludeError("cannot include '{}'".format(name))
+                nested_rows = self.tables.get(relation.nested, [])
+                if relation.many:
+                    value = [r for r in nested_rows if r.get(relation.ref) == row["id"]]
+                else:
+                    value = [
+                        r for r in nested_rows if r["id"] == row.get(relation.ref)
+                    ][:1]
+                nested_include = (opts or {}).get("include", None)
+                if nested_include:
+                    value = self._include(relation.nested, value, nested_include)
+                if not relation.many:
+                    value = value[0] if value else None
+                row[name] = value
+            included_rows.append(row)
+        return included_rows
+
+    def respond(self, path, body):
+        """Returns the status, json data and headers of the response to a
+        request."""
+        if path == "sessions.json":
+            return 200, {}, {"Set-Cookie": "remember_token=stubtoken; path=/"}
+        if path in self.routes:
+            return 200, self.routes[path](body), {}
+        if path == "json":
+            try:
+                result = self.json_query(body)
+            except StubIncludeError as e:
+                return 500, {"errors": [str(e)]}, {}
+            if result is None:
+                return 422, {"errors": ["not found"]}, {}
+            return 200, result, {}
+        return 404, {"errors": ["no route"]}, {}
+
+    def json_query(self, body):
+        rows = self._json_query(body)
+        include = body.get("include", None)
+        if include and rows is not None:
+            if isinstance(rows, list):
+                return self._include(body["model"], rows, include)
+            return self._include(body["model"], [rows], include)[0]
+        return rows
+
+    def _json_query(self, body):
+        rows = sorted(self.tables.get(body["model"], []), key=lambda r: r["id"])
+        method = body.get("method")
+        if method is None and "id" in body:
+            for row in rows:
+                if row["id"] == body["id"]:
+                    return row
+            return None
+        if method == "find_by_name":
+            for row in rows:
+                if row.get("name") == body["arguments"][0]:
+                    return row
+            return None
+        if method == "where":
+            rows = [r for r in rows if self._match(body.get("arguments") or {}, r)]
+        options = body.get("options") or {}
+        if options.get("reverse"):
+            rows = rows[::-1]
+        offset = options.get("offset", -1)
+        if offset is not None and offset > 0:
+            rows = rows[offset:]
+        else:
+            offset = 0
+        limit = options.get("limit", -1)
+        if limit is not None and limit >= 0:
+            rows = rows[:limit]
+        # a database scans and discards the rows before the offset
+        with self._lock:
+            self.rows_scanned += offset + len(rows)
+        return rows
+
+
+class StubAquarium(StubAquariumBase, ThreadingHTTPServer):
+    """A local, in-memory Aquarium server that implements the json query
+    endpoint, served from threads. Counts accepted connections and records
+    every request it receives.
+
+    :param tables: rows keyed by model name (e.g. ``{"Sample": [{"id": 1}]}``)
+    :param latency: fixed number of seconds to wait before each response
+    """
+
+    daemon_threads = True
+
+    def __init__(self, tables=None, latency=0.0):
+        ThreadingHTTPServer.__init__(self, ("127.0.0.1", 0), StubAquariumHandler)
+        StubAquariumBase.__init__(self, tables, latency=latency)
+
+    def start(self):
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+
+class AsyncStubAquarium(StubAquariumBase):
+    """A :class:`StubAquarium` served by an asyncio server from an event loop
+    running in a background thread.
+
+    :param tables: rows keyed by model name (e.g. ``{"Sample": [{"id": 1}]}``)
+    :param latency: fixed number of seconds to wait before each response
+    """
+
+    def __init__(self, tables=None, latency=0.0):
+        super().__init__(tables, latency=latency)
+        self.server_address = None
+        self.loop = asyncio.new_event_loop()
+        self._server = None
+        self._thread = None
+        self._tasks = set()
+
+    def _call(self, coro):
+        return asyncio.run_coroutine_threadsafe(coro, self.loop).result()
+
+    def start(self):
+        self._thread = threading.Thread(target=self.loop.run_forever, daemon=True)
+        self._thread.start()
+        self._server = self._call(asyncio.start_server(self._serve, "127.0.0.1", 0))
+        self.server_address = self._server.sockets[0].getsockname()[:2]
+
+    async def _close(self):
+        self._server.close()
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        await self._server.wait_closed()
+
+    def stop(self):
+        self._call(self._close())
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join()
+        self.loop.close()
+
+    async def _serve(self, reader, writer):
+        task = asyncio.current_task()
+        self._tasks.add(task)
+        self.connection_opened()
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                method, target, _ = line.decode("latin-1").split(" ", 2)
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b""):
+                        break
+                    k, v = line.decode("latin-1").split(":", 1)
+                    headers[k.strip()] = v.strip()
+                lower_headers = {k.lower(): v for k, v in headers.items()}
+                length = int(lower_headers.get("content-length", 0))
+                body = None
+                if length:
+                    body = json.loads((await reader.readexactly(length)).decode())
+                path = target.strip("/")
+                self.record(method.lower(), path, body, headers)
+                if self.latency:
+                    await asyncio.sleep(self.latency)
+                status, data, extra_headers = self.respond(path, body)
+                content, content_headers = encode_json(
+                    data, lower_headers.get("accept-encoding", "")
+                )
+                lines = ["HTTP/1.1 {} {}".format(status, HTTPStatus(status).phrase)]
+                for k, v in list(extra_headers.items()) + list(content_headers.items()):
+                    lines.append("{}: {}".format(k, v))
+                writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1"))
+                writer.write(content)
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self.connection_closed()
+            writer.close()
+            self._tasks.discard(task)
+
+
+@pytest.fixture(scope="function")
+def stub_server(monkeypatch):
+    """Returns a factory that starts a local :class:`StubAquarium` (or
+    :class:`AsyncStubAquarium`, with `server_class`).
+
+    Http requests are re-enabled for tests that use this fixture.
+    """
+    monkeypatch.setattr("requests.sessions.Session.request", _session_request)
+    servers = []
+
+    def make_server(tables=None, latency=0.0, server_class=StubAquarium):
+        server = server_class(tables, latency=latency)
+        server.start()
+        servers.append(server)
+        return server
+
+    yield make_server
+    for server in servers:
+        server.stop()
+
+
+@pytest.fixture(scope="function")
+def stub_session(stub_server):
+    """Returns a factory for an :class:`AqSession` logged into a
+    :class:`StubAquarium`."""
+
+    def make_session(tables=None, latency=0.0, server_class=StubAquarium):
+        server = stub_server(tables, latency=latency, server_class=server_class)
+        session = AqSession("username", "password", server.url)
+        server.reset()
+        return session, server
+
+    return make_session
+
+
+@pytest.fixture(scope="function")
+def async_stub_session(stub_session):
+    """Returns a factory for an :class:`AqSession` logged into an
+    :class:`AsyncStubAquarium`."""
+
+    def make_session(tables=None, latency=0.0):
+        return stub_session(tables, latency=latency, server_class=AsyncStubAquarium)
+
+    return make_session
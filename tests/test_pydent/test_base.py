@@ -319,3 +319,62 @@ def test_dump_model(base):
     assert "__model__" not in no_mt
     assert "__model__" in with_mt
     assert with_mt["__model__"] == "MyModel"
+
+
+def test_dump_many(base):
+    @add_schema
+    class MyModel(base):
+        pass
+
+    models = [MyModel() for _ in range(3)]
+    for i, model in enumerate(models):
+        model.id = i
+    assert MyModel.dump_many(models, include_model_type=True, include_uri=True) == [
+        m.dump(include_model_type=True, include_uri=True) for m in models
+    ]
+
+
+def _load_state(model):
+    """Returns the state of a loaded model, without its record ids."""
+
+    def normalize(value):
+        if isinstance(value, ModelBase):
+            return value.__class__.__name__, value.id
+        if isinstance(value, list):
+            return [normalize(v) for v in value]
+        if isinstance(value, dict):
+            return [(k, normalize(v)) for k, v in value.items() if k != "rid"]
+        return value
+
+    state = []
+    for k, v in vars(model).items():
+        if k == "_rid":
+            continue
+        state.append((k, normalize(v)))
+    return state
+
+
+LOAD_ROWS = [
+    {"id": 1, "name": "a", "locator_id": 4, "sample": {"id": 5, "name": "s"}},
+    {"id": 2, "extra": [1, 2], "sample_id": 3, "items": [{"id": 6}]},
+    {"name": "b", "key": "k", "object_type": None},
+    {},
+]
+
+
+@pytest.mark.parametrize("model_name", sorted(ModelRegistry.models))
+def test_load_from_list_is_same_as_set_data(fake_session, model_name):
+    model_class = ModelRegistry.get_model(model_name)
+    if not issubclass(model_class, ModelBase):
+        return
+    rows = copy.deepcopy(LOAD_ROWS)
+    try:
+        expected = [model_class._set_data(row, fake_session) for row in rows]
+    except Exception as e:
+        with pytest.raises(type(e)):
+            model_class.load_from(copy.deepcopy(LOAD_ROWS), fake_session)
+        return
+    models = model_class.load_from(copy.deepcopy(LOAD_ROWS), fake_session)
+    assert [_load_state(m) for m in models] == [_load_state(m) for m in expected]
+    assert all(m.session is fake_session for m in models)
+    assert len({m.rid for m in models + expected}) == 2 * len(rows)
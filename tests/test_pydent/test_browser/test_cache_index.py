@@ -0,0 +1,155 @@
+import pytest
+
+from pydent.browser import Browser
+from pydent.browser import CacheIndex
+
+
+@pytest.fixture(scope="function")
+def tables():
+    return {
+        "Sample": [
+            {"id": i, "name": "sample{}".format(i), "sample_type_id": i % 3}
+            for i in range(1, 101)
+        ],
+        "Item": [
+            {"id": 1000 + i, "sample_id": i % 10, "object_type_id": i % 2 + 1}
+            for i in range(1, 101)
+        ],
+    }
+
+
+def load_samples(session, num):
+    return session.Sample.load(
+        [
+            {"id": i, "name": "sample{}".format(i), "sample_type_id": i % 3}
+            for i in range(1, num + 1)
+        ]
+    )
+
+
+def json_arguments(server):
+    return [r["body"]["arguments"] for r in server.json_requests()]
+
+
+class TestCacheIndex:
+    def test_candidates(self, fake_session):
+        samples = load_samples(fake_session, 30)
+        index = CacheIndex()
+        candidates = index.candidates({"sample_type_id": 1}, samples)
+        assert candidates == [s for s in samples if s.sample_type_id == 1]
+
+        candidates = index.candidates(
+            {"sample_type_id": [1, 2], "id": [1, 2, 3, 4]}, samples
+        )
+        assert {s.id for s in candidates} == {1, 2, 4}
+
+    def test_add_and_remove(self, fake_session):
+        samples = load_samples(fake_session, 10)
+        index = CacheIndex()
+        index.build("name", samples)
+        new_sample = fake_session.Sample.load(
+            {"id": 11, "name": "sample1", "sample_type_id": 1}
+        )
+        index.add(new_sample)
+        assert {s.id for s in index.candidates({"name": "sample1"}, samples)} == {
+            1,
+            11,
+        }
+        index.remove(samples[0])
+        assert index.candidates({"name": "sample1"}, samples) == [new_sample]
+
+    def test_unindexable_attribute(self, fake_session):
+        samples = load_samples(fake_session, 10)
+        samples[0]._get_data()["properties"] = {"a": 1}
+        index = CacheIndex()
+        assert index.build("properties", samples) is None
+        assert index.candidates({"properties": {"a": 1}}, samples) is None
+
+    def test_find_matches_with_index(self, fake_session):
+        samples = load_samples(fake_session, 30)
+        query = {"sample_type_id": [0, 1], "name": "sample3"}
+        expected = Browser._find_matches(query, samples)
+        assert Browser._find_matches(query, samples, index=CacheIndex()) == expected
+        assert [s.id for s in expected[0]] == [3]
+
+
+class TestCachedWhere:
+    def test_cache_is_indexed(self, stub_session, tables):
+        session, server = stub_session(tables)
+        browser = Browser(session)
+        browser.where({"sample_type_id": 1}, "Sample")
+        browser.where({"sample_type_id": 1}, "Sample")
+        assert "sample_type_id" in browser.model_index["Sample"]._indexes
+
+    def test_remaining_primary_keys(self, stub_session, tables):
+        session, server = stub_session(tables)
+        browser = Browser(session)
+        assert len(browser.where({"id": [1, 2, 3]}, "Sample")) == 3
+        samples = browser.where({"id": [2, 3, 4, 5]}, "Sample")
+        assert sorted(s.id for s in samples) == [2, 3, 4, 5]
+        assert json_arguments(server) == [{"id": [1, 2, 3]}, {"id": [4, 5]}]
+
+        server.reset()
+        assert len(browser.where({"id": [1, 5]}, "Sample")) == 2
+        assert not server.json_requests()
+
+    def test_remaining_non_primary_keys(self, stub_session, tables):
+        """Values of non-primary key queries already sent to the server are
+        served from the cache."""
+        session, server = stub_session(tables)
+        browser = Browser(session)
+        items = browser.where({"sample_id": [1, 2]}, "Item")
+        assert len(items) == 20
+        items = browser.where({"sample_id": [1, 2, 3]}, "Item")
+        assert len(items) == 30
+        assert {i.sample_id for i in items} == {1, 2, 3}
+        assert json_arguments(server) == [{"sample_id": [1, 2]}, {"sample_id": [3]}]
+
+        server.reset()
+        assert len(browser.where({"sample_id": 3}, "Item")) == 10
+        assert not server.json_requests()
+
+    def test_remaining_with_additional_criteria(self, stub_session, tables):
+        session, server = stub_session(tables)
+        browser = Browser(session)
+        browser.where({"sample_id": [1, 2], "object_type_id": 1}, "Item")
+        server.reset()
+        items = browser.where({"sample_id": [1, 2]}, "Item")
+        assert len(items) == 20
+        assert json_arguments(server) == [{"sample_id": [1, 2]}]
+
+    def test_limited_queries_are_not_completed(self, stub_session, tables):
+        session, server = stub_session(tables)
+        browser = Browser(session)
+        browser.where({"sample_id": 1}, "Item", opts={"limit": 2})
+        server.reset()
+        assert len(browser.where({"sample_id": 1}, "Item")) == 10
+        assert len(server.json_requests()) == 1
+
+    def test_clear(self, stub_session, tables):
+        session, server = stub_session(tables)
+        browser = Browser(session)
+        browser.where({"sample_id": 1}, "Item")
+        browser.clear()
+        server.reset()
+        assert len(browser.where({"sample_id": 1}, "Item")) == 10
+        assert len(server.json_requests()) == 1
+
+
+@pytest.mark.benchmark
+class TestCachedWhereBenchmark:
+    @pytest.mark.parametrize("indexed", [True, False], ids=["indexed", "scan"])
+    def test_cached_where_benchmark(
+        self, benchmark, monkeypatch, fake_session, indexed
+    ):
+        browser = Browser(fake_session)
+        browser.update_cache(load_samples(fake_session, 10000))
+        if not indexed:
+            # mimic the linear scan of the cache
+            monkeypatch.setattr(CacheIndex, "candidates", lambda *args: None)
+
+        def query():
+            for i in range(1, 21):
+                browser.where({"id": [i, i + 1]}, "Sample")
+
+        benchmark(query)
@@ -0,0 +1,196 @@
+import gc
+import tracemalloc
+
+import pytest
+
+from pydent.browser import Browser
+from pydent.cache_policies import ByteBudgetPolicy
+from pydent.cache_policies import estimate_model_size
+from pydent.cache_policies import LRUPolicy
+from pydent.cache_policies import TTLPolicy
+from pydent.models import Sample
+
+
+class FakeTimer:
+    def __init__(self):
+        self.time = 0.0
+
+    def __call__(self):
+        return self.time
+
+
+def sample_data(start, stop):
+    return [
+        {"id": i, "name": "sample{}".format(i), "sample_type_id": i % 3}
+        for i in range(start, stop)
+    ]
+
+
+def cached_ids(browser):
+    return sorted(browser.model_cache.get("Sample", {}))
+
+
+def test_lru_policy(fake_session):
+    browser = Browser(fake_session, cache_policies=[LRUPolicy(5)])
+    browser.update_cache(fake_session.Sample.load(sample_data(1, 6)))
+    assert cached_ids(browser) == [1, 2, 3, 4, 5]
+
+    # accessing a model makes it the most recently used
+    browser.find(1, "Sample")
+    browser.update_cache(fake_session.Sample.load(sample_data(6, 8)))
+    assert cached_ids(browser) == [1, 4, 5, 6, 7]
+    assert len(browser.cache_policies[0]) == 5
+
+
+def test_byte_budget_policy(fake_session):
+    samples = fake_session.Sample.load(sample_data(1, 101))
+    size = estimate_model_size(samples[0])
+    policy = ByteBudgetPolicy(size * 10)
+    browser = Browser(fake_session, cache_policies=[policy])
+    browser.update_cache(samples)
+    assert policy.size <= policy.max_bytes
+    assert 0 < len(browser.models) <= 10
+    assert len(policy) == len(browser.models)
+
+
+def test_ttl_policy(fake_session):
+    timer = FakeTimer()
+    policy = TTLPolicy(10, timer=timer)
+    browser = Browser(fake_session, cache_policies=[policy])
+    browser.update_cache(fake_session.Sample.load(sample_data(1, 4)))
+    timer.time = 5
+    browser.update_cache(fake_session.Sample.load(sample_data(4, 6)))
+    assert cached_ids(browser) == [1, 2, 3, 4, 5]
+
+    # accessing a model does not renew its time to live
+    browser.find(1, "Sample")
+    timer.time = 12
+    assert browser.where({"id": [4, 5]}, "Sample")
+    assert cached_ids(browser) == [4, 5]
+
+
+def test_evicted_models_referenced_elsewhere_are_restored(fake_session):
+    browser = Browser(fake_session, cache_policies=[LRUPolicy(2)])
+    samples = browser.update_cache(fake_session.Sample.load(sample_data(1, 5)))[
+        "Sample"
+    ]
+    assert cached_ids(browser) == [3, 4]
+
+    # evicted, but still referenced
+    assert browser.find(1, "Sample") is samples[0]
+
+    # reloading an evicted model returns the same instance
+    reloaded = fake_session.Sample.load({"id": 2, "name": "new name"})
+    assert browser.update_cache([reloaded])["Sample"] == [samples[1]]
+    assert samples[1].name == "new name"
+
+
+def test_evicted_models_are_released(fake_session):
+    browser = Browser(fake_session, cache_policies=[LRUPolicy(2)])
+    browser.update_cache(fake_session.Sample.load(sample_data(1, 5)))
+    gc.collect()
+    assert not browser._evicted_models["Sample"]
+
+
+def test_eviction_invalidates_completed_queries(stub_session):
+    session, server = stub_session({"Sample": sample_data(1, 11)})
+    browser = Browser(session, cache_policies=[LRUPolicy(20)])
+    assert len(browser.where({"sample_type_id": 1}, "Sample")) == 4
+    browser.set_cache_policies([LRUPolicy(2)])
+    server.reset()
+    assert len(browser.where({"sample_type_id": 1}, "Sample")) == 4
+    assert len(server.json_requests()) == 1
+
+
+def test_expired_models_referenced_elsewhere_are_not_served(stub_session):
+    session, server = stub_session({"Sample": sample_data(1, 5)})
+    timer = FakeTimer()
+    browser = Browser(session, cache_policies=[TTLPolicy(10, timer=timer)])
+    sample = browser.find(1, "Sample")
+    timer.time = 12
+    server.reset()
+
+    # expired, but still referenced
+    assert browser.find(2, "Sample")
+    assert not browser._evicted_models.get("Sample")
+    assert browser.find(1, "Sample").id == 1
+    assert len(server.json_requests()) == 2
+    assert sample.id == 1
+
+
+def test_evicted_models_referenced_elsewhere_expire(stub_session):
+    session, server = stub_session({"Sample": sample_data(1, 5)})
+    timer = FakeTimer()
+    browser = Browser(
+        session, cache_policies=[LRUPolicy(1), TTLPolicy(10, timer=timer)]
+    )
+    first = browser.find(1, "Sample")
+    browser.find(2, "Sample")
+    server.reset()
+
+    # evicted by the LRU policy and served without renewing its time to live
+    timer.time = 5
+    assert browser.find(1, "Sample") is first
+    browser.find(2, "Sample")
+    assert len(server.json_requests()) == 1
+
+    timer.time = 12
+    server.reset()
+    assert browser.find(1, "Sample").id == 1
+    assert len(server.json_requests()) == 1
+
+
+def test_clear(fake_session):
+    policy = LRUPolicy(2)
+    browser = Browser(fake_session, cache_policies=[policy])
+    browser.update_cache(fake_session.Sample.load(sample_data(1, 5)))
+    browser.clear()
+    assert len(policy) == 0
+    assert not browser._evicted_models
+
+
+@pytest.mark.slow
+@pytest.mark.benchmark
+class TestBoundedCacheBenchmark:
+
+    NUM_RECORDS = 1000000
+    WARMUP_RECORDS = 100000
+    CHUNK_SIZE = 10000
+    MAX_BYTES = 5 * 1024**2
+    MAX_ENTRIES = 50000
+
+    def test_load_1M_samples(self, benchmark, fake_session):
+        """Loads 1M fake samples through load_from into a browser with a byte
+        budget. The number of cached models and the memory traced by
+        tracemalloc must stop growing once the cache is full."""
+        policy = ByteBudgetPolicy(self.MAX_BYTES)
+        browser = Browser(
+            fake_session, cache_policies=[policy, LRUPolicy(self.MAX_ENTRIES)]
+        )
+        measured = {"entries": 0}
+
+        def load():
+            for start in range(1, self.NUM_RECORDS + 1, self.CHUNK_SIZE):
+                samples = Sample.load_from(
+                    sample_data(start, start + self.CHUNK_SIZE), fake_session
+                )
+                browser.update_cache(samples, recursive=False)
+                del samples
+                entries = sum(len(v) for v in browser.model_cache.values())
+                measured["entries"] = max(measured["entries"], entries)
+                if start + self.CHUNK_SIZE - 1 == self.WARMUP_RECORDS:
+                    gc.collect()
+                    measured["warmup"] = tracemalloc.get_traced_memory()[0]
+            gc.collect()
+            measured["resident"] = tracemalloc.get_traced_memory()[0]
+
+        gc.collect()
+        tracemalloc.start()
+        try:
+            benchmark.pedantic(load, rounds=1, iterations=1)
+        finally:
+            tracemalloc.stop()
+        assert 0 < measured["entries"] <= self.MAX_ENTRIES
+        assert measured["entries"] < self.NUM_RECORDS / 10
+        assert measured["resident"] <= measured["warmup"] * 1.1
+        assert len(browser.models) == len(policy)
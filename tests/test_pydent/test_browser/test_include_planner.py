@@ -0,0 +1,170 @@
+import pytest
+
+from pydent.browser import Browser
+from pydent.include_planner import IncludePlanner
+from pydent.include_planner import normalize_relations
+from pydent.include_planner import PlanNode
+
+RELATIONS = {"items": {"object_type": "sample_type", "data_associations": {}}}
+
+
+def new_tables(num_samples):
+    return {
+        "SampleType": [{"id": 1, "name": "Primer"}],
+        "ObjectType": [
+            {"id": 1, "name": "Primer Aliquot", "sample_type_id": 1},
+            {"id": 2, "name": "Primer Stock", "sample_type_id": 1},
+        ],
+        "Sample": [
+            {"id": i, "name": "s{}".format(i), "sample_type_id": 1}
+            for i in range(1, num_samples + 1)
+        ],
+        "Item": [
+            {"id": 100 * i + j, "sample_id": i, "object_type_id": j % 2 + 1}
+            for i in range(1, num_samples + 1)
+            for j in range(3)
+        ],
+        "DataAssociation": [
+            {
+                "id": i,
+                "parent_id": 100 + i,
+                "parent_class": "Item",
+                "key": "k",
+                "object": {"k": i},
+            }
+            for i in range(3)
+        ],
+    }
+
+
+def query_models(server):
+    return [r["body"]["model"] for r in server.json_requests()]
+
+
+def ids_by_attr(models_by_attr):
+    return {k: sorted(m.id for m in v) for k, v in models_by_attr.items()}
+
+
+def test_normalize_relations():
+    assert normalize_relations("items") == {"items": {}}
+    assert normalize_relations(["items", "sample_type"]) == {
+        "items": {},
+        "sample_type": {},
+    }
+    assert normalize_relations(RELATIONS) == {
+        "items": {"object_type": {"sample_type": {}}, "data_associations": {}}
+    }
+
+
+def test_plan(fake_session):
+    samples = fake_session.Sample.load(new_tables(10)["Sample"])
+    plan = Browser(fake_session).plan_get(samples, RELATIONS)
+
+    (items,) = plan.roots
+    assert items.mode == PlanNode.QUERY
+    object_type, data_associations = items.children
+    assert object_type.mode == PlanNode.INCLUDE
+    assert object_type.children[0].mode == PlanNode.INCLUDE
+    assert data_associations.mode == PlanNode.QUERY
+    assert data_associations.reason == "server cannot include"
+    assert plan.num_queries == 2
+    assert plan.includes == {
+        "items": {"object_type": {"include": {"sample_type": {"include": {}}}}}
+    }
+    assert "object_type [include]" in str(plan)
+
+
+def test_plan_with_duplicated_rows(fake_session):
+    samples = fake_session.Sample.load(new_tables(10)["Sample"])
+    plan = IncludePlanner(request_cost=10).plan(samples, RELATIONS)
+    object_type = plan.roots[0].children[0]
+    assert object_type.mode == PlanNode.QUERY
+    assert "duplicated rows cost more than a request" in object_type.reason
+    assert plan.num_queries == 3
+    assert plan.includes == {"items.object_type": {"sample_type": {"include": {}}}}
+
+
+def test_plan_with_excluded_relationship(fake_session):
+    samples = fake_session.Sample.load(new_tables(10)["Sample"])
+    plan = IncludePlanner(excluded={("Item", "object_type")}).plan(samples, RELATIONS)
+    assert plan.roots[0].children[0].reason == "server cannot include"
+
+
+def test_plan_root_has_one_uses_distinct_refs(fake_session):
+    samples = fake_session.Sample.load(new_tables(10)["Sample"])
+    plan = IncludePlanner().plan(samples, "sample_type")
+    assert plan.roots[0].rows == 1
+
+
+@pytest.mark.parametrize("use_cache", [False, True], ids=["no_cache", "cache"])
+def test_get_with_include(stub_session, use_cache):
+    session, server = stub_session(new_tables(10))
+    expected_session, _ = stub_session(new_tables(10))
+
+    browser = Browser(session, include_planner=IncludePlanner())
+    browser.use_cache = use_cache
+    samples = session.Sample.all()
+    server.reset()
+    results = browser.get(samples, RELATIONS)
+    assert query_models(server) == ["Item", "DataAssociation"]
+    assert browser.last_plan.num_queries == 2
+
+    expected = Browser(expected_session).get(expected_session.Sample.all(), RELATIONS)
+    assert ids_by_attr(results) == ids_by_attr(expected)
+
+    server.reset()
+    for s in samples:
+        for item in s.items:
+            assert item.object_type.id == item.object_type_id
+            assert item.object_type.sample_type.id == 1
+    assert not server.requests
+
+    object_types = {id(i.object_type) for s in samples for i in s.items}
+    assert len(object_types) == 2
+
+
+def test_get_falls_back_when_server_cannot_include(stub_session):
+    session, server = stub_session(new_tables(10))
+    server.unincludable.add("object_type")
+    browser = Browser(session, include_planner=IncludePlanner())
+    samples = session.Sample.all()
+    server.reset()
+
+    results = browser.get(samples, RELATIONS)
+    assert browser.last_plan.roots[0].fallback
+    assert query_models(server) == [
+        "Item",
+        "Item",
+        "ObjectType",
+        "SampleType",
+        "DataAssociation",
+    ]
+    assert sorted(m.id for m in results["object_type"]) == [1, 2]
+    assert all(i.object_type for s in samples for i in s.items)
+
+
+def test_get_without_planner(stub_session):
+    session, server = stub_session(new_tables(10))
+    browser = Browser(session)
+    samples = session.Sample.all()
+    server.reset()
+    browser.get(samples, RELATIONS)
+    assert browser.last_plan is None
+    assert query_models(server) == [
+        "Item",
+        "ObjectType",
+        "SampleType",
+        "DataAssociation",
+    ]
+
+
+def test_get_skips_loaded_relationships(stub_session):
+    session, server = stub_session(new_tables(10))
+    browser = Browser(session, include_planner=IncludePlanner())
+    samples = session.Sample.all()
+    browser.get(samples, RELATIONS)
+    server.reset()
+
+    results = browser.get(samples, RELATIONS)
+    assert not server.requests
+    assert sorted(m.id for m in results["object_type"]) == [1, 2]
@@ -0,0 +1,205 @@
+import pytest
+
+from pydent.browser import Browser
+from pydent.browser import BrowserException
+from pydent.browser import LayeredModelCache
+
+
+@pytest.fixture(scope="function")
+def tables():
+    return {
+        "Sample": [
+            {"id": i, "name": "sample{}".format(i), "sample_type_id": i % 3}
+            for i in range(1, 11)
+        ],
+        "Item": [
+            {"id": 1000 + i, "sample_id": i % 10, "object_type_id": 1}
+            for i in range(1, 101)
+        ],
+    }
+
+
+def load_samples(session, num):
+    return session.Sample.load(
+        [
+            {"id": i, "name": "sample{}".format(i), "sample_type_id": i % 3}
+            for i in range(1, num + 1)
+        ]
+    )
+
+
+def test_derive(fake_session):
+    parent = Browser(fake_session)
+    child = parent.derive()
+    assert child.parent is parent
+    assert child.session is fake_session
+    assert isinstance(child.model_cache, LayeredModelCache)
+    assert dict(child.model_cache) == {}
+
+
+def test_read_through(fake_session):
+    parent = Browser(fake_session)
+    samples = load_samples(fake_session, 10)
+    parent.update_cache(samples)
+    child = parent.derive()
+
+    assert child.model_cache["Sample"][1] is samples[0]
+    assert child.find(1, "Sample") is samples[0]
+    assert child.get("Sample") == samples
+    assert child.models == samples
+    assert child.model_cache.own == {"Sample": {}}
+
+    # models cached by the parent later are read through as well
+    new_sample = fake_session.Sample.load({"id": 11, "name": "sample11"})
+    parent.update_cache([new_sample])
+    assert child.find(11, "Sample") is new_sample
+
+
+def test_read_through_completed_queries(stub_session, tables):
+    session, server = stub_session(tables)
+    parent = Browser(session)
+    items = parent.where({"sample_id": [1, 2]}, "Item")
+    child = parent.derive()
+    server.reset()
+
+    found = child.where({"sample_id": 1}, "Item")
+    assert not server.json_requests()
+    assert {id(i) for i in found} == {id(i) for i in items if i.sample_id == 1}
+
+    found = child.where({"sample_id": [1, 3]}, "Item")
+    assert [r["body"]["arguments"] for r in server.json_requests()] == [
+        {"sample_id": [3]}
+    ]
+    assert len(found) == 20
+    assert set(child.model_cache.own["Item"]) == {
+        i.id for i in found if i.sample_id == 3
+    }
+    assert len(parent.model_cache["Item"]) == 20
+
+
+def test_shadowing(fake_session):
+    parent = Browser(fake_session)
+    samples = load_samples(fake_session, 3)
+    parent.update_cache(samples)
+    child = parent.derive()
+
+    shadow = fake_session.Sample.load({"id": 1, "name": "shadow"})
+    child.update_cache([shadow])
+    assert child.model_cache["Sample"][1] is shadow
+    assert parent.model_cache["Sample"][1] is samples[0]
+    assert samples[0].name == "sample1"
+
+    assert child.get("Sample", query={"name": "shadow"}) == [shadow]
+    assert child.get("Sample", query={"name": "sample1"}) == []
+    assert child._cached_matches({"name": "sample1"}, "Sample")[0] == []
+    assert child._cached_matches({"name": "shadow"}, "Sample")[0] == [shadow]
+
+
+def test_commit(stub_session, tables):
+    session, server = stub_session(tables)
+    parent = Browser(session)
+    samples = parent.where({"id": [1, 2]}, "Sample")
+    child = parent.derive()
+    shadow = session.Sample.load({"id": 1, "name": "shadow"})
+    child.update_cache([shadow])
+    items = child.where({"sample_id": 3}, "Item")
+
+    child.commit()
+    assert child.model_cache.own == {}
+    assert parent.model_cache["Sample"][1] is samples[0]
+    assert samples[0].name == "shadow"
+    assert all(parent.model_cache["Item"][i.id] is i for i in items)
+
+    # completed queries are merged into the parent
+    server.reset()
+    assert len(parent.where({"sample_id": 3}, "Item")) == 10
+    assert not server.json_requests()
+
+
+def test_discard(fake_session):
+    parent = Browser(fake_session)
+    samples = load_samples(fake_session, 3)
+    parent.update_cache(samples[:2])
+    child = parent.derive()
+    child.update_cache(samples[2:])
+    child.discard()
+    assert child.model_cache.own == {}
+    assert parent.models == samples[:2]
+    assert child.models == samples[:2]
+
+
+def test_commit_without_parent(fake_session):
+    with pytest.raises(BrowserException):
+        Browser(fake_session).commit()
+
+
+def test_nested_layers(fake_session):
+    root = Browser(fake_session)
+    samples = load_samples(fake_session, 3)
+    root.update_cache(samples[:1])
+    child = root.derive()
+    child.update_cache(samples[1:2])
+    grandchild = child.derive()
+    grandchild.update_cache(samples[2:])
+    assert grandchild.models == samples
+    assert grandchild.find(1, "Sample") is samples[0]
+
+    grandchild.commit()
+    assert child.models == samples
+    assert root.models == samples[:1]
+
+
+@pytest.mark.parametrize("commit", [True, False])
+def test_derived_session(fake_session, commit):
+    samples = load_samples(fake_session, 2)
+    fake_session.browser.update_cache(samples[:1])
+
+    with fake_session.with_cache(using_models=True, commit=commit) as sess:
+        assert sess.browser.parent is fake_session.browser
+        assert sess.browser.model_cache["Sample"][1] is samples[0]
+        sess.browser.update_cache(samples[1:])
+
+    if commit:
+        assert fake_session.browser.models == samples
+    else:
+        assert fake_session.browser.models == samples[:1]
+
+
+@pytest.mark.benchmark
+class TestLayeredCacheBenchmark:
+    NUM_MODELS = 100000
+
+    @pytest.fixture(scope="function")
+    def parent(self, fake_session):
+        parent = Browser(fake_session)
+        parent.update_cache(load_samples(fake_session, self.NUM_MODELS))
+        return parent
+
+    @pytest.mark.parametrize("method", ["copy", "layered"])
+    def test_derive_benchmark(self, benchmark, fake_session, parent, method):
+        """Deriving 5 child caches of a cache of 100k models."""
+
+        def derive():
+            for _ in range(5):
+                if method == "copy":
+                    # the copy made by `with_cache(using_models=True)` before 1.0.7
+                    child = Browser(fake_session)
+                    child.update_cache(parent.models)
+                else:
+                    child = parent.derive()
+            return child
+
+        child = benchmark.pedantic(derive, rounds=1, iterations=1)
+        assert child.find(self.NUM_MODELS, "Sample").id == self.NUM_MODELS
+
+    @pytest.mark.parametrize("method", ["parent", "layered"])
+    def test_find_benchmark(self, benchmark, parent, method):
+        """Finding 10k models through a child cache."""
+        browser = parent if method == "parent" else parent.derive()
+
+        def find():
+            for i in range(1, 10001):
+                browser.find(i, "Sample")
+
+        benchmark.pedantic(find, rounds=1, iterations=1)
+        assert browser.find(1, "Sample") is parent.model_cache["Sample"][1]
@@ -0,0 +1,198 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from pydent.aqsession import AqSession
+from pydent.browser import Browser
+from pydent.browser import PersistentCache
+
+
+class FakeTimer:
+    def __init__(self):
+        self.time = 1000.0
+
+    def __call__(self):
+        return self.time
+
+
+@pytest.fixture(scope="function")
+def timer():
+    return FakeTimer()
+
+
+@pytest.fixture(scope="function")
+def cache_path(tmpdir):
+    return str(tmpdir.join("cache.sqlite"))
+
+
+@pytest.fixture(scope="function")
+def tables():
+    return {
+        "SampleType": [
+            {"id": i, "name": "type{}".format(i), "updated_at": "2020-01-01"}
+            for i in range(1, 11)
+        ]
+    }
+
+
+def json_arguments(server):
+    return [r["body"]["arguments"] for r in server.json_requests()]
+
+
+def read_rows(path, url, ids):
+    fresh, stale = PersistentCache(path, url).get("SampleType", ids)
+    return sorted(fresh)
+
+
+class TestPersistentCache:
+    def test_put_and_get(self, cache_path, timer):
+        cache = PersistentCache(cache_path, "http://aq", max_age=10, timer=timer)
+        cache.put("SampleType", [{"id": 1, "name": "a"}, {"id": 2, "name": "b"}])
+        timer.time += 5
+        cache.put("SampleType", [{"id": 3, "name": "c"}])
+        assert cache.get("SampleType", [1, 3, 4]) == (
+            {1: {"id": 1, "name": "a"}, 3: {"id": 3, "name": "c"}},
+            {},
+        )
+        timer.time += 6
+        fresh, stale = cache.get("SampleType", [1, 2, 3])
+        assert list(fresh) == [3]
+        assert sorted(stale) == [1, 2]
+
+        cache.touch("SampleType", [1])
+        assert sorted(cache.get("SampleType", [1, 2, 3])[0]) == [1, 3]
+
+    def test_wal_mode(self, cache_path):
+        cache = PersistentCache(cache_path, "http://aq")
+        mode = cache.connection.execute("PRAGMA journal_mode").fetchone()[0]
+        assert mode == "wal"
+
+    def test_only_stores_models(self, cache_path):
+        cache = PersistentCache(cache_path, "http://aq", models=["SampleType"])
+        cache.put("Sample", [{"id": 1}])
+        cache.put("SampleType", [{"id": 1}])
+        assert cache.rows("Sample") == []
+        assert cache.rows("SampleType") == [{"id": 1}]
+
+    def test_keyed_by_url(self, cache_path):
+        cache1 = PersistentCache(cache_path, "http://aq1")
+        cache2 = PersistentCache(cache_path, "http://aq2")
+        cache1.put("SampleType", [{"id": 1, "name": "a"}])
+        assert cache2.get("SampleType", [1]) == ({}, {})
+        cache2.put("SampleType", [{"id": 1, "name": "b"}])
+        cache1.clear()
+        assert cache1.rows("SampleType") == []
+        assert cache2.rows("SampleType") == [{"id": 1, "name": "b"}]
+
+    def test_delete(self, cache_path):
+        cache = PersistentCache(cache_path, "http://aq")
+        cache.put("SampleType", [{"id": 1}, {"id": 2}])
+        cache.delete("SampleType", [1])
+        assert cache.rows("SampleType") == [{"id": 2}]
+
+    def test_concurrent_readers(self, cache_path):
+        cache = PersistentCache(cache_path, "http://aq")
+        cache.put("SampleType", [{"id": i} for i in range(100)])
+        with ProcessPoolExecutor(4) as executor:
+            futures = [
+                executor.submit(read_rows, cache_path, "http://aq", range(i, i + 10))
+                for i in range(0, 100, 10)
+            ]
+            # write while the other processes read
+            cache.put("SampleType", [{"id": i} for i in range(100, 200)])
+            results = [f.result() for f in futures]
+        assert results == [list(range(i, i + 10)) for i in range(0, 100, 10)]
+
+
+class TestBrowserPersistentCache:
+    def new_browser(self, session, cache_path, timer):
+        cache = PersistentCache(cache_path, session.url, max_age=60, timer=timer)
+        return Browser(session, persistent_cache=cache)
+
+    def test_rows_are_shared_between_browsers(
+        self, stub_session, tables, cache_path, timer
+    ):
+        session, server = stub_session(tables)
+        browser = self.new_browser(session, cache_path, timer)
+        assert len(browser.where({"id": [1, 2, 3]}, "SampleType")) == 3
+        browser.find(4, "SampleType")
+        assert len(server.json_requests()) == 2
+
+        # a new process starts with an empty model cache
+        server.reset()
+        browser2 = self.new_browser(session, cache_path, timer)
+        sample_types = browser2.where({"id": [1, 2, 3, 5]}, "SampleType")
+        assert sorted(st.id for st in sample_types) == [1, 2, 3, 5]
+        assert browser2.find(4, "SampleType").name == "type4"
+        assert json_arguments(server) == [{"id": [5]}]
+        assert browser2.find(4, "SampleType") is browser2.model_cache["SampleType"][4]
+
+    def test_stale_rows_are_revalidated(self, stub_session, tables, cache_path, timer):
+        session, server = stub_session(tables)
+        browser = self.new_browser(session, cache_path, timer)
+        browser.where({"id": [1, 2, 3, 4]}, "SampleType")
+
+        timer.time += 120
+        server.tables["SampleType"][1].update(
+            {"name": "renamed", "updated_at": "2020-02-02"}
+        )
+        del server.tables["SampleType"][3]
+        server.reset()
+
+        browser2 = self.new_browser(session, cache_path, timer)
+        sample_types = browser2.where({"id": [1, 2, 3, 4]}, "SampleType")
+        assert {st.id: st.name for st in sample_types} == {
+            1: "type1",
+            2: "renamed",
+            3: "type3",
+        }
+        # one batched query for the stale rows
+        assert json_arguments(server) == [{"id": [1, 2, 3, 4]}]
+
+        cache = browser2.persistent_cache
+        fresh, stale = cache.get("SampleType", [1, 2, 3, 4])
+        assert sorted(fresh) == [1, 2, 3]
+        assert fresh[2]["name"] == "renamed"
+        assert not stale
+
+    def test_other_models_are_not_persisted(
+        self, stub_session, tables, cache_path, timer
+    ):
+        tables["Sample"] = [{"id": 1, "name": "sample"}]
+        session, server = stub_session(tables)
+        browser = self.new_browser(session, cache_path, timer)
+        browser.find(1, "Sample")
+        assert browser.persistent_cache.rows("Sample") == []
+
+
+class TestSessionPersistentCache:
+    def test_session_browsers_use_the_persistent_cache(
+        self, stub_session, tables, cache_path, timer
+    ):
+        session, server = stub_session(tables)
+        cache = PersistentCache(cache_path, session.url, max_age=60, timer=timer)
+        session.init_cache(persistent_cache=cache)
+        assert session.browser.persistent_cache is cache
+        with session.with_cache() as sess:
+            assert sess.browser.persistent_cache is cache
+            assert len(sess.SampleType.where({"id": [1, 2, 3]})) == 3
+        assert len(server.json_requests()) == 1
+
+        # a new session starts with an empty model cache
+        server.reset()
+        new_session = AqSession(
+            None, None, None, aqhttp=session._aqhttp, persistent_cache=cache
+        )
+        assert new_session.browser.models == []
+        with new_session.with_cache() as sess:
+            sample_types = sess.SampleType.where({"id": [1, 2, 3]})
+            assert sorted(st.name for st in sample_types) == [
+                "type1",
+                "type2",
+                "type3",
+            ]
+        with new_session.with_cache(using_models=True) as sess:
+            assert sess.browser.persistent_cache is cache
+        assert new_session.copy().persistent_cache is cache
+        assert not server.json_requests()
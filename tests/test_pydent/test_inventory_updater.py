@@ -0,0 +1,148 @@
+import pytest
+
+from pydent.inventory_updater import inventory_levels
+from pydent.inventory_updater import models_to_graph
+from pydent.inventory_updater import save_inventory
+from pydent.inventory_updater import save_inventory_levels
+
+
+def sample_types(session):
+    primer = session.SampleType.load({"id": 1, "name": "Primer", "field_types": []})
+    fragment_fts = []
+    for ft_id, name, sample_type_id in [(5, "Forward Primer", 1), (6, "Template", 2)]:
+        fragment_fts.append(
+            {
+                "id": ft_id,
+                "name": name,
+                "ftype": "sample",
+                "role": None,
+                "array": False,
+                "required": False,
+                "parent_class": "SampleType",
+                "parent_id": 2,
+                "allowable_field_types": [
+                    {
+                        "id": ft_id,
+                        "field_type_id": ft_id,
+                        "sample_type_id": sample_type_id,
+                    }
+                ],
+            }
+        )
+    fragment = session.SampleType.load(
+        {"id": 2, "name": "Fragment", "field_types": fragment_fts}
+    )
+    return primer, fragment
+
+
+def new_inventory(session, num):
+    """Creates `num` primers, `num` fragments using the primers and `num`
+    fragments using the fragments as templates."""
+    primer_type, fragment_type = sample_types(session)
+    primers = [
+        primer_type.new_sample("primer{}".format(i), project="test", description="")
+        for i in range(num)
+    ]
+    fragments = [
+        fragment_type.new_sample(
+            "fragment{}".format(i),
+            project="test",
+            description="",
+            properties={"Forward Primer": p},
+        )
+        for i, p in enumerate(primers)
+    ]
+    products = [
+        fragment_type.new_sample(
+            "product{}".format(i),
+            project="test",
+            description="",
+            properties={"Forward Primer": primers[i], "Template": f},
+        )
+        for i, f in enumerate(fragments)
+    ]
+    return primers, fragments, products
+
+
+@pytest.fixture(scope="function")
+def inventory_server(stub_session):
+    """A stub server that creates samples and records samples that were
+    created before the samples they depend on."""
+    session, server = stub_session({"Sample": []})
+    server.created = []
+    server.violations = []
+
+    def create_samples(body):
+        created_ids = {s["id"] for s in server.tables["Sample"]}
+        created = []
+        for data in body["samples"]:
+            for fv in data.get("field_values", []):
+                sid = (fv.get("child_sample_name") or "").split(":")[0]
+                if sid == "None" or (sid and int(sid) not in created_ids):
+                    server.violations.append((data["name"], fv["name"]))
+            data = dict(data, id=len(server.tables["Sample"]) + 1)
+            data["field_values"] = []
+            server.tables["Sample"].append(data)
+            created.append(data)
+        server.created.append([d["name"] for d in created])
+        return {"samples": created}
+
+    server.routes["browser/create_samples"] = create_samples
+    return session, server
+
+
+def test_inventory_levels(fake_session):
+    primers, fragments, products = new_inventory(fake_session, 3)
+    graph = models_to_graph(fake_session, products)
+    levels = inventory_levels(graph)
+    assert [{m.rid for m in level} for level in levels] == [
+        {m.rid for m in primers},
+        {m.rid for m in fragments},
+        {m.rid for m in products},
+    ]
+
+
+def test_save_inventory_creates_samples_per_level(inventory_server):
+    session, server = inventory_server
+    primers, fragments, products = new_inventory(session, 5)
+    server.reset()
+
+    levels = save_inventory_levels(session, products)
+    assert [level.depth for level in levels] == [0, 1, 2]
+    assert [len(level.models) for level in levels] == [5, 5, 5]
+    assert all(level.seconds >= 0 for level in levels)
+
+    # one bulk request per level
+    assert len(server.requests) == 3
+    assert [sorted(names) for names in server.created] == [
+        sorted(p.name for p in primers),
+        sorted(f.name for f in fragments),
+        sorted(p.name for p in products),
+    ]
+    assert server.violations == []
+    for sample in primers + fragments + products:
+        assert sample.id
+
+
+def test_save_inventory_skips_saved_models(inventory_server):
+    session, server = inventory_server
+    primers, fragments, products = new_inventory(session, 2)
+    saved = save_inventory(session, products)
+    assert len(saved) == 6
+    server.reset()
+    assert save_inventory(session, products) == []
+    assert server.requests == []
+
+
+def test_save_inventory_merge_samples_is_concurrent(inventory_server):
+    session, server = inventory_server
+    primers, fragments, products = new_inventory(session, 4)
+    server.latency = 0.05
+    server.reset()
+
+    levels = save_inventory_levels(session, products, merge_samples=True)
+    assert [len(level.models) for level in levels] == [4, 4, 4]
+    assert len(server.requests) == 12
+    assert server.violations == []
+    assert server.peak_connections > 1
+
@@ -1,4 +1,390 @@
-from pydent.models import Collection
+import pytest
 
+from pydent.models import Collection
 
 # TODO: mock tests for Collections and Parts
+
+
+@pytest.fixture(scope="function")
+def collection_server(stub_session):
+    """A stub server with a saved 96-well collection that records the
+    `assign_sample` and `delete_selection` requests."""
+
+    def make(latency=0.0):
+        session, server = stub_session(
+            {
+                "ObjectType": [
+                    {"id": 10, "name": "__Part"},
+                    {"id": 11, "name": "96-well", "rows": 8, "columns": 12},
+                ],
+                "Collection": [
+                    {
+                        "id": 1,
+                        "object_type_id": 11,
+                        "dimensions": [8, 12],
+                        "location": "A1",
+                    }
+                ],
+                "PartAssociation": [],
+            },
+            latency=latency,
+        )
+        for method in ["assign_sample", "delete_selection"]:
+            server.routes["collections/1/" + method] = lambda body: {}
+        server.routes["items/move/1?location=A1"] = lambda body: {}
+        return session, server
+
+    return make
+
+
+def controller_requests(server):
+    return [
+        (r["path"].split("/")[-1], r["body"])
+        for r in server.requests
+        if r["path"].startswith("collections/")
+    ]
+
+
+def find_by_name_requests(server):
+    return [
+        r for r in server.json_requests() if r["body"].get("method") == "find_by_name"
+    ]
+
+
+def refresh_requests(server):
+    return [
+        r
+        for r in server.json_requests()
+        if r["body"]["model"] == "Collection" and r["body"].get("id") == 1
+    ]
+
+
+def test_buffered_writes_are_grouped_by_sample(collection_server):
+    session, server = collection_server()
+    collection = session.Collection.find(1)
+    server.reset()
+
+    with collection.buffered():
+        collection[0] = 5
+        collection[1, 1] = 6
+        collection.assign_sample(6, [(2, 2)])
+        collection.remove_sample([(3, 3)])
+        assert collection.is_buffered
+        assert not controller_requests(server)
+        assert collection[2, 2] == 6
+
+    assert not collection.is_buffered
+    assert not collection.pending_cells
+    assert sorted(controller_requests(server), key=str) == sorted(
+        [
+            ("assign_sample", {"sample_id": 5, "pairs": [[0, c] for c in range(12)]}),
+            ("assign_sample", {"sample_id": 6, "pairs": [[1, 1], [2, 2]]}),
+            ("delete_selection", {"pairs": [[3, 3]]}),
+        ],
+        key=str,
+    )
+    assert len(find_by_name_requests(server)) == 1
+    assert len(refresh_requests(server)) == 1
+
+
+def test_last_write_to_a_cell_wins(collection_server):
+    session, server = collection_server()
+    collection = session.Collection.find(1)
+    server.reset()
+
+    with collection.buffered():
+        collection[0, 0] = 5
+        collection[0, 0] = 6
+        collection.remove_sample([(0, 1)])
+        collection[0, 1] = 7
+    assert sorted(controller_requests(server), key=str) == [
+        ("assign_sample", {"sample_id": 6, "pairs": [[0, 0]]}),
+        ("assign_sample", {"sample_id": 7, "pairs": [[0, 1]]}),
+    ]
+
+
+def test_part_object_type_is_found_once_per_session(collection_server):
+    session, server = collection_server()
+    collections = [session.Collection.find(1) for _ in range(3)]
+    server.reset()
+    for i, collection in enumerate(collections):
+        collection[:, :] = i + 1
+    assert len(find_by_name_requests(server)) == 1
+
+    other_session = session.copy()
+    collection = other_session.Collection.find(1)
+    server.reset()
+    collection[0, 0] = 1
+    assert len(find_by_name_requests(server)) == 1
+
+
+def test_flush_sends_requests_concurrently(collection_server):
+    session, server = collection_server(latency=0.05)
+    collection = session.Collection.find(1)
+    server.reset()
+
+    for r in range(8):
+        collection[r] = r + 1
+    collection.flush(max_workers=8)
+    assert len(controller_requests(server)) == 8
+    assert server.peak_connections > 1
+
+
+def test_unbuffered_assign_sample_is_sent_immediately(collection_server):
+    session, server = collection_server()
+    collection = session.Collection.find(1)
+    server.reset()
+
+    collection.assign_sample(5, [(0, 0)])
+    assert controller_requests(server) == [
+        ("assign_sample", {"sample_id": 5, "pairs": [[0, 0]]})
+    ]
+    assert not collection.pending_cells
+
+
+def test_update_flushes_pending_cells(collection_server):
+    session, server = collection_server()
+    collection = session.Collection.find(1)
+    server.reset()
+
+    collection[0, 0] = 5
+    collection[0, 1] = 5
+    assert collection.pending_cells == {(0, 0): 5, (0, 1): 5}
+    collection.update()
+    assert controller_requests(server) == [
+        ("assign_sample", {"sample_id": 5, "pairs": [[0, 0], [0, 1]]})
+    ]
+    assert len(refresh_requests(server)) == 1
+
+
+def test_update_saves_data_of_new_cells(collection_server):
+    session, server = collection_server()
+    server.tables.update({"Item": [], "DataAssociation": []})
+
+    def assign_sample(body):
+        for r, c in body["pairs"]:
+            part_id = 100 + len(server.tables["Item"])
+            server.tables["Item"].append(
+                {"id": part_id, "sample_id": body["sample_id"], "object_type_id": 10}
+            )
+            server.tables["PartAssociation"].append(
+                {
+                    "id": part_id,
+                    "collection_id": 1,
+                    "part_id": part_id,
+                    "row": r,
+                    "column": c,
+                }
+            )
+        return {}
+
+    def save(body):
+        row = {k: v for k, v in body.items() if k != "model"}
+        row["id"] = len(server.tables[body["model"]["model"]]) + 1
+        server.tables[body["model"]["model"]].append(row)
+        return row
+
+    server.routes["collections/1/assign_sample"] = assign_sample
+    server.routes["json/save"] = save
+    collection = session.Collection.find(1)
+    collection[0, 0] = 5
+    collection.data_matrix[0, 0] = {"concentration": 10}
+    collection.update()
+
+    assert [r[0] for r in controller_requests(server)] == ["assign_sample"]
+    assert [
+        (a["parent_id"], a["parent_class"], a["key"])
+        for a in server.tables["DataAssociation"]
+    ] == [(100, "Item", "concentration")]
+    assert len(server.tables["Item"]) == 1
+    assert collection.data_matrix[0, 0] == {"concentration": 10}
+
+
+def test_direct_writes_are_not_undone_by_update(collection_server):
+    session, server = collection_server()
+    collection = session.Collection.find(1)
+    server.reset()
+
+    collection[0, 0] = 5
+    collection.assign_sample(6, [(0, 0)])
+    assert not collection.pending_cells
+    collection.update()
+    assert controller_requests(server) == [
+        ("assign_sample", {"sample_id": 6, "pairs": [[0, 0]]})
+    ]
+
+
+def test_direct_removes_are_not_undone_by_flush(collection_server):
+    session, server = collection_server()
+    collection = session.Collection.find(1)
+    collection.pending_cells[0, 0] = 5
+    collection.pending_cells[0, 1] = 5
+    collection._discard_pending_cells([(0, 0)])
+    assert collection.pending_cells == {(0, 1): 5}
+    collection.remove_sample([(0, 1)])
+    assert not collection.pending_cells
+
+
+def test_refresh_discards_pending_cells(collection_server):
+    session, server = collection_server()
+    collection = session.Collection.find(1)
+    collection[0, 0] = 5
+    collection.refresh()
+    assert not collection.pending_cells
+    server.reset()
+    collection.flush()
+    assert not controller_requests(server)
+
+
+def test_flush_raises_for_unsaved_samples(collection_server):
+    session, server = collection_server()
+    collection = session.Collection.find(1)
+    sample = session.Sample.new(name="unsaved")
+
+    collection[0, 0] = sample
+    with pytest.raises(ValueError):
+        collection.flush()
+    sample.id = 3
+    collection.flush()
+    assert controller_requests(server)[-1] == (
+        "assign_sample",
+        {"sample_id": 3, "pairs": [[0, 0]]},
+    )
+
+
+def test_flush_raises_for_unsaved_collection(fake_session):
+    collection = fake_session.Collection.load(
+        {"object_type_id": 11, "dimensions": [2, 2], "part_associations": []}
+    )
+    collection.pending_cells[0, 0] = 1
+    with pytest.raises(ValueError):
+        collection.flush()
+
+
+def test_flush_without_pending_cells_makes_no_requests(collection_server):
+    session, server = collection_server()
+    collection = session.Collection.find(1)
+    server.reset()
+    collection.flush()
+    assert not server.requests
+
+
+def new_collection(session, rows, columns):
+    part_associations = [
+        {
+            "row": r,
+            "column": c,
+            "part": {"id": 1000 + r * columns + c, "sample_id": r * columns + c + 1},
+        }
+        for r in range(rows)
+        for c in range(columns)
+    ]
+    return session.Collection.load(
+        {
+            "id": 1,
+            "object_type_id": 11,
+            "dimensions": [rows, columns],
+            "part_associations": part_associations,
+        }
+    )
+
+
+def test_mapping_is_cached(fake_session):
+    collection = new_collection(fake_session, 2, 3)
+    mapping = collection._mapping
+    assert collection._mapping is mapping
+    assert collection[1, 2] == 6
+    assert collection.part_matrix[0, 1].id == 1001
+    assert collection._mapping is mapping
+
+
+def test_mapping_reflects_part_changes(fake_session):
+    collection = new_collection(fake_session, 2, 3)
+    assert collection[0, 0] == 1
+    collection.part_associations[0].part.sample_id = 10
+    assert collection[0, 0] == 10
+
+
+def test_mapping_is_rebuilt_when_part_associations_change(fake_session):
+    collection = new_collection(fake_session, 2, 3)
+    mapping = collection._mapping
+
+    association = collection.part_associations.pop()
+    assert collection._mapping is not mapping
+    assert collection[1, 2] is None
+
+    mapping = collection._mapping
+    collection.part_associations = collection.part_associations + [association]
+    assert collection._mapping is not mapping
+    assert collection[1, 2] == 6
+
+
+def test_mapping_is_rebuilt_when_part_associations_are_replaced(fake_session):
+    collection = new_collection(fake_session, 2, 3)
+    assert collection[1, 2] == 6
+
+    association = collection.part_associations[5]
+    replacement = fake_session.PartAssociation.load(
+        {"row": 1, "column": 2, "part": {"id": 2000, "sample_id": 20}}
+    )
+    collection.part_associations[5] = replacement
+    assert collection[1, 2] == 20
+
+    # moving an association to another location
+    replacement.row = 0
+    replacement.column = 0
+    assert collection[0, 0] == 20
+    assert association.row == 1
+    collection.part_associations[5] = association
+    assert collection[1, 2] == 6
+
+
+def test_mapping_is_rebuilt_when_dimensions_change(fake_session):
+    collection = new_collection(fake_session, 2, 3)
+    mapping = collection._mapping
+    collection.dimensions = [3, 3]
+    assert collection._mapping is not mapping
+    assert collection[2] == [None, None, None]
+
+
+def test_mapping_is_kept_when_setting_new_cells(fake_session, monkeypatch):
+    collection = fake_session.Collection.load(
+        {"id": 1, "object_type_id": 11, "dimensions": [2, 2], "part_associations": []}
+    )
+    monkeypatch.setattr(
+        "pydent.models.inventory._get_part_object_type",
+        lambda session: fake_session.ObjectType.load({"id": 10, "name": "__Part"}),
+    )
+    mapping = collection._mapping
+    collection[0] = 4
+    collection[1, 1] = 5
+    assert collection._mapping is mapping
+    assert collection.matrix[:] == [[4, 4], [None, 5]]
+    assert len(collection.part_associations) == 3
+
+
+def test_matrix_index_is_cached(fake_session):
+    collection = new_collection(fake_session, 2, 3)
+    matrix = collection.sample_id_matrix
+    index_matrix = matrix._index_matrix
+    assert matrix._index_matrix is index_matrix
+    assert list(matrix._iter_indices((slice(None), 1))) == [(0, 1), (1, 1)]
+
+
+@pytest.mark.benchmark
+class TestBenchmarkCollectionIndex:
+    @pytest.mark.parametrize("cached", [True, False], ids=["cached", "rebuilt"])
+    def test_read_384_well_collection(self, benchmark, fake_session, cached):
+        collection = new_collection(fake_session, 16, 24)
+
+        def read_all_cells():
+            values = []
+            for r in range(16):
+                for c in range(24):
+                    if not cached:
+                        collection._clear_mapping()
+                    values.append(collection[r, c])
+            return values
+
+        values = benchmark(read_all_cells)
+        assert values == list(range(1, 385))
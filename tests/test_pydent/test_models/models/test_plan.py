@@ -1,7 +1,10 @@
+from copy import deepcopy
+
 import pytest
 
+from pydent.interfaces import UtilityInterface
 from pydent.models import Plan
-
+from pydent.models.plan import WireList
 
 def test_plan_constructor(fake_session):
     g = fake_session.Plan.new()
@@ -212,3 +215,234 @@ def test_plan_copy(example_plan):
 #         if op.operation_type.name == "Make PCR Fragment":
 #             op.set_input('Template', item=session.Item.find(57124))
 #             newplan.patch(newplan.to_save_json())
+
+
+def new_wired_ops(session, num_ops):
+    """Creates a chain of `num_ops` operations with one input and one
+    output."""
+    ops = []
+    for _ in range(num_ops):
+        op = session.Operation.load({})
+        fvs = []
+        for role in ["input", "output"]:
+            fvs.append(
+                session.FieldValue.load(
+                    {
+                        "name": role,
+                        "parent_class": "Operation",
+                        "operation": op,
+                        "role": role,
+                    }
+                )
+            )
+        op.field_values = fvs
+        ops.append(op)
+    return ops
+
+
+def test_wire_index(fake_plan):
+    p, src, dest = fake_plan
+    p.add_operations([src.operation, dest.operation])
+
+    wire = p.wire(src, dest)
+    assert p.get_outgoing_wires(src) == [wire]
+    assert p.get_incoming_wires(dest) == [wire]
+    assert p.get_incoming_wires(src) == []
+    assert p.find_wires(src, dest) == [wire]
+
+    # adding the same wire twice is a no-op
+    p.add_wire(wire)
+    assert p.wires == [wire]
+
+    p.remove_wire(wire)
+    assert p.wires == []
+    assert p.get_outgoing_wires(src) == []
+    assert p.find_wires(src, dest) == []
+
+
+def test_wire_index_matches_saved_field_values_by_id(fake_session, fake_plan):
+    p, src, dest = fake_plan
+    src.id = 1
+    dest.id = 2
+    wire = p.wire(src, dest)
+    dest_copy = fake_session.FieldValue.load(
+        {"id": 2, "name": "myoutput", "parent_class": "Operation", "role": "input"}
+    )
+    assert p.get_incoming_wires(dest_copy) == [wire]
+
+
+def test_wire_index_is_rebuilt_when_wires_are_reassigned(fake_session, fake_plan):
+    p, src, dest = fake_plan
+    wire = fake_session.Wire(source=src, destination=dest)
+    p.wires = [wire]
+    assert p.get_outgoing_wires(src) == [wire]
+    p.wires = []
+    assert p.get_outgoing_wires(src) == []
+    p.wires.append(wire)
+    assert p.get_incoming_wires(dest) == [wire]
+
+
+def test_reading_the_wire_index_does_not_change_wires(fake_session, fake_plan):
+    p, src, dest = fake_plan
+    wire = fake_session.Wire(source=src, destination=dest)
+    p.wires = [wire]
+    wires = p.wires
+    assert isinstance(wires, WireList)
+    assert p.get_outgoing_wires(src) == [wire]
+    assert p.wires is wires
+    assert p.wires == [wire]
+
+
+def test_wire_index_is_rebuilt_when_wires_are_changed_in_place(fake_session, fake_plan):
+    p, src, dest = fake_plan
+    wire = p.wire(src, dest)
+    other = fake_session.Wire(source=src, destination=dest)
+
+    p.wires[0] = other
+    assert p.get_outgoing_wires(src) == [other]
+    p.wires.remove(other)
+    assert p.get_outgoing_wires(src) == []
+    p.wires.extend([wire])
+    assert p.get_incoming_wires(dest) == [wire]
+    del p.wires[:]
+    assert p.get_incoming_wires(dest) == []
+
+
+def test_wire_index_follows_wire_endpoints(fake_session, fake_plan):
+    p, src, dest = fake_plan
+    wire = p.wire(src, dest)
+    other_dest = fake_session.FieldValue.load(
+        {"name": "other", "parent_class": "Operation", "role": "input"}
+    )
+    wire.destination = other_dest
+    assert p.get_incoming_wires(dest) == []
+    assert p.get_incoming_wires(other_dest) == [wire]
+    assert p.find_wires(src, other_dest) == [wire]
+
+
+def test_deleted_wires_are_removed_from_the_plan(fake_session, fake_plan, monkeypatch):
+    p, src, dest = fake_plan
+    wire = p.wire(src, dest)
+    wire.connect_to_session(fake_session)
+    deleted = []
+    monkeypatch.setattr(
+        UtilityInterface,
+        "delete_wire",
+        lambda self, wire: deleted.append(wire),
+        raising=False,
+    )
+    wire.delete()
+    assert deleted == [wire]
+    assert p.wires == []
+    assert p.get_outgoing_wires(src) == []
+    assert p.find_wires(src, dest) == []
+
+
+def test_field_value_wires(fake_plan):
+    p, src, dest = fake_plan
+    src.operation.plans = [p]
+    dest.operation.plans = [p]
+
+    wire = p.wire(src, dest)
+    assert src.outgoing_wires == [wire]
+    assert src.incoming_wires == []
+    assert dest.incoming_wires == [wire]
+    assert dest.outgoing_wires == []
+    assert src.successors == [dest]
+    assert dest.predecessors == [src]
+
+
+def test_copied_plan_reindexes_wires(fake_plan):
+    p, src, dest = fake_plan
+    p.add_operations([src.operation, dest.operation])
+    p.wire(src, dest)
+
+    copied = p.copy()
+    copied_src = copied.operations[0].field_values[0]
+    copied_dest = copied.operations[1].field_values[0]
+    assert copied_src.rid != src.rid
+    assert len(copied.get_outgoing_wires(copied_src)) == 1
+    assert copied.find_wires(copied_src, copied_dest) == copied.wires
+
+
+@pytest.mark.benchmark
+def test_wire_chain_benchmark(benchmark, fake_session):
+    """Wiring and traversing a chain of 2,000 operations."""
+
+    def wire_chain():
+        p = fake_session.Plan.new()
+        ops = new_wired_ops(fake_session, 2000)
+        p.add_operations(ops)
+        for op1, op2 in zip(ops[:-1], ops[1:]):
+            p.wire(op1.field_values[1], op2.field_values[0])
+        for op in ops:
+            for fv in op.field_values:
+                p.get_incoming_wires(fv)
+                p.get_outgoing_wires(fv)
+        p.validate()
+        return p
+
+    p = benchmark.pedantic(wire_chain, rounds=1, iterations=1)
+    assert len(p.wires) == 1999
+
+
+SAVE_INCLUDE = {"operations": {"field_values": ["sample", "item"]}}
+
+
+def new_dump_plan(session, num_ops, num_samples=10):
+    """Creates a wired plan of `num_ops` operations whose field values share
+    `num_samples` samples and items."""
+    samples = [
+        session.Sample.load({"id": i, "name": "s{}".format(i), "sample_type_id": 1})
+        for i in range(num_samples)
+    ]
+    items = [
+        session.Item.load({"id": i, "sample_id": i, "object_type_id": 1})
+        for i in range(num_samples)
+    ]
+    p = session.Plan.new()
+    ops = new_wired_ops(session, num_ops)
+    for i, op in enumerate(ops):
+        for fv in op.field_values:
+            fv.sample = samples[i % num_samples]
+            fv.item = items[i % num_samples]
+    p.add_operations(ops)
+    for op1, op2 in zip(ops[:-1], ops[1:]):
+        p.wire(op1.field_values[1], op2.field_values[0])
+    return p
+
+
+def test_to_save_json(fake_session):
+    p = new_dump_plan(fake_session, 20)
+    save_json = p.to_save_json()
+    assert len(save_json["operations"]) == 20
+    assert len(save_json["wires"]) == 19
+    fv_data = save_json["operations"][3]["field_values"][0]
+    assert fv_data["sample"] == p.operations[3].field_values[0].sample.dump()
+    assert fv_data == p.operations[3].field_values[0].dump(include=["sample", "item"])
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("method", ["dump_and_deepcopy", "dump", "dump_many"])
+def test_dump_plan_benchmark(benchmark, fake_session, method):
+    """Dumping a plan of 2,000 operations for saving."""
+    p = new_dump_plan(fake_session, 2000)
+    if method == "dump_and_deepcopy":
+        # the trailing deepcopy done by dumps before 1.0.7
+
+        def dump():
+            return deepcopy(p.dump(include=SAVE_INCLUDE))
+
+    elif method == "dump":
+
+        def dump():
+            return p.dump(include=SAVE_INCLUDE)
+
+    else:
+
+        def dump():
+            return p.dump_many([p], include=SAVE_INCLUDE)[0]
+
+    data = benchmark.pedantic(dump, rounds=1, iterations=1)
+    assert len(data["operations"]) == 2000
+    assert data["operations"][-1]["field_values"][0]["sample"]["id"] == 9
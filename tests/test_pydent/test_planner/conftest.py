@@ -0,0 +1,60 @@
+import pytest
+
+
+@pytest.fixture(scope="function")
+def new_operation_type(fake_session):
+    """Factory for an offline OperationType with a single 'Fragment' sample
+    input (or input array) and output."""
+
+    def make(name="Step", ot_id=1, input_array=False):
+        field_types = []
+        for i, role in enumerate(["input", "output"]):
+            ft_id = ot_id * 10 + i
+            field_types.append(
+                {
+                    "id": ft_id,
+                    "name": "Fragment",
+                    "role": role,
+                    "ftype": "sample",
+                    "routing": "F",
+                    "array": input_array and role == "input",
+                    "parent_class": "OperationType",
+                    "allowable_field_types": [
+                        {
+                            "id": ft_id,
+                            "field_type_id": ft_id,
+                            "sample_type_id": 1,
+                            "object_type_id": 1,
+                            "sample_type": {"id": 1, "name": "Fragment"},
+                            "object_type": {"id": 1, "name": "Tube"},
+                        }
+                    ],
+                }
+            )
+        return fake_session.OperationType.load(
+            {
+                "id": ot_id,
+                "name": name,
+                "category": "Test",
+                "deployed": True,
+                "on_the_fly": False,
+                "field_types": field_types,
+            }
+        )
+
+    return make
+
+
+@pytest.fixture(scope="function")
+def new_sample(fake_session):
+    def make(sample_id=1):
+        return fake_session.Sample.load(
+            {
+                "id": sample_id,
+                "name": "sample{}".format(sample_id),
+                "sample_type_id": 1,
+                "sample_type": {"id": 1, "name": "Fragment"},
+            }
+        )
+
+    return make
@@ -0,0 +1,77 @@
+import pytest
+
+from pydent.planner import Planner
+from pydent.planner.plan_optimizer import PlanOptimizer
+
+
+@pytest.fixture(scope="function")
+def duplicated_chains(fake_session, new_operation_type, new_sample):
+    """Factory for a planner with `num` duplicated A -> B chains."""
+
+    def make(num, sample=None):
+        ot1 = new_operation_type("A", 1)
+        ot2 = new_operation_type("B", 2)
+        planner = Planner(fake_session)
+        if sample is None:
+            sample = new_sample()
+        ops = []
+        for _ in range(num):
+            ops += [ot1.instance(), ot2.instance()]
+        planner.plan.operations = ops
+        for op1, op2 in zip(ops[::2], ops[1::2]):
+            for fv in op1.field_values + op2.field_values:
+                fv.set_value(sample=sample)
+            planner.plan.wire(op1.outputs[0], op2.inputs[0])
+        return planner
+
+    return make
+
+
+def test_fv_hash_is_canonical(duplicated_chains):
+    planner = duplicated_chains(2)
+    optimizer = PlanOptimizer(planner)
+    op1, op2, op3, op4 = planner.plan.operations
+    fv1 = op1.outputs[0]
+    fv3 = op3.outputs[0]
+    assert optimizer._fv_to_hash(fv1, fv1.field_type) == optimizer._fv_to_hash(
+        fv3, fv3.field_type
+    )
+    assert optimizer._op_to_hash(op1) == optimizer._op_to_hash(op3)
+    assert optimizer._op_to_hash(op1) != optimizer._op_to_hash(op2)
+    hash(optimizer._op_to_hash(op1))
+
+
+def test_fv_hash_missing_samples_are_not_equivalent(duplicated_chains):
+    planner = duplicated_chains(2)
+    optimizer = PlanOptimizer(planner)
+    fv1 = planner.plan.operations[0].outputs[0]
+    fv3 = planner.plan.operations[2].outputs[0]
+    for fv in [fv1, fv3]:
+        fv.sample = None
+    assert optimizer._fv_to_hash(fv1, fv1.field_type) != optimizer._fv_to_hash(
+        fv3, fv3.field_type
+    )
+    optimizer.merge_missing_samples = True
+    optimizer._clear_hashes()
+    assert optimizer._fv_to_hash(fv1, fv1.field_type) == optimizer._fv_to_hash(
+        fv3, fv3.field_type
+    )
+
+
+def test_optimize_merges_duplicated_chains(duplicated_chains, new_sample):
+    planner = duplicated_chains(3)
+    other = duplicated_chains(2, sample=new_sample(2))
+    planner.plan.operations += other.plan.operations
+    planner.plan.wires += other.plan.wires
+    planner.optimize()
+    assert len(planner.plan.operations) == 4
+    assert len(planner.plan.wires) == 2
+
+
+@pytest.mark.benchmark
+def test_optimize_benchmark(benchmark, duplicated_chains):
+    """Optimizing a plan with 1,000 duplicated sub-chains."""
+    planner = duplicated_chains(1000)
+    benchmark.pedantic(planner.optimize, rounds=1, iterations=1)
+    assert len(planner.plan.operations) == 2
+    assert len(planner.plan.wires) == 1
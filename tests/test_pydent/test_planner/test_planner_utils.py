@@ -0,0 +1,132 @@
+import random
+
+import networkx as nx
+import pytest
+
+from pydent.planner import Planner
+from pydent.planner.utils import get_subgraph_nodes
+from pydent.planner.utils import get_subgraphs
+from pydent.planner.utils import UnionFind
+
+
+class Unpicklable:
+    """Node data that fails if the graph is copied."""
+
+    def __deepcopy__(self, memo):
+        raise AssertionError("graph was copied")
+
+
+def random_forest(num_nodes, num_edges, seed=0):
+    rand = random.Random(seed)
+    graph = nx.DiGraph()
+    for n in range(num_nodes):
+        graph.add_node(n, operation=Unpicklable())
+    for _ in range(num_edges):
+        n1, n2 = rand.sample(range(num_nodes), 2)
+        graph.add_edge(n1, n2)
+    return graph
+
+
+def reference_subgraphs(graph):
+    """Previous implementation of get_subgraphs, using a copy of the
+    graph."""
+    undirected = nx.Graph(graph.edges)
+    undirected.add_nodes_from(graph.nodes)
+    node_list = list(graph.nodes)
+    subgraphs = []
+    while node_list:
+        nodes = nx.node_connected_component(undirected, node_list[-1])
+        for n in nodes:
+            node_list.remove(n)
+        subgraphs.append(graph.subgraph(nodes))
+    return subgraphs
+
+
+def new_wired_ops(session, num_ops):
+    ops = []
+    for _ in range(num_ops):
+        op = session.Operation.load({})
+        op.field_values = [
+            session.FieldValue.load(
+                {
+                    "name": role,
+                    "parent_class": "Operation",
+                    "operation": op,
+                    "role": role,
+                }
+            )
+            for role in ["input", "output"]
+        ]
+        ops.append(op)
+    return ops
+
+
+def test_get_subgraphs_matches_reference():
+    graph = random_forest(200, 150)
+    subgraphs = get_subgraphs(graph)
+    expected = reference_subgraphs(graph)
+    assert [set(g.nodes) for g in subgraphs] == [set(g.nodes) for g in expected]
+    assert [set(g.edges) for g in subgraphs] == [set(g.edges) for g in expected]
+
+
+def test_get_subgraphs_does_not_copy():
+    graph = random_forest(20, 10)
+    subgraphs = get_subgraphs(graph)
+    node = list(subgraphs[0].nodes)[0]
+    assert subgraphs[0].nodes[node] is graph.nodes[node]
+
+
+def test_get_subgraph_nodes_undirected():
+    graph = nx.Graph([(1, 2), (3, 4)])
+    graph.add_node(5)
+    assert get_subgraph_nodes(graph) == [{5}, {3, 4}, {1, 2}]
+
+
+def test_split(fake_session):
+    planner = Planner(fake_session)
+    ops = new_wired_ops(fake_session, 6)
+    planner.plan.operations = ops
+    for i, j in [(0, 1), (1, 2), (3, 4)]:
+        planner.plan.wire(ops[i].field_values[1], ops[j].field_values[0])
+
+    splits = planner.split()
+    assert [len(p.plan.operations) for p in splits] == [1, 2, 3]
+    assert [len(p.plan.wires) for p in splits] == [0, 1, 2]
+    for p in splits:
+        opids = {op._primary_key for op in p.plan.operations}
+        for wire in p.plan.wires:
+            assert wire.source.operation._primary_key in opids
+            assert wire.destination.operation._primary_key in opids
+
+
+@pytest.mark.benchmark
+def test_get_subgraphs_benchmark(benchmark):
+    graph = random_forest(2000, 1500)
+    subgraphs = benchmark(get_subgraphs, graph)
+    assert sum(len(g) for g in subgraphs) == 2000
+
+
+def test_union_find():
+    uf = UnionFind()
+    uf.union(1, 2)
+    uf.union(2, 3)
+    uf.union(2, 3)
+    uf.add(4)
+    assert uf.members(1) == {1, 2, 3}
+    assert uf.members(4) == {4}
+    assert uf.find(1) == uf.find(3)
+
+    # one of two parallel edges is removed
+    uf.remove_edge(2, 3)
+    assert uf.members(1) == {1, 2, 3}
+
+    uf.remove_edge(2, 3)
+    assert uf.members(1) == {1, 2}
+    assert uf.members(3) == {3}
+
+    uf.union(3, 4)
+    uf.union(1, 4)
+    uf.remove(4)
+    assert 4 not in uf
+    assert uf.members(1) == {1, 2}
+    assert uf.members(3) == {3}
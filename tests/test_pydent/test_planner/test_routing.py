@@ -0,0 +1,116 @@
+import pytest
+
+from pydent.planner import Planner
+from pydent.planner.utils import RoutingIndex
+
+
+def route_classes(routes):
+    return {frozenset(routes.classes.members(key)) for key in routes._field_values}
+
+
+@pytest.fixture(scope="function")
+def planner_chain(fake_session, new_operation_type):
+    def make(num_ops):
+        ot = new_operation_type()
+        planner = Planner(fake_session)
+        ops = [planner.create_operation_by_type(ot) for _ in range(num_ops)]
+        for op1, op2 in zip(ops[:-1], ops[1:]):
+            planner.add_wire(op1.outputs[0], op2.inputs[0])
+        return planner, ops
+
+    return make
+
+
+def rebuilt_routes(planner):
+    routes = RoutingIndex(planner._routing_key)
+    for op in planner.plan.operations:
+        for fv in op.field_values:
+            routes.add_field_value(fv)
+    for wire in planner.plan.wires:
+        routes.add_wire(wire)
+    return routes
+
+
+def test_routes_are_updated_incrementally(planner_chain):
+    planner, ops = planner_chain(4)
+    routes = planner.routes
+    assert len(route_classes(routes)) == 1
+    assert route_classes(routes) == route_classes(rebuilt_routes(planner))
+
+    planner.remove_wire(ops[1].outputs[0], ops[2].inputs[0])
+    assert planner.routes is routes
+    assert len(route_classes(routes)) == 2
+    assert route_classes(routes) == route_classes(rebuilt_routes(planner))
+
+    planner.add_wire(ops[1].outputs[0], ops[2].inputs[0])
+    assert planner.routes is routes
+    assert len(route_classes(routes)) == 1
+
+
+def test_routes_are_rebuilt_when_wires_are_reassigned(planner_chain):
+    planner, ops = planner_chain(4)
+    routes = planner.routes
+    planner.plan.wires = planner.plan.wires[:1]
+    assert planner.routes is not routes
+    assert len(route_classes(planner.routes)) == 3
+
+
+def test_propagate_visits_only_routing_class(planner_chain, new_sample):
+    planner, ops = planner_chain(4)
+    planner.remove_wire(ops[1].outputs[0], ops[2].inputs[0])
+    sample = new_sample()
+    planner.set_field_value_and_propogate(ops[0].inputs[0], sample=sample)
+    assert [op.inputs[0].sample for op in ops] == [sample, sample, None, None]
+    assert [op.outputs[0].sample for op in ops] == [sample, sample, None, None]
+
+
+def test_input_array_routes_do_not_depend_on_positions(
+    fake_session, new_operation_type, new_sample
+):
+    planner = Planner(fake_session)
+    ot = new_operation_type()
+    array_ot = new_operation_type("Join", ot_id=2, input_array=True)
+    op1, op2 = [planner.create_operation_by_type(ot) for _ in range(2)]
+    join = planner.create_operation_by_type(array_ot)
+    first = join.add_to_input_array("Fragment")
+    second = join.add_to_input_array("Fragment")
+    planner.add_wire(op1.outputs[0], first)
+    planner.add_wire(op2.outputs[0], second)
+    assert set(planner.routes.field_values(second)) == {op2.outputs[0], second}
+
+    # removing the first member shifts the position of the second
+    planner.remove_wire(op1.outputs[0], first)
+    join.field_values.remove(first)
+    third = join.add_to_input_array("Fragment")
+
+    assert planner.routes.field_values(third) == [third]
+    sample = new_sample()
+    planner.set_field_value_and_propogate(third, sample=sample)
+    assert third.sample is sample
+    assert second.sample is None
+    assert op2.outputs[0].sample is None
+    planner.set_field_value_and_propogate(op2.outputs[0], sample=sample)
+    assert second.sample is sample
+
+
+@pytest.mark.benchmark
+def test_propagate_chain_benchmark(
+    benchmark, fake_session, new_operation_type, new_sample
+):
+    """Propagating a sample across a 5,000 operation chain."""
+    ot = new_operation_type()
+    planner = Planner(fake_session)
+    ops = [ot.instance() for _ in range(5000)]
+    planner.plan.operations = ops
+    for op1, op2 in zip(ops[:-1], ops[1:]):
+        planner.plan.wire(op1.outputs[0], op2.inputs[0])
+    sample = new_sample()
+
+    benchmark.pedantic(
+        planner.set_field_value_and_propogate,
+        args=(ops[0].inputs[0],),
+        kwargs={"sample": sample},
+        rounds=1,
+        iterations=1,
+    )
+    assert ops[-1].outputs[0].sample is sample
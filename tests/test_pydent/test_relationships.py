@@ -194,3 +194,17 @@ def test_has_many_through():
     fxn = hasmanythrough.callback_args[1]
     assert fxn(this_model) == expected_fxn(this_model)
     assert fxn(this_model) == {"id": [4]}
+
+
+def test_build_query_by_id(fake_session):
+    samples = fake_session.Sample.load(
+        [{"id": i, "sample_type_id": t} for i, t in enumerate([3, 1, 3, None, 2, 1])]
+    )
+    args = samples[0].get_relationships()["sample_type"].build_query(samples)
+    assert args == {"id": [3, 1, 2]}
+
+
+def test_build_query_by_query(fake_session):
+    sample_types = fake_session.SampleType.load([{"id": i} for i in [2, 1, 2, 3, 1]])
+    args = sample_types[0].get_relationships()["samples"].build_query(sample_types)
+    assert args == {"sample_type_id": [2, 1, 3]}
@@ -98,7 +98,7 @@ def test_custom_timeout(monkeypatch, fake_response, aqhttp):
             assert timeout == 0.1
             return fake_response(method, path, {}, 200)
 
-    monkeypatch.setattr("pydent.aqhttp.requests", mock_request)
+    monkeypatch.setattr(aqhttp, "transport", mock_request)
     aqhttp.post("someurl", timeout=0.1, json_data={})
 
 
@@ -113,7 +113,7 @@ def test_default_timeout(monkeypatch, fake_response, aqhttp):
             assert timeout == aqhttp.TIMEOUT
             return fake_response(method, path, {}, 200)
 
-    monkeypatch.setattr("pydent.aqhttp.requests", mock_request)
+    monkeypatch.setattr(aqhttp, "transport", mock_request)
     aqhttp.post("someurl", json_data={})
 
 
@@ -151,7 +151,7 @@ def test_aqhttp_post(monkeypatch, fake_response, aqhttp):
             response.json = lambda: kwargs["json"]
             return response
 
-    monkeypatch.setattr("pydent.aqhttp.requests", mock_request)
+    monkeypatch.setattr(aqhttp, "transport", mock_request)
 
     # test post
     json_result = aqhttp.post(
@@ -187,7 +187,7 @@ def test_aqhttp_post_2(monkeypatch, aqhttp, fake_response):
             fake_requests_response.json = lambda: kwargs["json"]
             return fake_requests_response
 
-    monkeypatch.setattr("pydent.aqhttp.requests", mock_request)
+    monkeypatch.setattr(aqhttp, "transport", mock_request)
 
     # test put
     json_result = aqhttp.put(
@@ -222,7 +222,7 @@ def test_aqhttp_get(monkeypatch, fake_response, aqhttp):
             fake_requests_response.json = lambda: {}
             return fake_requests_response
 
-    monkeypatch.setattr("pydent.aqhttp.requests", mock_request)
+    monkeypatch.setattr(aqhttp, "transport", mock_request)
 
     # test get
     json_result = aqhttp.get(request_path, timeout=request_timeout, **extra_kwargs)
@@ -238,7 +238,7 @@ def test_authentication_error_via_reroute(monkeypatch, fake_response, aqhttp):
             fake_requests_response.url = url_build(aqhttp.aquarium_url, "signin")
             return fake_requests_response
 
-    monkeypatch.setattr("pydent.aqhttp.requests", mock_request)
+    monkeypatch.setattr(aqhttp, "transport", mock_request)
 
     # test get
     with pytest.raises(TridentRequestError):
@@ -260,7 +260,7 @@ def test_improperly_formatted_json_raise_TridentRequestError(
             fake_requests_response.json = lambda: json.loads("not a json")
             return fake_requests_response
 
-    monkeypatch.setattr("pydent.aqhttp.requests", mock_request)
+    monkeypatch.setattr(aqhttp, "transport", mock_request)
 
     # test get
     with pytest.raises(TridentRequestError):
@@ -0,0 +1,133 @@
+import asyncio
+
+import pytest
+
+from pydent.aqhttp import AsyncAqHTTP
+
+
+def run(coro):
+    return asyncio.new_event_loop().run_until_complete(coro)
+
+
+@pytest.fixture(scope="function")
+def tables():
+    return {
+        "Sample": [
+            {"id": i, "name": "sample{}".format(i), "sample_type_id": i % 3}
+            for i in range(1, 101)
+        ],
+        "Item": [
+            {"id": 1000 + i, "sample_id": i, "object_type_id": i % 2 + 1}
+            for i in range(1, 101)
+        ],
+        "ObjectType": [{"id": 1, "name": "vial"}, {"id": 2, "name": "plate"}],
+    }
+
+
+def test_find_async(async_stub_session, tables):
+    session, server = async_stub_session(tables)
+    sample = run(session.Sample.find_async(5))
+    assert sample.id == 5
+    assert sample.name == "sample5"
+    assert run(session.Sample.find_async(0)) is None
+    assert run(session.Sample.find_async(1000)) is None
+
+
+def test_where_all_one_async(async_stub_session, tables):
+    session, server = async_stub_session(tables)
+    samples = run(session.Sample.where_async({"sample_type_id": 1}))
+    assert [s.id for s in samples] == list(range(1, 101, 3))
+    assert len(run(session.Sample.all_async())) == 100
+    assert run(session.Sample.one_async()).id == 100
+    assert run(session.Sample.one_async(first=True)).id == 1
+
+
+def test_where_async_page_size(async_stub_session, tables):
+    session, server = async_stub_session(tables)
+    samples = run(session.Sample.where_async({"sample_type_id": 1}, page_size=10))
+    assert [s.id for s in samples] == list(range(1, 101, 3))
+    assert len(server.json_requests()) == 4
+
+
+def test_async_matches_sync(async_stub_session, tables):
+    session, server = async_stub_session(tables)
+    expected = session.Sample.where({"id": [1, 2, 3]})
+    found = run(session.Sample.where_async({"id": [1, 2, 3]}))
+    assert [s.dump(ignore="rid") for s in found] == [
+        s.dump(ignore="rid") for s in expected
+    ]
+
+
+@pytest.mark.parametrize("max_in_flight", [4, 10])
+def test_concurrent_queries_are_bounded(async_stub_session, tables, max_in_flight):
+    """Many concurrent queries should be made from a single thread with at
+    most `max_in_flight` connections open at once."""
+    session, server = async_stub_session(tables, latency=0.01)
+    session._aqhttp._async_http = AsyncAqHTTP(
+        session._aqhttp, max_in_flight=max_in_flight
+    )
+
+    async def query():
+        return await asyncio.gather(
+            *[session.Sample.find_async(i) for i in range(1, 101)]
+        )
+
+    samples = run(query())
+    assert [s.id for s in samples] == list(range(1, 101))
+    assert len(server.json_requests()) == 100
+    assert 1 < server.peak_connections <= max_in_flight
+    assert session._aqhttp.async_http._pool.num_connections <= max_in_flight
+
+
+def test_browser_retrieve_async(async_stub_session, tables):
+    session, server = async_stub_session(tables)
+    browser = session.browser
+    samples = run(browser.where_async({"id": list(range(1, 11))}, "Sample"))
+    assert len(samples) == 10
+
+    items = run(browser.retrieve_async(samples, "items"))
+    assert len(items) == 10
+    for s in samples:
+        assert [i.sample_id for i in s.items] == [s.id]
+
+    # relationships already retrieved are not requested again
+    server.reset()
+    assert len(run(browser.retrieve_async(samples, "items"))) == 10
+    assert not server.json_requests()
+
+
+def test_browser_get_async(async_stub_session, tables):
+    session, server = async_stub_session(tables)
+    browser = session.browser
+    samples = run(browser.where_async({"id": list(range(1, 11))}, "Sample"))
+    results = run(browser.get_async(samples, {"items": "object_type"}))
+    assert len(results["items"]) == 10
+    assert {ot.name for ot in results["object_type"]} == {"vial", "plate"}
+    for s in samples:
+        for item in s.items:
+            assert item.object_type.id == item.object_type_id
+
+    assert len(run(browser.get_async("Sample", query={"sample_type_id": 1}))) == 4
+
+
+def test_with_cache_async(async_stub_session, tables):
+    session, server = async_stub_session(tables)
+    with session.with_cache() as sess:
+        sample = run(sess.Sample.find_async(3))
+        assert sample.id == 3
+        server.reset()
+        assert run(sess.Sample.find_async(3)) is sample
+        assert run(sess.Sample.where_async({"id": [3]})) == [sample]
+        assert not server.json_requests()
+
+
+def test_async_requests_share_the_session_cookie_jar(async_stub_session, tables):
+    session, server = async_stub_session(tables)
+    run(session.Sample.find_async(1))
+    assert server.json_requests()[0]["headers"]["Cookie"] == "remember_token=stubtoken"
+
+    # cookies set by async responses are stored in the jar of sync requests
+    jar = session._aqhttp.transport.session.cookies
+    jar.clear()
+    run(session._aqhttp.async_http.post("sessions.json"))
+    assert jar["remember_token"] == "stubtoken"
@@ -0,0 +1,226 @@
+import pytest
+
+from pydent.browser import Browser
+from pydent.interfaces import QueryInterface
+
+
+@pytest.fixture(scope="function")
+def tables():
+    return {
+        "Sample": [
+            {"id": i, "name": "sample{}".format(i), "sample_type_id": i % 3 + 1}
+            for i in range(1, 3001)
+        ],
+        "Item": [{"id": i, "sample_id": i % 3000 + 1} for i in range(1, 6001)],
+    }
+
+
+def arguments(server):
+    """Returns the arguments of the where queries received by the server,
+    sorted by their first values (chunks are received in any order)."""
+    args = [r["body"]["arguments"] for r in server.json_requests()]
+    return sorted(
+        args, key=lambda a: [v[0] if isinstance(v, list) else v for v in a.values()]
+    )
+
+
+def test_where_is_chunked(stub_session, tables):
+    session, server = stub_session(tables)
+    ids = list(range(2500, 0, -1))
+    samples = session.Sample.where({"id": ids}, chunk_size=1000)
+    assert [(a["id"][0], len(a["id"])) for a in arguments(server)] == [
+        (500, 500),
+        (1500, 1000),
+        (2500, 1000),
+    ]
+    assert sorted(s.id for s in samples) == list(range(1, 2501))
+
+
+def test_chunks_are_merged_in_order(stub_session, tables):
+    session, server = stub_session(tables)
+    ids = [5, 4, 3, 2, 1]
+    samples = session.Sample.where({"id": ids}, chunk_size=2)
+    assert arguments(server) == [{"id": [1]}, {"id": [3, 2]}, {"id": [5, 4]}]
+    # the models are sorted by id, as they are by the server
+    assert [s.id for s in samples] == [1, 2, 3, 4, 5]
+
+
+def test_reversed_chunks_are_merged_in_order(stub_session, tables):
+    session, server = stub_session(tables)
+    query = {"id": [2, 5, 1, 4, 3]}
+    samples = session.Sample.where(query, chunk_size=2, opts={"reverse": True})
+    expected = session.Sample.where(query, chunk_size=0, opts={"reverse": True})
+    assert [s.id for s in samples] == [s.id for s in expected] == [5, 4, 3, 2, 1]
+
+
+@pytest.mark.parametrize(
+    "order,expected",
+    [
+        ("name", [4, 5, 6, 1, 2, 3]),
+        ("id", [1, 2, 3, 4, 5, 6]),
+        ("id DESC", [6, 5, 4, 3, 2, 1]),
+    ],
+)
+def test_chunks_keep_a_server_order(stub_session, tables, order, expected):
+    """Chunks of a query with another order than by id are merged in the
+    order of the chunks (the stub server always orders by id)."""
+    session, server = stub_session(tables)
+    query = {"id": [6, 5, 4, 3, 2, 1]}
+    samples = session.Sample.where(query, chunk_size=3, opts={"order": order})
+    assert [s.id for s in samples] == expected
+
+
+def test_chunk_values_are_deduplicated(stub_session, tables):
+    session, server = stub_session(tables)
+    samples = session.Sample.where({"id": [1, 2, 1, 3, 2, 4]}, chunk_size=2)
+    assert arguments(server) == [{"id": [1, 2]}, {"id": [3, 4]}]
+    assert [s.id for s in samples] == [1, 2, 3, 4]
+
+
+def test_chunks_keep_other_values(stub_session, tables):
+    session, server = stub_session(tables)
+    items = session.Item.where(
+        {"sample_id": list(range(1, 11)), "id": [1, 2, 3, 4, 3001]}, chunk_size=5
+    )
+    assert arguments(server) == [
+        {"sample_id": [1, 2, 3, 4, 5], "id": [1, 2, 3, 4, 3001]},
+        {"sample_id": [6, 7, 8, 9, 10], "id": [1, 2, 3, 4, 3001]},
+    ]
+    assert [i.id for i in items] == [1, 2, 3, 4, 3001]
+
+
+def test_every_long_list_is_chunked(stub_session, tables):
+    session, server = stub_session(tables)
+    items = session.Item.where(
+        {"sample_id": list(range(1, 7)), "id": list(range(1, 9)), "object_type_id": 1},
+        chunk_size=3,
+    )
+    args = arguments(server)
+    assert len(args) == 6
+    assert all(len(a["sample_id"]) <= 3 and len(a["id"]) <= 3 for a in args)
+    assert {(tuple(a["sample_id"]), tuple(a["id"])) for a in args} == {
+        (s, i) for s in [(1, 2, 3), (4, 5, 6)] for i in [(1, 2, 3), (4, 5, 6), (7, 8)]
+    }
+    assert all(a["object_type_id"] == 1 for a in args)
+    assert items == []
+
+
+def test_plan_wires_are_chunked(stub_session, monkeypatch):
+    tables = {
+        "Wire": [
+            {"id": i, "from_id": i, "to_id": i + 1, "active": True}
+            for i in range(1, 12)
+        ]
+    }
+    session, server = stub_session(tables)
+    plan = session.Plan.load({"id": 1, "name": "plan"})
+    plan.operations = [session.Operation.load({"id": 1})]
+    plan.operations[0].field_values = [
+        session.FieldValue.load({"id": i}) for i in range(1, 11)
+    ]
+    wires = plan._get_wires_from_server()
+
+    # only the wires between field values of the plan
+    assert [w.id for w in wires] == list(range(1, 10))
+    fv_ids = list(range(1, 11))
+    assert arguments(server) == [{"from_id": fv_ids, "to_id": fv_ids}]
+
+    server.reset()
+    monkeypatch.setattr(QueryInterface, "IN_CHUNK_SIZE", 4)
+    assert [w.id for w in plan._get_wires_from_server()] == list(range(1, 10))
+    args = arguments(server)
+    assert len(args) == 9
+    assert all(len(a["from_id"]) <= 4 and len(a["to_id"]) <= 4 for a in args)
+
+
+def test_short_lists_are_not_chunked(stub_session, tables):
+    session, server = stub_session(tables)
+    session.Sample.where({"id": [1, 1, 2, 3]}, chunk_size=3)
+    assert arguments(server) == [{"id": [1, 1, 2, 3]}]
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"chunk_size": 0},
+        {"chunk_size": 2, "opts": {"limit": 2}},
+        {"chunk_size": 2, "opts": {"offset": 1}},
+    ],
+)
+def test_where_is_not_chunked(stub_session, tables, kwargs):
+    session, server = stub_session(tables)
+    session.Sample.where({"id": [1, 2, 3, 4, 5]}, **kwargs)
+    assert len(server.json_requests()) == 1
+
+
+def test_default_chunk_size(stub_session, tables, monkeypatch):
+    session, server = stub_session(tables)
+    monkeypatch.setattr(QueryInterface, "IN_CHUNK_SIZE", 2)
+    session.Sample.where({"id": [1, 2, 3, 4, 5]})
+    assert len(server.json_requests()) == 3
+
+    monkeypatch.setattr(QueryInterface, "IN_CHUNK_SIZE", None)
+    server.reset()
+    session.Sample.where({"id": [1, 2, 3, 4, 5]})
+    assert len(server.json_requests()) == 1
+
+
+def test_chunks_are_requested_concurrently(stub_session, tables):
+    session, server = stub_session(tables, latency=0.1)
+    session.Sample.where({"id": list(range(1, 9))}, chunk_size=2)
+    assert len(server.json_requests()) == 4
+    assert server.peak_connections == QueryInterface.IN_CHUNK_WORKERS
+
+
+def test_chunked_errors_are_raised(stub_session, tables, monkeypatch):
+    session, server = stub_session(tables)
+
+    def fail(*args, **kwargs):
+        raise ValueError("server error")
+
+    monkeypatch.setattr(session._aqhttp, "post", fail)
+    with pytest.raises(ValueError):
+        session.Sample.where({"id": list(range(1, 9))}, chunk_size=2)
+
+
+def test_chunked_pages(stub_session, tables):
+    session, server = stub_session(tables)
+    samples = session.Sample.where(
+        {"id": list(range(1, 11))}, chunk_size=5, page_size=3
+    )
+    assert [s.id for s in samples] == list(range(1, 11))
+    assert len(server.json_requests()) == 4
+
+
+def test_where_raw_is_chunked(stub_session, tables):
+    session, server = stub_session(tables)
+    rows = session.Sample.where_raw({"id": [3, 1, 2, 1]}, chunk_size=2)
+    assert arguments(server) == [{"id": [2]}, {"id": [3, 1]}]
+    assert [r["id"] for r in rows] == [1, 2, 3]
+
+
+def test_browser_relationships_are_chunked(stub_session, tables, monkeypatch):
+    session, server = stub_session(tables)
+    monkeypatch.setattr(QueryInterface, "IN_CHUNK_SIZE", 500)
+    browser = Browser(session)
+    samples = browser.where({"id": list(range(1, 1501))}, "Sample")
+    server.reset()
+    browser.get(samples, "items")
+    assert [len(a["sample_id"]) for a in arguments(server)] == [500, 500, 500]
+    assert sum(len(s.items) for s in samples) == 3000
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("workers", [1, 4], ids=["sequential", "concurrent"])
+def test_where_chunks_benchmark(benchmark, stub_session, tables, monkeypatch, workers):
+    """Finding 3,000 samples in 6 chunks."""
+    session, server = stub_session(tables, latency=0.2)
+    monkeypatch.setattr(QueryInterface, "IN_CHUNK_WORKERS", workers)
+    sample_ids = list(range(1, 3001))
+
+    def where():
+        return session.Sample.where({"id": sample_ids}, chunk_size=500)
+
+    samples = benchmark.pedantic(where, rounds=1, iterations=1)
+    assert len(samples) == 3000
+    assert len(server.json_requests()) == 6
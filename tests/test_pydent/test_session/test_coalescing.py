@@ -0,0 +1,217 @@
+import threading
+from copy import copy
+from copy import deepcopy
+
+import pytest
+
+from pydent.aqhttp import AqHTTP
+from pydent.aqhttp import SingleFlight
+
+NUM_THREADS = 8
+
+
+@pytest.fixture(scope="function")
+def tables():
+    return {
+        "Sample": [{"id": i, "name": str(i)} for i in range(1, 11)],
+        "SampleType": [{"id": i, "name": "type{}".format(i)} for i in range(1, 4)],
+    }
+
+
+@pytest.fixture(scope="function")
+def server(stub_server, tables):
+    return stub_server(tables, latency=0.2)
+
+
+@pytest.fixture(scope="function")
+def aqhttp(server):
+    aqhttp = AqHTTP("username", "password", server.url)
+    server.reset()
+    return aqhttp
+
+
+def run_threads(fxn, num_threads=NUM_THREADS):
+    """Calls `fxn(i)` from `num_threads` threads released at the same time and
+    returns the results in order."""
+    barrier = threading.Barrier(num_threads)
+    results = [None] * num_threads
+    errors = []
+
+    def run(i):
+        barrier.wait()
+        try:
+            results[i] = fxn(i)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(num_threads)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    if errors:
+        raise errors[0]
+    return results
+
+
+def sample_query(sample_id):
+    return {"model": "Sample", "id": sample_id}
+
+
+def test_concurrent_reads_are_coalesced(server, aqhttp):
+    results = run_threads(
+        lambda i: aqhttp.post("json", json_data=sample_query(1), coalesce=True)
+    )
+    assert len(server.json_requests()) == 1
+    assert aqhttp.num_requests == 1
+    assert aqhttp.single_flight.num_coalesced == NUM_THREADS - 1
+    assert results == [{"id": 1, "name": "1"}] * NUM_THREADS
+
+    # each caller decodes its own result
+    assert len({id(r) for r in results}) == NUM_THREADS
+
+
+def test_distinct_reads_are_not_coalesced(server, aqhttp):
+    results = run_threads(
+        lambda i: aqhttp.post("json", json_data=sample_query(i % 4 + 1), coalesce=True)
+    )
+    assert len(server.json_requests()) == 4
+    assert [r["id"] for r in results] == [i % 4 + 1 for i in range(NUM_THREADS)]
+
+
+def test_key_is_normalized(server, aqhttp):
+    """Bodies with the same keys in a different order are the same request."""
+    queries = [{"model": "Sample", "id": 1}, {"id": 1, "model": "Sample"}]
+    run_threads(lambda i: aqhttp.post("json", json_data=queries[i % 2], coalesce=True))
+    assert len(server.json_requests()) == 1
+
+
+def test_sequential_reads_are_not_coalesced(server, aqhttp):
+    for _ in range(3):
+        aqhttp.post("json", json_data=sample_query(1), coalesce=True)
+    assert len(server.json_requests()) == 3
+
+
+def test_requests_are_not_coalesced_by_default(server, aqhttp):
+    server.routes["json/save"] = lambda body: {"id": 1}
+    run_threads(lambda i: aqhttp.post("json/save", json_data=sample_query(1)))
+    assert len(server.requests) == NUM_THREADS
+    assert aqhttp.single_flight.num_coalesced == 0
+
+
+def test_reads_after_a_write_are_not_coalesced_with_earlier_reads(server, aqhttp):
+    """A read that starts after a write has returned must not share the
+    response of a read sent before the write."""
+    state = {"value": 0}
+    received = threading.Semaphore(0)
+    release = threading.Event()
+    server.latency = 0
+
+    def read(body):
+        value = state["value"]
+        received.release()
+        release.wait(5)
+        return {"value": value}
+
+    def write(body):
+        state["value"] += 1
+        return {}
+
+    server.routes["json/read"] = read
+    server.routes["json/save"] = write
+    results = {}
+
+    def post_read(name):
+        results[name] = aqhttp.post("json/read", json_data={"id": 1}, coalesce=True)
+
+    first = threading.Thread(target=post_read, args=("first",))
+    first.start()
+    assert received.acquire(timeout=5)
+    aqhttp.post("json/save", json_data={"id": 1})
+    second = threading.Thread(target=post_read, args=("second",))
+    second.start()
+
+    # the second read reaches the server instead of waiting for the first
+    second_received = received.acquire(timeout=1)
+    release.set()
+    first.join()
+    second.join()
+    assert second_received
+    assert results == {"first": {"value": 0}, "second": {"value": 1}}
+    assert aqhttp.single_flight.num_coalesced == 0
+
+
+def test_coalesce_reads_off(server, aqhttp):
+    aqhttp.coalesce_reads = False
+    run_threads(lambda i: aqhttp.post("json", json_data=sample_query(1), coalesce=True))
+    assert len(server.json_requests()) == NUM_THREADS
+
+
+def test_session_find_is_coalesced(stub_session, tables):
+    session, server = stub_session(tables, latency=0.2)
+    sample_types = run_threads(lambda i: session.SampleType.find(1))
+    assert len(server.json_requests()) == 1
+    assert [st.name for st in sample_types] == ["type1"] * NUM_THREADS
+
+    # models do not share data
+    sample_types[0].name = "changed"
+    assert sample_types[1].name == "type1"
+
+
+def test_session_writes_are_not_coalesced(stub_session, tables):
+    session, server = stub_session(tables, latency=0.2)
+    server.routes["json/save"] = lambda body: {"id": 1, "name": "1"}
+    run_threads(lambda i: session.utils.json_save("Sample", {"id": 1, "name": "1"}))
+    assert len(server.requests) == NUM_THREADS
+
+
+def test_single_flight_shares_errors():
+    single_flight = SingleFlight()
+    released = threading.Event()
+    calls = []
+
+    def fail():
+        calls.append(1)
+        released.wait()
+        raise ValueError("server error")
+
+    def run(i):
+        if i:
+            # wait until the first thread is in flight
+            while not single_flight._calls:
+                pass
+        else:
+            threading.Timer(0.2, released.set).start()
+        with pytest.raises(ValueError):
+            single_flight.do("key", fail)
+        return True
+
+    assert run_threads(run, 4) == [True] * 4
+    assert len(calls) == 1
+    assert single_flight._calls == {}
+
+
+def test_copy_aqhttp(aqhttp):
+    assert copy(aqhttp).single_flight is aqhttp.single_flight
+    copied = deepcopy(aqhttp)
+    assert isinstance(copied.single_flight, SingleFlight)
+    assert copied.single_flight is not aqhttp.single_flight
+
+
+@pytest.mark.benchmark
+class TestCoalescingBenchmark:
+    @pytest.mark.parametrize("coalesce", [True, False], ids=["coalesced", "plain"])
+    def test_fan_out_benchmark(self, benchmark, stub_session, tables, coalesce):
+        """8 threads each finding the same 3 sample types."""
+        session, server = stub_session(tables, latency=0.05)
+        session._aqhttp.coalesce_reads = coalesce
+
+        def fan_out():
+            return run_threads(
+                lambda i: [session.SampleType.find(j).name for j in range(1, 4)]
+            )
+
+        results = benchmark.pedantic(fan_out, rounds=1, iterations=1)
+        assert results == [["type1", "type2", "type3"]] * NUM_THREADS
+        if coalesce:
+            assert len(server.json_requests()) < NUM_THREADS * 3
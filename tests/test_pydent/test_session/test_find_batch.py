@@ -0,0 +1,188 @@
+import random
+
+import pytest
+
+from pydent.find_batch import FindBatch
+from pydent.find_batch import FindFuture
+
+
+@pytest.fixture(scope="function")
+def tables():
+    return {
+        "Sample": [{"id": i, "name": "sample{}".format(i)} for i in range(1, 2001)],
+        "Item": [{"id": i, "sample_id": i % 100 + 1} for i in range(1, 501)],
+    }
+
+
+def ids_of(requests):
+    """Returns the ids requested by finds and where queries."""
+    return [
+        r["body"]["id"] if "id" in r["body"] else r["body"]["arguments"]["id"]
+        for r in requests
+    ]
+
+
+def test_batch_finds(stub_session, tables):
+    session, server = stub_session(tables)
+    with session.batch() as batch:
+        futures = [session.Sample.find_later(i) for i in [3, 1, 2]]
+        assert not any(f.done() for f in futures)
+        assert batch.pending == {"Sample": [3, 1, 2]}
+        assert not server.json_requests()
+
+    requests = server.json_requests()
+    assert len(requests) == 1
+    assert ids_of(requests) == [[3, 1, 2]]
+    assert [f.result().name for f in futures] == ["sample3", "sample1", "sample2"]
+    assert batch.num_queries == 1
+    assert batch.pending == {}
+
+
+def test_one_query_per_model(stub_session, tables):
+    session, server = stub_session(tables)
+    with session.batch():
+        samples = [session.Sample.find_later(i) for i in range(1, 4)]
+        items = [session.Item.find_later(i) for i in range(1, 4)]
+    assert sorted(r["body"]["model"] for r in server.json_requests()) == [
+        "Item",
+        "Sample",
+    ]
+    assert [s.result().id for s in samples] == [1, 2, 3]
+    assert [i.result().sample_id for i in items] == [2, 3, 4]
+
+
+def test_repeated_finds_share_a_future(stub_session, tables):
+    session, server = stub_session(tables)
+    with session.batch():
+        first = session.Sample.find_later(1)
+        second = session.Sample.find_later(1)
+    assert first is second
+    assert ids_of(server.json_requests()) == [[1]]
+
+
+def test_missing_and_zero_ids(stub_session, tables):
+    session, server = stub_session(tables)
+    with session.batch():
+        missing = session.Sample.find_later(5000)
+        zero = session.Sample.find_later(0)
+        assert zero.done()
+        with pytest.raises(ValueError):
+            session.Sample.find_later(None)
+    assert missing.result() is None
+    assert zero.result() is None
+    assert ids_of(server.json_requests()) == [[5000]]
+
+
+def test_result_dispatches_early(stub_session, tables):
+    session, server = stub_session(tables)
+    with session.batch() as batch:
+        futures = [session.Sample.find_later(i) for i in range(1, 4)]
+        assert futures[0].result().id == 1
+        assert all(f.done() for f in futures)
+        late = session.Sample.find_later(4)
+    assert late.result().id == 4
+    assert ids_of(server.json_requests()) == [[1, 2, 3], [4]]
+    assert batch.num_queries == 2
+
+
+def test_find_later_outside_of_batch(stub_session, tables):
+    session, server = stub_session(tables)
+    future = session.Sample.find_later(1)
+    assert isinstance(future, FindFuture)
+    assert future.done()
+    assert future.result().id == 1
+    assert ids_of(server.json_requests()) == [1]
+
+
+def test_nested_batches(stub_session, tables):
+    session, server = stub_session(tables)
+    with session.batch() as outer:
+        outer_future = session.Sample.find_later(1)
+        with session.batch() as inner:
+            assert session._find_batch is inner
+            inner_future = session.Sample.find_later(2)
+        assert inner_future.done()
+        assert not outer_future.done()
+        assert session._find_batch is outer
+    assert session._find_batch is None
+    assert ids_of(server.json_requests()) == [[2], [1]]
+
+
+def test_batch_is_not_dispatched_on_error(stub_session, tables):
+    session, server = stub_session(tables)
+    with pytest.raises(KeyError):
+        with session.batch():
+            future = session.Sample.find_later(1)
+            raise KeyError("error")
+    assert session._find_batch is None
+    assert not server.json_requests()
+
+    # the pending find is retrieved when its result is needed
+    assert future.result().id == 1
+
+
+def test_batch_errors_are_raised_by_results(stub_session, tables, monkeypatch):
+    session, server = stub_session(tables)
+
+    def fail(*args, **kwargs):
+        raise ValueError("server error")
+
+    with session.batch():
+        future = session.Sample.find_later(1)
+        monkeypatch.setattr(session._aqhttp, "post", fail)
+    with pytest.raises(ValueError):
+        future.result()
+
+
+def test_cached_models_are_served_from_cache(stub_session, tables):
+    session, server = stub_session(tables)
+    with session.with_cache() as sess:
+        cached = sess.Sample.where({"id": [1, 2]})
+        server.reset()
+        with sess.batch():
+            futures = [sess.Sample.find_later(i) for i in range(1, 5)]
+            assert futures[0].done()
+            assert futures[0].result() is cached[0]
+        assert ids_of(server.json_requests()) == [[3, 4]]
+        assert sess.Sample.find(3) is futures[2].result()
+        assert len(server.json_requests()) == 1
+
+
+def test_batch_reuse(fake_session):
+    batch = fake_session.batch()
+    assert isinstance(batch, FindBatch)
+    with batch:
+        with pytest.raises(RuntimeError):
+            with batch:
+                pass
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("method", ["find", "batched"])
+def test_scattered_finds_benchmark(benchmark, stub_session, tables, method):
+    """1,000 scattered finds of samples and items."""
+    session, server = stub_session(tables)
+    rng = random.Random(0)
+    finds = [
+        (
+            (session.Sample, rng.randint(1, 2000))
+            if rng.random() < 0.8
+            else (session.Item, rng.randint(1, 500))
+        )
+        for _ in range(1000)
+    ]
+
+    def scattered_finds():
+        if method == "find":
+            return [interface.find(i) for interface, i in finds]
+        with session.batch():
+            futures = [interface.find_later(i) for interface, i in finds]
+        return [f.result() for f in futures]
+
+    models = benchmark.pedantic(scattered_finds, rounds=1, iterations=1)
+    assert [m.id for m in models] == [i for _, i in finds]
+    num_requests = len(server.json_requests())
+    if method == "find":
+        assert num_requests == 1000
+    else:
+        assert num_requests == 2
@@ -0,0 +1,195 @@
+import pytest
+
+
+def sample_table(num):
+    return {
+        "Sample": [{"id": i, "name": "sample{}".format(i)} for i in range(1, num + 1)]
+    }
+
+
+def offsets(server):
+    return sorted(r["body"]["options"]["offset"] for r in server.json_requests())
+
+
+@pytest.mark.parametrize("prefetch", [None, 4], ids=["sequential", "prefetch"])
+class TestPagination:
+    def test_pages(self, stub_session, prefetch):
+        session, server = stub_session(sample_table(35))
+        pages = list(session.Sample.pagination({}, page_size=10, prefetch=prefetch))
+        assert [len(p) for p in pages] == [10, 10, 10, 5]
+        assert [s.id for p in pages for s in p] == list(range(1, 36))
+
+    def test_stops_on_short_page(self, stub_session, prefetch):
+        session, server = stub_session(sample_table(35))
+        list(session.Sample.pagination({}, page_size=10, prefetch=prefetch))
+        if prefetch is None:
+            assert offsets(server) == [0, 10, 20, 30]
+        else:
+            # pages already in flight are discarded
+            assert offsets(server)[:4] == [0, 10, 20, 30]
+            assert len(offsets(server)) <= 4 + prefetch
+
+    def test_limit(self, stub_session, prefetch):
+        session, server = stub_session(sample_table(100))
+        pages = list(
+            session.Sample.pagination(
+                {}, page_size=10, opts={"limit": 25}, prefetch=prefetch
+            )
+        )
+        assert [len(p) for p in pages] == [10, 10, 5]
+        assert offsets(server) == [0, 10, 20]
+
+    def test_where_with_page_size(self, stub_session, prefetch):
+        session, server = stub_session(sample_table(35))
+        samples = session.Sample.where({}, page_size=10, prefetch=prefetch)
+        assert [s.id for s in samples] == list(range(1, 36))
+
+
+def test_iter_where(stub_session):
+    session, server = stub_session(sample_table(95))
+    samples = session.Sample.iter_where({}, page_size=10, prefetch=3)
+    assert [s.id for s in samples] == list(range(1, 96))
+
+
+def test_iter_where_is_bounded(stub_session):
+    """Only `prefetch` pages should be requested ahead of the consumer."""
+    session, server = stub_session(sample_table(1000), latency=0.005)
+    samples = session.Sample.iter_where({}, page_size=10, prefetch=3)
+    for sample in samples:
+        if sample.id == 15:
+            break
+    samples.close()
+    assert len(server.json_requests()) <= 2 + 3
+
+
+def test_prefetch_is_concurrent(stub_session):
+    session, server = stub_session(sample_table(200), latency=0.02)
+    assert len(list(session.Sample.iter_where({}, page_size=10, prefetch=4))) == 200
+    assert 1 < server.peak_connections <= 4
+
+
+@pytest.mark.benchmark
+class TestPaginationBenchmark:
+    @pytest.mark.parametrize("prefetch", [None, 4, 8])
+    def test_pagination_benchmark(self, benchmark, stub_session, prefetch):
+        session, server = stub_session(sample_table(400), latency=0.01)
+
+        def paginate():
+            pages = session.Sample.pagination({}, page_size=20, prefetch=prefetch)
+            return sum(len(p) for p in pages)
+
+        assert benchmark(paginate) == 400
+
+
+class TestKeysetPagination:
+    def test_keyset_query(self, fake_session):
+        interface = fake_session.Sample
+        assert interface._keyset_query({}, 10, False) == 'id > "10"'
+        assert interface._keyset_query({}, 10, True) == 'id < "10"'
+        assert (
+            interface._keyset_query({"sample_type_id": [1, 2]}, 10, False)
+            == '( sample_type_id = "1" OR sample_type_id = "2" ) AND id > "10"'
+        )
+        assert (
+            interface._keyset_query('name = "foo"', 10, False)
+            == '( name = "foo" ) AND id > "10"'
+        )
+
+    def test_keyset_pages(self, stub_session):
+        session, server = stub_session(sample_table(35))
+        pages = list(session.Sample.pagination({}, page_size=10, strategy="keyset"))
+        assert [s.id for p in pages for s in p] == list(range(1, 36))
+        arguments = [r["body"].get("arguments") for r in server.json_requests()]
+        assert arguments == [None, 'id > "10"', 'id > "20"', 'id > "30"']
+        assert all(r["body"]["options"]["offset"] == -1 for r in server.json_requests())
+
+    def test_keyset_pages_with_query_and_limit(self, stub_session):
+        tables = {
+            "Sample": [
+                {"id": i, "name": "sample{}".format(i), "sample_type_id": i % 2}
+                for i in range(1, 101)
+            ]
+        }
+        session, server = stub_session(tables)
+        samples = session.Sample.iter_where(
+            {"sample_type_id": 1}, page_size=10, opts={"limit": 25}, strategy="keyset"
+        )
+        assert [s.id for s in samples] == list(range(1, 50, 2))
+
+    def test_keyset_reverse(self, stub_session):
+        session, server = stub_session(sample_table(35))
+        pages = session.Sample.pagination(
+            {}, page_size=10, opts={"reverse": True}, strategy="keyset"
+        )
+        assert [s.id for p in pages for s in p] == list(range(35, 0, -1))
+
+    def test_keyset_scans_fewer_rows(self, stub_session):
+        session, server = stub_session(sample_table(1000))
+        list(session.Sample.pagination({}, page_size=50))
+        offset_scanned = server.rows_scanned
+        server.reset()
+        list(session.Sample.pagination({}, page_size=50, strategy="keyset"))
+        assert server.rows_scanned == 1000
+        assert offset_scanned > 10 * server.rows_scanned
+
+    def test_invalid_strategy(self, fake_session):
+        with pytest.raises(ValueError):
+            list(fake_session.Sample.pagination({}, page_size=10, strategy="foo"))
+        with pytest.raises(ValueError):
+            list(
+                fake_session.Sample.pagination(
+                    {}, page_size=10, strategy="keyset", prefetch=2
+                )
+            )
+
+    @pytest.mark.parametrize(
+        "query", [{"name": None}, {"flag": True}, {"id": [1, None]}, {"a": {"b": 1}}]
+    )
+    def test_keyset_rejects_values_lost_in_sql(self, fake_session, query):
+        with pytest.raises(ValueError):
+            list(fake_session.Sample.pagination(query, page_size=10, strategy="keyset"))
+
+    def test_keyset_accepts_numbers_and_strings(self, stub_session):
+        session, server = stub_session(sample_table(25))
+        pages = session.Sample.pagination(
+            {
+                "id": list(range(1, 21)),
+                "name": ["sample{}".format(i) for i in range(1, 26)],
+            },
+            page_size=10,
+            strategy="keyset",
+        )
+        assert [s.id for p in pages for s in p] == list(range(1, 21))
+
+    def test_all_is_a_single_query_without_keyset_all(self, stub_session, monkeypatch):
+        session, server = stub_session(sample_table(25))
+        monkeypatch.setattr(session.Sample.__class__, "KEYSET_ALL", False)
+        assert len(session.Sample.all()) == 25
+        assert [r["body"]["method"] for r in server.json_requests()] == ["all"]
+
+    def test_all_uses_keyset_for_large_tables(self, stub_session, monkeypatch):
+        tables = sample_table(25)
+        tables["SampleType"] = [{"id": i, "name": str(i)} for i in range(1, 26)]
+        session, server = stub_session(tables)
+        monkeypatch.setattr(session.Sample.__class__, "KEYSET_PAGE_SIZE", 10)
+
+        assert [s.id for s in session.Sample.all()] == list(range(1, 26))
+        assert [r["body"]["method"] for r in server.json_requests()] == ["where"] * 3
+
+        server.reset()
+        assert len(session.SampleType.all()) == 25
+        assert len(session.Sample.all(opts={"limit": 5})) == 5
+        assert [r["body"]["method"] for r in server.json_requests()] == ["all"] * 2
+
+
+@pytest.mark.benchmark
+class TestKeysetBenchmark:
+    @pytest.mark.parametrize("strategy", ["offset", "keyset"])
+    def test_walk_table_benchmark(self, benchmark, stub_session, strategy):
+        session, server = stub_session(sample_table(2000))
+
+        def walk():
+            pages = session.Sample.pagination({}, page_size=100, strategy=strategy)
+            return sum(len(p) for p in pages)
+
+        assert benchmark(walk) == 2000
@@ -0,0 +1,80 @@
+import io
+import json
+
+import pytest
+
+
+def item_table(num):
+    return {
+        "Item": [
+            {"id": i, "sample_id": i % 7, "object_type_id": i % 3, "location": "A1"}
+            for i in range(1, num + 1)
+        ]
+    }
+
+
+def test_where_raw_returns_rows(stub_session):
+    session, server = stub_session(item_table(20))
+    rows = session.Item.where_raw({"object_type_id": 1})
+    assert rows == [r for r in item_table(20)["Item"] if r["object_type_id"] == 1]
+    assert all(type(r) is dict for r in rows)
+    body = server.json_requests()[0]["body"]
+    assert body["method"] == "where"
+    assert body["methods"] == ["is_part"]
+
+
+def test_where_raw_matches_where(stub_session):
+    session, server = stub_session(item_table(20))
+    rows = session.Item.where_raw({"sample_id": [1, 2]}, opts={"limit": 3})
+    items = session.Item.where({"sample_id": [1, 2]}, opts={"limit": 3})
+    assert [r["id"] for r in rows] == [i.id for i in items]
+
+
+def test_where_raw_not_found(stub_session):
+    session, server = stub_session(item_table(20))
+    assert session.Item.where_raw({"sample_id": 100}) == []
+    assert session.Item.where_raw({}, opts={"limit": 0}) == []
+    assert not server.json_requests()[1:]
+
+
+@pytest.mark.parametrize("prefetch", [None, 4], ids=["sequential", "prefetch"])
+def test_where_raw_with_page_size(stub_session, prefetch):
+    session, server = stub_session(item_table(35))
+    rows = session.Item.where_raw({}, page_size=10, prefetch=prefetch)
+    assert [r["id"] for r in rows] == list(range(1, 36))
+
+
+@pytest.mark.parametrize("strategy", ["offset", "keyset"])
+def test_iter_raw(stub_session, strategy):
+    session, server = stub_session(item_table(95))
+    rows = session.Item.iter_raw({}, page_size=10, strategy=strategy)
+    assert not server.json_requests()
+    assert [r["id"] for r in rows] == list(range(1, 96))
+
+
+def test_raw_pagination(stub_session):
+    session, server = stub_session(item_table(25))
+    pages = list(session.Item.pagination({}, page_size=10, raw=True))
+    assert [len(p) for p in pages] == [10, 10, 5]
+    assert pages[0][0] == item_table(25)["Item"][0]
+
+
+def test_write_ndjson(stub_session):
+    session, server = stub_session(item_table(25))
+    fp = io.StringIO()
+    assert session.Item.write_ndjson(fp, {}, page_size=10) == 25
+    lines = fp.getvalue().splitlines()
+    assert [json.loads(line) for line in lines] == item_table(25)["Item"]
+
+
+@pytest.mark.benchmark
+class TestRawQueryBenchmark:
+    @pytest.mark.parametrize("method", ["where", "where_raw"])
+    def test_where_200k_rows(self, benchmark, stub_session, method):
+        session, server = stub_session(item_table(200000))
+        query = getattr(session.Item, method)
+
+        def where():
+            return len(query({}, page_size=20000, prefetch=4))
+
+        assert benchmark.pedantic(where, rounds=1, iterations=1) == 200000
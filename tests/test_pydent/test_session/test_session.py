@@ -2,6 +2,7 @@ import pytest
 
 from pydent.aqhttp import AqHTTP
 from pydent.base import ModelRegistry
+from pydent.interfaces import BrowserInterface
 from pydent.interfaces import QueryInterface
 from pydent.interfaces import UtilityInterface
 from pydent.models import __all__ as all_models
@@ -71,3 +72,70 @@ def test_raises_attribute_error(fake_session):
     with pytest.raises(AttributeError):
         getattr(fake_session, "asdfasdf")
     getattr(fake_session, "Sample")
+
+
+def test_interfaces_are_created_on_access(fake_session):
+    assert "Sample" not in fake_session.__dict__
+    interface = fake_session.Sample
+    assert fake_session.Sample is interface
+    assert "Sample" in fake_session.__dict__
+
+    fake_session.using_cache = True
+    assert isinstance(fake_session.Sample, BrowserInterface)
+    assert fake_session.Sample is not interface
+
+
+def test_derived_sessions_have_own_interfaces(fake_session):
+    with fake_session.with_cache() as sess:
+        assert isinstance(sess.Sample, BrowserInterface)
+        assert sess.Sample.session is sess
+    assert isinstance(fake_session.Sample, QueryInterface)
+    assert fake_session.Sample.session is fake_session
+
+
+def test_with_statement_moves_models(fake_session):
+    with fake_session.with_cache() as sess:
+        sample = sess.Sample.load({"id": 1})
+        sess.browser.update_cache([sample])
+        assert sample.session is sess
+    assert sample.session is fake_session
+
+    # models created afterwards belong to the derived session
+    assert sess.Sample.load({"id": 2}).session is sess
+    assert fake_session.browser.model_cache["Sample"][1] is sample
+
+
+def test_swap_sessions(fake_session):
+    with fake_session.with_cache() as s1:
+        samples = s1.Sample.load([{"id": 1}, {"id": 2}])
+        with s1(using_models=True) as s2:
+            assert all(s.session is s1 for s in samples)
+            s2._swap_sessions(s1, s2)
+            assert all(s.session is s2 for s in samples)
+            assert s1.Sample.load({"id": 3}).session is s1
+        assert all(s.session is s1 for s in samples)
+    assert all(s.session is fake_session for s in samples)
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("interfaces", ["used", "all"])
+def test_with_cache_benchmark(benchmark, fake_session, interfaces):
+    """Entering 10k derived sessions of a session with 100k cached models."""
+    models = fake_session.Sample.load(
+        [{"id": i, "name": "s{}".format(i)} for i in range(1, 100001)]
+    )
+    fake_session.browser.update_cache(models)
+
+    def enter_sessions():
+        for i in range(1, 10001):
+            with fake_session.with_cache() as sess:
+                if interfaces == "all":
+                    # the interfaces created for each session before 1.0.7
+                    for model_name in all_models:
+                        getattr(sess, model_name)
+                sess.browser.update_cache([sess.Sample.load({"id": i})])
+        return sess
+
+    sess = benchmark.pedantic(enter_sessions, rounds=1, iterations=1)
+    assert fake_session.browser.model_cache["Sample"][10000].session is fake_session
+    assert len(fake_session.browser.model_cache["Sample"]) == 100000
@@ -0,0 +1,106 @@
+import json
+import os
+
+import pytest
+import requests
+
+from pydent.aqhttp import AqHTTP
+from pydent.aqhttp import AqTransport
+
+
+@pytest.fixture(scope="function")
+def server(stub_server):
+    return stub_server({"Sample": [{"id": i, "name": str(i)} for i in range(1, 11)]})
+
+
+@pytest.fixture(scope="function")
+def aqhttp(server):
+    aqhttp = AqHTTP("username", "password", server.url)
+    server.reset()
+    return aqhttp
+
+
+def sample_query(sample_id):
+    return {"model": "Sample", "id": sample_id}
+
+
+def test_transport_pool_size(server):
+    aqhttp = AqHTTP("username", "password", server.url, pool_size=3)
+    assert aqhttp.transport.pool_maxsize == 3
+    adapter = aqhttp.transport.session.get_adapter(server.url)
+    assert adapter._pool_maxsize == 3
+
+
+def test_transport_default_pool_size(aqhttp):
+    assert aqhttp.transport.pool_maxsize == AqHTTP.POOL_SIZE
+
+
+def test_requests_reuse_one_connection(server, aqhttp):
+    """Consecutive requests should be sent over a single kept-alive
+    connection."""
+    for i in range(1, 11):
+        assert aqhttp.post("json", json_data=sample_query(i))["id"] == i
+    assert len(server.json_requests()) == 10
+    assert server.num_connections == 1
+
+
+def test_requests_are_gzip_encoded(server, aqhttp):
+    assert aqhttp.post("json", json_data=sample_query(2)) == {"id": 2, "name": "2"}
+    headers = server.json_requests()[0]["headers"]
+    assert "gzip" in headers["Accept-Encoding"]
+    assert headers["Connection"] == "keep-alive"
+
+
+def test_transport_close(server, aqhttp):
+    aqhttp.post("json", json_data=sample_query(1))
+    aqhttp.transport.close()
+    aqhttp.post("json", json_data=sample_query(1))
+    assert server.num_connections == 2
+
+
+def test_copied_aqhttp_shares_transport(server, aqhttp):
+    from copy import copy
+
+    aqhttp2 = copy(aqhttp)
+    assert aqhttp2.transport is aqhttp.transport
+
+
+def test_upload_download_uses_transport(tmpdir, stub_session):
+    session, server = stub_session({"Upload": []})
+    file_url = server.url + "/files/1"
+    server.tables["Upload"].append(
+        {"id": 1, "upload_file_name": "data.json", "expiring_url": file_url}
+    )
+    server.routes["files/1"] = lambda body: {"content": "some data"}
+    upload = session.Upload.load({"id": 1, "upload_file_name": "data.json"})
+
+    filepath = upload.download(outdir=str(tmpdir))
+    assert os.path.basename(filepath) == "1_data.json"
+    with open(filepath) as f:
+        assert json.load(f) == {"content": "some data"}
+    assert json.loads(upload.data) == {"content": "some data"}
+    assert server.num_connections == 1
+
+
+@pytest.mark.benchmark
+class TestTransportBenchmark:
+    @pytest.mark.parametrize("pooled", [True, False], ids=["pooled", "per_request"])
+    def test_request_benchmark(self, benchmark, monkeypatch, server, aqhttp, pooled):
+        if not pooled:
+            # mimic the old behavior of opening a new connection per request
+            monkeypatch.setattr(aqhttp, "transport", requests)
+
+        def query():
+            for i in range(1, 11):
+                aqhttp.post("json", json_data=sample_query(i))
+
+        benchmark(query)
+        num_requests = len(server.json_requests())
+        if pooled:
+            assert server.num_connections == 1
+        else:
+            assert server.num_connections == num_requests
+
+
+def test_transport_repr():
+    assert "pool_maxsize=4" in str(AqTransport(pool_maxsize=4))
@@ -0,0 +1,128 @@
+"""Tests for the batched loading of lazy relationships of sibling models."""
+
+import pytest
+
+
+def new_tables(num_samples):
+    return {
+        "SampleType": [{"id": 1, "name": "Primer"}, {"id": 2, "name": "Plasmid"}],
+        "Sample": [
+            {"id": i, "name": "s{}".format(i), "sample_type_id": i % 2 + 1}
+            for i in range(1, num_samples + 1)
+        ],
+        # every sample but the last has two items
+        "Item": [
+            {"id": 100 * i + j, "sample_id": i, "object_type_id": 1}
+            for i in range(1, num_samples)
+            for j in range(2)
+        ],
+    }
+
+
+def query_models(server):
+    return [r["body"]["model"] for r in server.json_requests()]
+
+
+@pytest.mark.parametrize("num_samples", [2, 10, 100])
+def test_has_many_is_loaded_for_all_siblings(stub_session, num_samples):
+    session, server = stub_session(new_tables(num_samples))
+    samples = session.Sample.where({"name": ["s{}".format(i) for i in range(1, 200)]})
+    assert len(samples) == num_samples
+    server.reset()
+
+    for s in samples:
+        if s.id == num_samples:
+            assert s.items == []
+        else:
+            assert sorted(i.id for i in s.items) == [100 * s.id, 100 * s.id + 1]
+            assert all(i.sample_id == s.id for i in s.items)
+    assert query_models(server) == ["Item"]
+
+
+@pytest.mark.parametrize("num_samples", [2, 10, 100])
+def test_has_one_is_loaded_for_all_siblings(stub_session, num_samples):
+    session, server = stub_session(new_tables(num_samples))
+    samples = session.Sample.all()
+    server.reset()
+
+    for s in samples:
+        assert s.sample_type.id == s.sample_type_id
+    assert query_models(server) == ["SampleType"]
+
+
+def test_relationships_of_loaded_relationships_are_batched(stub_session):
+    session, server = stub_session(new_tables(20))
+    samples = session.Sample.all()
+    server.reset()
+
+    for s in samples:
+        for item in s.items:
+            assert item.sample is not None
+    assert query_models(server) == ["Item", "Sample"]
+
+
+def test_siblings_with_cache(stub_session):
+    session, server = stub_session(new_tables(20))
+    with session.with_cache() as sess:
+        samples = sess.Sample.all()
+        server.reset()
+        for s in samples:
+            s.items
+        assert query_models(server) == ["Item"]
+        assert len(sess.browser.get("Item")) == 38
+
+
+def test_single_model_is_not_batched(stub_session):
+    session, server = stub_session(new_tables(5))
+    samples = [session.Sample.find(i) for i in range(1, 6)]
+    assert all(s.get_siblings() == [s] for s in samples)
+    server.reset()
+
+    for s in samples:
+        s.items
+    assert query_models(server) == ["Item"] * 5
+
+
+def test_loaded_siblings_are_not_reloaded(stub_session):
+    session, server = stub_session(new_tables(5))
+    samples = session.Sample.all()
+    samples[0].items = []
+    server.reset()
+
+    samples[1].items
+    request = server.json_requests()[0]["body"]
+    assert sorted(request["arguments"]["sample_id"]) == [2, 3, 4, 5]
+    assert samples[0].items == []
+
+
+def test_uncached_fullfill_is_not_batched(stub_session):
+    session, server = stub_session(new_tables(5))
+    samples = session.Sample.all()
+    server.reset()
+
+    relation = samples[0].get_relationships()["items"]
+    items = relation.fullfill(samples[0], cache=False)
+    assert sorted(i.id for i in items) == [100, 101]
+    assert not any(s.is_deserialized("items") for s in samples)
+    request = server.json_requests()[0]["body"]
+    assert request["arguments"] == {"sample_id": 1}
+
+
+def test_siblings_reuse_the_session_browser(stub_session):
+    session, server = stub_session(new_tables(5))
+    samples = session.Sample.all()
+    samples[0].items
+    browser = session._uncached_browser
+    assert browser is not None and not browser.use_cache
+
+    samples[0].sample_type
+    assert session._uncached_browser is browser
+    assert browser.models == []
+
+
+def test_get_siblings(fake_session):
+    samples = fake_session.Sample.load([{"id": 1}, {"id": 2}, {"id": 3}])
+    for s in samples:
+        assert set(s.get_siblings()) == set(samples)
+    sample = fake_session.Sample.load({"id": 4})
+    assert sample.get_siblings() == [sample]
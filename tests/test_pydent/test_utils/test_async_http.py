@@ -0,0 +1,257 @@
+import asyncio
+import ssl
+
+import pytest
+import requests
+
+from pydent.utils.async_http import AsyncConnectionPool
+
+
+class RawServer:
+    """A local http server that records requests and lets a handler decide
+    the response to each request (or close the connection instead).
+
+    The handler returns the status and headers of the response, and
+    optionally its body. A body of None is not sent and has no
+    Content-Length.
+    """
+
+    def __init__(self, handler):
+        self.handler = handler
+        self.requests = []
+        self.server = None
+
+    async def start(self):
+        self.server = await asyncio.start_server(self._serve, "127.0.0.1", 0)
+        return self
+
+    @property
+    def url(self):
+        return "http://127.0.0.1:{}".format(self.server.sockets[0].getsockname()[1])
+
+    async def _serve(self, reader, writer):
+        num_on_connection = 0
+        while True:
+            line = await reader.readline()
+            if not line:
+                break
+            method, target, _ = line.decode("latin-1").split(" ", 2)
+            headers = {}
+            while True:
+                line = await reader.readline()
+                if line in (b"\r\n", b""):
+                    break
+                k, v = line.decode("latin-1").split(":", 1)
+                headers[k.strip().lower()] = v.strip()
+            length = int(headers.get("content-length", 0))
+            if length:
+                await reader.readexactly(length)
+            self.requests.append((method, target, headers))
+            response = self.handler(method, target, num_on_connection)
+            num_on_connection += 1
+            if response is None:
+                break
+            status, extra_headers, body = (tuple(response) + ("{}",))[:3]
+            lines = ["HTTP/1.1 {} X".format(status)]
+            if body is not None:
+                lines.append("Content-Length: {}".format(len(body)))
+            lines += ["{}: {}".format(k, v) for k, v in extra_headers.items()]
+            head = "\r\n".join(lines) + "\r\n\r\n"
+            writer.write((head + (body or "")).encode("latin-1"))
+            await writer.drain()
+        writer.close()
+
+    def close(self):
+        self.server.close()
+
+
+def run(coro):
+    return asyncio.get_event_loop().run_until_complete(coro)
+
+
+@pytest.fixture(scope="function")
+def loop():
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    yield loop
+    loop.close()
+    asyncio.set_event_loop(None)
+
+
+def test_cookie_is_not_sent_to_redirects_on_another_host(loop):
+    async def main():
+        other = await RawServer(lambda *args: (200, {})).start()
+        server = await RawServer(
+            lambda method, target, i: (
+                (302, {"Location": other.url + "/other"})
+                if target == "/start"
+                else (302, {"Location": "/start"})
+            )
+        ).start()
+        pool = AsyncConnectionPool()
+        headers = {"Cookie": "remember_token=secret", "X-Other": "1"}
+        response = await pool.request("GET", server.url + "/same", headers=headers)
+        pool.close()
+        server.close()
+        other.close()
+        return response, server.requests, other.requests
+
+    response, requests, other_requests = run(main())
+    assert response.status_code == 200
+    # a redirect on the same host keeps the cookie
+    assert [(r[1], r[2].get("cookie")) for r in requests] == [
+        ("/same", "remember_token=secret"),
+        ("/start", "remember_token=secret"),
+    ]
+    assert [(r[1], r[2].get("cookie")) for r in other_requests] == [("/other", None)]
+    assert other_requests[0][2]["x-other"] == "1"
+
+
+@pytest.mark.parametrize(
+    "method,idempotent,num_requests",
+    [("GET", None, 3), ("POST", None, 2), ("POST", True, 3)],
+)
+def test_closed_connections_are_retried_if_idempotent(
+    loop, method, idempotent, num_requests
+):
+    """The server answers the first request of each connection and closes
+    the connection on the next request."""
+
+    async def main():
+        server = await RawServer(
+            lambda method, target, i: (200, {}) if i == 0 else None
+        ).start()
+        pool = AsyncConnectionPool()
+        await pool.request(method, server.url)
+        try:
+            return await pool.request(method, server.url, idempotent=idempotent)
+        finally:
+            pool.close()
+            server.close()
+            assert len(server.requests) == num_requests
+
+    if num_requests == 3:
+        assert run(main()).status_code == 200
+    else:
+        with pytest.raises(ConnectionError):
+            run(main())
+
+
+@pytest.mark.parametrize(
+    "method,status,headers",
+    [("GET", 204, {}), ("GET", 304, {}), ("HEAD", 200, {"Content-Length": "10"})],
+)
+def test_bodiless_responses_keep_the_connection(loop, method, status, headers):
+    """Responses without a body are not read until the connection closes."""
+
+    async def main():
+        server = await RawServer(
+            lambda m, target, i: (status, headers, None) if i == 0 else (200, {})
+        ).start()
+        pool = AsyncConnectionPool()
+        try:
+            first = await pool.request(method, server.url, timeout=2)
+            second = await pool.request("GET", server.url, timeout=2)
+        finally:
+            pool.close()
+            server.close()
+        return first, second, pool.num_connections
+
+    first, second, num_connections = run(main())
+    assert (first.status_code, first.content) == (status, b"")
+    assert (second.status_code, second.content) == (200, b"{}")
+    assert num_connections == 1
+
+
+@pytest.fixture(scope="function")
+def no_proxy_env(monkeypatch):
+    for name in ["HTTP_PROXY", "HTTPS_PROXY", "NO_PROXY", "ALL_PROXY"]:
+        monkeypatch.delenv(name, raising=False)
+        monkeypatch.delenv(name.lower(), raising=False)
+    return monkeypatch
+
+
+def test_requests_are_sent_through_the_environment_proxy(loop, no_proxy_env):
+    async def main():
+        proxy = await RawServer(lambda *args: (200, {})).start()
+        server = await RawServer(lambda *args: (200, {})).start()
+        proxy_url = proxy.url.replace("http://", "http://user:secret@")
+        no_proxy_env.setenv("HTTP_PROXY", proxy_url)
+        no_proxy_env.setenv("NO_PROXY", "127.0.0.1")
+        pool = AsyncConnectionPool()
+        await pool.request("GET", "http://example.com/path?x=1", timeout=2)
+        await pool.request("GET", server.url + "/direct", timeout=2)
+        pool.close()
+        proxy.close()
+        server.close()
+        return proxy.requests, server.requests
+
+    proxy_requests, requests_ = run(main())
+    assert [r[1] for r in proxy_requests] == ["http://example.com/path?x=1"]
+    assert proxy_requests[0][2]["host"] == "example.com"
+    assert proxy_requests[0][2]["proxy-authorization"] == (
+        requests.auth._basic_auth_str("user", "secret")
+    )
+    assert [r[1] for r in requests_] == ["/direct"]
+
+
+def test_https_requests_are_tunneled_through_the_proxy(loop, no_proxy_env):
+    async def main():
+        proxy = await RawServer(lambda *args: (407, {}, None)).start()
+        no_proxy_env.setenv("HTTPS_PROXY", proxy.url)
+        pool = AsyncConnectionPool()
+        try:
+            with pytest.raises(ConnectionError):
+                await pool.request("GET", "https://example.com/path", timeout=2)
+        finally:
+            pool.close()
+            proxy.close()
+        return proxy.requests
+
+    assert [r[:2] for r in run(main())] == [("CONNECT", "example.com:443")]
+
+
+def test_ssl_settings_follow_the_session(monkeypatch, tmp_path):
+    pool = AsyncConnectionPool()
+    ca_bundle = str(tmp_path / "ca.pem")
+    with open(requests.certs.where()) as f:
+        (tmp_path / "ca.pem").write_text(f.read())
+    monkeypatch.setenv("REQUESTS_CA_BUNDLE", ca_bundle)
+    key = pool._key("https://example.com/path")
+    assert key[:3] == ("https", "example.com", 443)
+    assert key[4] == ca_bundle
+    context = pool._ssl_context(*key[4:])
+    assert context.verify_mode == ssl.CERT_REQUIRED
+    assert pool._ssl_context(*key[4:]) is context
+
+    monkeypatch.delenv("REQUESTS_CA_BUNDLE")
+    monkeypatch.delenv("CURL_CA_BUNDLE", raising=False)
+    pool.session.verify = False
+    key = pool._key("https://example.com/path")
+    assert key[4] is False
+    assert pool._ssl_context(*key[4:]).verify_mode == ssl.CERT_NONE
+
+
+def test_cookie_jar_is_sent_and_updated(loop):
+    async def main():
+        server = await RawServer(
+            lambda method, target, i: (
+                (200, {"Set-Cookie": "token=new; Path=/"}) if i == 0 else (200, {})
+            )
+        ).start()
+        session = requests.Session()
+        pool = AsyncConnectionPool(session=session)
+        cookies = {"token": "old", "other": "1"}
+        await pool.request("GET", server.url, cookies=cookies)
+        await pool.request("GET", server.url, cookies=cookies)
+        pool.close()
+        server.close()
+        return session, server.requests
+
+    session, requests_ = run(main())
+    assert session.cookies["token"] == "new"
+    # cookies of the jar take precedence, as with requests.Session
+    assert [r[2]["cookie"] for r in requests_] == [
+        "token=old; other=1",
+        "token=new; other=1",
+    ]